@@ -47,25 +47,18 @@ def boot(project_root=None):
     device_manager.config["display"]["width"] = args.width
     device_manager.config["display"]["height"] = args.height
     
-    # Register display drivers
-    from matrixos.devices.display.terminal import TerminalDisplayDriver
-    device_manager.register_display_driver("terminal", TerminalDisplayDriver)
-    
-    try:
-        from matrixos.devices.display.macos_window import MacOSWindowDriver
-        device_manager.register_display_driver("macos_window", MacOSWindowDriver)
-    except ImportError:
-        pass  # Pygame not available
+    # Register display drivers (imported only when selected; Pygame drivers
+    # are skipped automatically if Pygame isn't installed)
+    device_manager.register_display_driver(
+        "terminal", "matrixos.devices.display.terminal:TerminalDisplayDriver")
+    device_manager.register_display_driver(
+        "macos_window", "matrixos.devices.display.macos_window:MacOSWindowDriver")
     
     # Register input drivers
-    from matrixos.devices.input.terminal import TerminalInputDriver
-    device_manager.register_input_driver("terminal", TerminalInputDriver)
-    
-    try:
-        from matrixos.devices.input.pygame_input import PygameInputDriver
-        device_manager.register_input_driver("pygame", PygameInputDriver)
-    except ImportError:
-        pass  # Pygame not available
+    device_manager.register_input_driver(
+        "terminal", "matrixos.devices.input.terminal:TerminalInputDriver")
+    device_manager.register_input_driver(
+        "pygame", "matrixos.devices.input.pygame_input:PygameInputDriver")
     
     # Initialize display (auto-selects best: pygame window on Mac, or terminal fallback)
     if not device_manager.initialize_display():
@@ -6,13 +6,18 @@ All apps use the framework - no subprocess execution.
 """
 
 import json
-import importlib.util
-from pathlib import Path
+import os
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from matrixos import layout  # Import layout helpers
 from matrixos.input import InputEvent  # For key constants
-from matrixos.emoji_loader import get_emoji_loader  # For emoji icons
+from matrixos.json_utils import load_json  # Fast JSON reads with stdlib fallback
 from matrixos.logger import get_logger  # For logging
 
+# importlib.util and the emoji loader (which pulls in Pillow) are imported
+# where they are used, so booting from a warm manifest never loads them
+
 # Create logger for launcher
 logger = get_logger("Launcher")
 
@@ -29,46 +34,395 @@ COLOR_PALETTE = {
     7: (255, 0, 255),     # Magenta
 }
 
+# Color tuples shared by every icon's palette, keyed by their RGB bytes, so
+# a color used by many apps (or many times) is only allocated once
+_COLOR_TUPLES = {bytes(color): color for color in COLOR_PALETTE.values() if color}
+
+# On-disk cache of parsed app metadata/icons, relative to the apps base dir
+MANIFEST_PATH = os.path.join("settings", "cache", "launcher_manifest.json")
+MANIFEST_VERSION = 3
+
+# Files whose modification times decide whether a manifest entry is stale
+_MANIFEST_SOURCES = ("config.json", "icon.json", "icon32.json")
+
+# Apps are loaded in parallel during discovery to overlap file I/O
+DISCOVERY_WORKERS = 8
+
+# Near-black pixels (all channels below this) are anti-aliasing artifacts
+# from emoji rendering and are treated as transparent
+AA_DARK_THRESHOLD = 30
+
+# RGB565 channel expansion tables (5/6-bit -> 8-bit), built once at import.
+# The high bits are replicated into the low bits so full intensity maps to
+# 255 rather than 248/252 (whites stay white).
+_RGB565_5_TO_8 = tuple((v << 3) | (v >> 2) for v in range(32))
+_RGB565_6_TO_8 = tuple((v << 2) | (v >> 4) for v in range(64))
+
+
+def _decode_rgb565(data, size, rgb, alpha):
+    """Scatter sparse RGB565 pixels into preallocated icon buffers.
+
+    Args:
+        data: List of {x, y, c} sparse pixels
+        size: Icon edge length
+        rgb: bytearray of size*size*3, filled in place
+        alpha: bytearray of size*size, set to 1 for opaque pixels
+    """
+    lut5 = _RGB565_5_TO_8
+    lut6 = _RGB565_6_TO_8
+    for pixel in data:
+        c = pixel['c']
+        i = pixel['y'] * size + pixel['x']
+        alpha[i] = 1
+        j = i * 3
+        rgb[j] = lut5[c >> 11]
+        rgb[j + 1] = lut6[(c >> 5) & 0x3F]
+        rgb[j + 2] = lut5[c & 0x1F]
+
+
+def _trim_dark(rgb, alpha):
+    """Make near-black anti-aliasing pixels transparent, in place.
+
+    Runs once when an icon is loaded so drawing never has to re-check
+    colors. Pure black (0, 0, 0) is a deliberate color and stays opaque.
+
+    Args:
+        rgb: Packed RGB bytearray
+        alpha: Opacity mask bytearray, one byte per pixel
+    """
+    dark = AA_DARK_THRESHOLD
+    for i, opaque in enumerate(alpha):
+        if opaque:
+            j = i * 3
+            r = rgb[j]
+            g = rgb[j + 1]
+            b = rgb[j + 2]
+            if (r or g or b) and r < dark and g < dark and b < dark:
+                alpha[i] = 0
+                rgb[j] = rgb[j + 1] = rgb[j + 2] = 0
+
+
+def _pack_emoji_icon(icon_data):
+    """Pack emoji icon data from the sprite sheet into flat RGB/alpha buffers.
+
+    Args:
+        icon_data: Dict with 'width', 'height', 'data' (list of {x, y, c} sparse pixels)
+
+    Returns:
+        Tuple of (rgb, alpha, size)
+    """
+    size = icon_data['width']
+
+    # Start fully transparent, then fill in pixels from sparse data
+    rgb = bytearray(size * size * 3)
+    alpha = bytearray(size * size)
+    _decode_rgb565(icon_data['data'], size, rgb, alpha)
+    _trim_dark(rgb, alpha)
+    return bytes(rgb), bytes(alpha), size
+
+
+def _nearest_resample(rgb, alpha, native, size):
+    """Nearest-neighbour resample (up or down) of square icon buffers to size×size.
+
+    Args:
+        rgb: Packed RGB bytes of a native×native icon
+        alpha: Opacity mask of a native×native icon
+        native: Source edge length
+        size: Target edge length
+
+    Returns:
+        Tuple of (rgb, alpha) bytes for the size×size icon
+    """
+    index = [i * native // size for i in range(size)]
+    out_rgb = bytearray(size * size * 3)
+    out_alpha = bytearray(size * size)
+    i = 0
+    for sy in index:
+        row = sy * native
+        for sx in index:
+            src = row + sx
+            out_alpha[i] = alpha[src]
+            out_rgb[i * 3:i * 3 + 3] = rgb[src * 3:src * 3 + 3]
+            i += 1
+    return bytes(out_rgb), bytes(out_alpha)
+
+
+def _build_palette(rgb, alpha):
+    """Index an icon's colors into a palette of prebuilt tuples.
+
+    Args:
+        rgb: Packed RGB bytes
+        alpha: Opacity mask, one byte per pixel
+
+    Returns:
+        Tuple of (palette, indices): palette[0] is None (transparent) and
+        indices is an array('H') holding each pixel's palette index. Palette
+        colors are interned in _COLOR_TUPLES and shared between icons.
+    """
+    palette = [None]
+    lookup = {}
+    indices = array('H', [0]) * len(alpha)
+    shared = _COLOR_TUPLES
+    for i, opaque in enumerate(alpha):
+        if opaque:
+            key = rgb[i * 3:i * 3 + 3]
+            index = lookup.get(key)
+            if index is None:
+                index = lookup[key] = len(palette)
+                color = shared.get(key)
+                if color is None:
+                    # setdefault keeps one tuple if two loader threads race
+                    color = shared.setdefault(key, tuple(key))
+                palette.append(color)
+            indices[i] = index
+    return palette, indices
+
+
+def _pixel_color(pixel, icon_format):
+    """Convert one icon file pixel to an RGB color tuple.
+
+    Args:
+        pixel: Either a palette index (int), RGB list [r,g,b], or None
+        icon_format: "rgb" or "palette"
+
+    Returns:
+        RGB tuple (r,g,b) or None for transparent
+    """
+    if pixel is None:
+        return None
+
+    if icon_format == "rgb":
+        # Direct RGB format
+        if pixel == []:
+            return None
+
+        # Near-black anti-aliasing pixels are trimmed afterwards by _trim_dark
+        return tuple(pixel)
+
+    else:  # palette format
+        # Legacy palette index
+        if pixel == 0:
+            return None  # Transparent
+        return COLOR_PALETTE.get(pixel, (255, 255, 255))
+
+
+def _pack_icon(rows, icon_format):
+    """Pack icon rows into flat RGB/alpha buffers.
+
+    Palette lookup and the anti-aliasing trim happen here, once per icon,
+    so drawing only has to copy bytes.
+
+    Args:
+        rows: Square grid of pixels from an icon file
+        icon_format: "rgb" or "palette"
+
+    Returns:
+        Tuple of (rgb, alpha, size)
+    """
+    size = len(rows)
+    rgb = bytearray(size * size * 3)
+    alpha = bytearray(size * size)
+    i = 0
+    for row in rows:
+        for x in range(size):
+            color = _pixel_color(row[x] if x < len(row) else None, icon_format)
+            if color:
+                alpha[i] = 1
+                rgb[i * 3:i * 3 + 3] = bytes(color)
+            i += 1
+    if icon_format == "rgb":
+        _trim_dark(rgb, alpha)
+    return bytes(rgb), bytes(alpha), size
+
+
+def _pack_hex_icon(rows):
+    """Pack hex-color icon rows ("#RRGGBB" strings) into flat RGB/alpha buffers.
+
+    Every color is decoded by one bytes.fromhex() call over the joined
+    string instead of three int(..., 16) calls per pixel.
+
+    Args:
+        rows: Square grid of "#RRGGBB" strings (None/"null"/"" = transparent)
+
+    Returns:
+        Tuple of (rgb, alpha, size)
+
+    Raises:
+        ValueError: If a color is not a 6-digit hex value
+    """
+    size = len(rows)
+    alpha = bytearray(size * size)
+    digits = []
+    i = 0
+    for row in rows:
+        for x in range(size):
+            hex_color = row[x] if x < len(row) else None
+            if hex_color is None or hex_color == "null" or hex_color == "":
+                digits.append("000000")
+            else:
+                hex_color = hex_color.lstrip('#')[:6]
+                if len(hex_color) != 6:
+                    raise ValueError(f"Invalid hex color: {row[x]!r}")
+                digits.append(hex_color)
+                alpha[i] = 1
+            i += 1
+    rgb = bytearray(bytes.fromhex(''.join(digits)))
+    _trim_dark(rgb, alpha)
+    return bytes(rgb), bytes(alpha), size
+
 
 class App:
     """Represents a MatrixOS app."""
 
-    def __init__(self, folder_path):
+    # Fixed attribute set: smaller instances and faster attribute access
+    # when drawing the grid (see _init_defaults for what each one holds)
+    __slots__ = (
+        'folder_path', 'folder_name', 'name', 'author', 'version', 'description',
+        'emoji_icon', 'icon_rgb', 'icon_alpha', 'icon_palette', 'icon_indices',
+        'icon_native_size', '_scaled', 'always_reload', '_module', '_module_key',
+        '_emoji_job',
+    )
+
+    def __init__(self, folder_path, files=None, submit=None):
+        """Load an app from its folder.
+
+        Args:
+            folder_path: App folder
+            files: Optional set of file names in the folder (from a directory
+                   scan), used instead of probing the filesystem for each file
+            submit: Optional callable that runs a function in the background
+                    and returns its Future; emoji icons are rendered inline
+                    without one
+        """
         logger.debug(f"App.__init__ started for {folder_path}")
-        self.folder_path = Path(folder_path)
+        self._init_defaults(folder_path)
+
+        logger.debug(f"Loading config for {self.folder_name}")
+        self._load_config(files)
+        logger.debug(f"Loading icon for {self.folder_name}")
+        self._load_icon(files, submit)
+        logger.debug(f"App.__init__ completed for {self.folder_name}")
+
+    def _init_defaults(self, folder_path):
+        """Set every attribute to its default before config/icon loading."""
+        self.folder_path = os.path.normpath(folder_path)
+        self.folder_name = os.path.basename(self.folder_path)
         self.name = "Unknown"
         self.author = "Unknown"
         self.version = "1.0.0"
         self.description = ""
         self.emoji_icon = None  # Emoji character if using emoji icon
-        self.icon_pixels = None
-        self.icon_format = "palette"  # "palette", "rgb", or "hex"
+        self.icon_rgb = None  # Packed RGB bytes, row-major (None = no icon)
+        self.icon_alpha = None  # One byte per pixel, non-zero = opaque
+        self.icon_palette = None  # Color tuples, [0] = None (transparent)
+        self.icon_indices = None  # array('H') of palette indices per pixel
         self.icon_native_size = 16  # Native size of the icon (16 or 32)
+        self._scaled = {}  # Resampled (rgb, alpha), keyed by target size
+        self.always_reload = False  # Re-exec main.py on every launch (dev mode)
+        self._module = None  # Loaded main.py module, reused across launches
+        self._module_key = None  # (mtime_ns, size) of main.py when loaded
+        self._emoji_job = None  # Future for a background-rendered emoji icon
+
+    @staticmethod
+    def source_stamp(folder_path, files=None):
+        """Get modification times of the files an App is built from.
+
+        Args:
+            folder_path: App folder
+            files: Optional set of file names in the folder; absent files
+                   are not stat()ed
+
+        Returns:
+            List of st_mtime_ns values (0 for missing files)
+        """
+        stamp = []
+        for filename in _MANIFEST_SOURCES:
+            if files is not None and filename not in files:
+                stamp.append(0)
+                continue
+            try:
+                stamp.append(os.stat(os.path.join(folder_path, filename)).st_mtime_ns)
+            except OSError:
+                stamp.append(0)
+        return stamp
+
+    @classmethod
+    def from_manifest(cls, folder_path, entry):
+        """Rebuild an App from a launcher manifest entry without parsing files.
+
+        Args:
+            folder_path: App folder
+            entry: Dict produced by to_manifest()
+
+        Returns:
+            App instance
+        """
+        app = cls.__new__(cls)
+        app._init_defaults(folder_path)
+        app.name = entry["name"]
+        app.author = entry["author"]
+        app.version = entry["version"]
+        app.description = entry["description"]
+        app.always_reload = entry["reload"]
+        app.emoji_icon = entry["emoji_icon"]
+        if entry["icon_rgb"] is not None:
+            app._set_icon(bytes.fromhex(entry["icon_rgb"]),
+                          bytes.fromhex(entry["icon_alpha"]),
+                          entry["icon_native_size"])
+        return app
 
-        logger.debug(f"Loading config for {folder_path.name}")
-        self._load_config()
-        logger.debug(f"Loading icon for {folder_path.name}")
-        self._load_icon()
-        logger.debug(f"App.__init__ completed for {folder_path.name}")
+    def to_manifest(self, stamp):
+        """Serialize parsed metadata and icon for the launcher manifest.
 
-    def _load_config(self):
+        Args:
+            stamp: Result of source_stamp() for this app's folder
+
+        Returns:
+            JSON-serializable dict (icon buffers hex-encoded)
+        """
+        has_icon = self.icon_rgb is not None
+        return {
+            "stamp": stamp,
+            "name": self.name,
+            "author": self.author,
+            "version": self.version,
+            "description": self.description,
+            "reload": self.always_reload,
+            "emoji_icon": self.emoji_icon,
+            "icon_native_size": self.icon_native_size,
+            "icon_rgb": self.icon_rgb.hex() if has_icon else None,
+            "icon_alpha": self.icon_alpha.hex() if has_icon else None,
+        }
+
+    def _has_file(self, filename, files):
+        """Check whether the app folder contains filename.
+
+        Args:
+            filename: File name to look for
+            files: Set of file names from a directory scan, or None to stat
+        """
+        if files is not None:
+            return filename in files
+        return os.path.exists(os.path.join(self.folder_path, filename))
+
+    def _load_config(self, files=None):
         """Load app config from config.json."""
-        config_path = self.folder_path / "config.json"
-        if config_path.exists():
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-                self.name = config.get("name", self.folder_path.name)
-                self.author = config.get("author", "Unknown")
-                self.version = config.get("version", "1.0.0")
-                self.description = config.get("description", "")
-                
-                # Check if icon field specifies an emoji
-                icon_field = config.get("icon", "")
-                if icon_field and len(icon_field) <= 4 and not icon_field.endswith('.json'):
-                    # Looks like an emoji character (1-4 chars, not a filename)
-                    self.emoji_icon = icon_field
+        config_path = os.path.join(self.folder_path, "config.json")
+        if self._has_file("config.json", files):
+            config = load_json(config_path)
+            self.name = config.get("name", self.folder_name)
+            self.author = config.get("author", "Unknown")
+            self.version = config.get("version", "1.0.0")
+            self.description = config.get("description", "")
+            self.always_reload = bool(config.get("reload", False))
+            
+            # Check if icon field specifies an emoji
+            icon_field = config.get("icon", "")
+            if icon_field and len(icon_field) <= 4 and not icon_field.endswith('.json'):
+                # Looks like an emoji character (1-4 chars, not a filename)
+                self.emoji_icon = icon_field
 
-    def _load_icon(self):
+    def _load_icon(self, files=None, submit=None):
         """Load app icon from icon.json (or icon32.json for 32×32).
         
         Supports multiple formats:
@@ -77,112 +431,127 @@ class App:
         - Hex format: {"format": "hex", "pixels": [["#RRGGBB", ...], ...]}
         - Palette format (legacy): {"pixels": [[0-7, ...], ...]}
         """
-        logger.debug(f"_load_icon started for {self.folder_path.name}")
+        logger.debug(f"_load_icon started for {self.folder_name}")
         
         # Check if icon.json specifies an emoji
         if not self.emoji_icon:
-            icon_path = self.folder_path / "icon.json"
-            if icon_path.exists():
+            icon_path = os.path.join(self.folder_path, "icon.json")
+            if self._has_file("icon.json", files):
                 try:
-                    with open(icon_path, 'r') as f:
-                        icon_data = json.load(f)
-                        if "emoji" in icon_data:
-                            self.emoji_icon = icon_data["emoji"]
-                            logger.debug(f"Found emoji in icon.json: {self.emoji_icon}")
+                    icon_data = load_json(icon_path)
+                    if "emoji" in icon_data:
+                        self.emoji_icon = icon_data["emoji"]
+                        logger.debug(f"Found emoji in icon.json: {self.emoji_icon}")
                 except Exception as e:
                     logger.error(f"Error reading icon.json: {e}")
         
-        # Check if we should load emoji icon first
+        # File icons load right away. An emoji icon takes priority, but it is
+        # rendered on a background worker (when given one) and swapped in by
+        # poll_icon()
+        self._load_file_icon(files)
         if self.emoji_icon:
-            logger.debug(f"Loading emoji icon: {self.emoji_icon}")
-            try:
-                emoji_loader = get_emoji_loader()
-                
-                # Try to get emoji (sprite sheet first, then download if enabled)
-                logger.debug(f"Calling get_emoji_with_fallback for {self.emoji_icon}")
-                img = emoji_loader.get_emoji_with_fallback(self.emoji_icon, size=32, allow_download=True)
-                logger.debug(f"get_emoji_with_fallback returned: {img is not None}")
-                
-                if img:
-                    # Convert to icon JSON format
-                    logger.debug(f"Converting emoji to icon JSON")
-                    icon_data = emoji_loader.emoji_to_icon_json(self.emoji_icon, size=32)
-                    if icon_data:
-                        # Convert to RGB format expected by launcher
-                        logger.debug(f"Loading emoji icon data")
-                        self._load_emoji_icon_data(icon_data)
-                        logger.debug(f"Emoji icon loaded successfully")
-                        return
-                else:
-                    logger.warning(f"Emoji '{self.emoji_icon}' not available")
-                    print(f"Warning: Emoji '{self.emoji_icon}' not available (sprite sheet: no, download: disabled/failed)")
-            except Exception as e:
-                logger.error(f"Error loading emoji icon '{self.emoji_icon}': {e}")
-                print(f"Error loading emoji icon '{self.emoji_icon}': {e}")
-                import traceback
-                traceback.print_exc()
-        
-        # Try to load 32×32 icon first (for high-res displays)
-        icon32_path = self.folder_path / "icon32.json"
-        if icon32_path.exists():
-            icon_data = self._parse_icon_file(icon32_path)
-            if icon_data:
-                self.icon_pixels, self.icon_format = icon_data
-                self.icon_native_size = len(self.icon_pixels)
-                return
-        
-        # Fall back to 16×16 icon
-        icon_path = self.folder_path / "icon.json"
-        if icon_path.exists():
-            icon_data = self._parse_icon_file(icon_path)
-            if icon_data:
-                self.icon_pixels, self.icon_format = icon_data
-                self.icon_native_size = len(self.icon_pixels)
-                return
-        
-        # No icon found
-        self.icon_pixels = None
-        self.icon_format = "palette"
-        self.icon_native_size = 16
-    
-    def _load_emoji_icon_data(self, icon_data):
-        """Convert emoji icon data from sprite sheet to RGB pixel format.
-        
-        Args:
-            icon_data: Dict with 'width', 'height', 'data' (list of {x, y, c} sparse pixels)
+            if submit is not None:
+                logger.debug(f"Queueing emoji icon: {self.emoji_icon}")
+                self._emoji_job = submit(self._render_emoji_icon)
+            else:
+                result = self._render_emoji_icon()
+                if result:
+                    self._set_icon(*result)
+
+    def _load_file_icon(self, files=None):
+        """Load icon32.json (for high-res displays), else icon.json, if present."""
+        for filename in ("icon32.json", "icon.json"):
+            if self._has_file(filename, files):
+                icon_data = self._parse_icon_file(os.path.join(self.folder_path, filename))
+                if icon_data:
+                    self._set_icon(*icon_data)
+                    return
+
+    def _render_emoji_icon(self):
+        """Render the emoji icon into packed buffers (runs on the icon worker).
+
+        Only reads self.emoji_icon - the result is installed by poll_icon()
+        on the launcher's thread, so drawing never sees a half-set icon.
+
+        Returns:
+            Tuple of (rgb, alpha, size), or None if the emoji is unavailable
         """
-        size = icon_data['width']
-        
-        # Create empty RGBA array
-        pixels = [[None for _ in range(size)] for _ in range(size)]
-        
-        # Fill in pixels from sparse data
-        for pixel in icon_data['data']:
-            x = pixel['x']
-            y = pixel['y']
-            rgb565 = pixel['c']
+        logger.debug(f"Loading emoji icon: {self.emoji_icon}")
+        try:
+            from matrixos.emoji_loader import get_emoji_loader
+            emoji_loader = get_emoji_loader()
             
-            # Convert RGB565 back to RGB888
-            r = ((rgb565 >> 11) & 0x1F) << 3
-            g = ((rgb565 >> 5) & 0x3F) << 2
-            b = (rgb565 & 0x1F) << 3
+            # Try to get emoji (sprite sheet first, then download if enabled)
+            logger.debug(f"Calling get_emoji_with_fallback for {self.emoji_icon}")
+            img = emoji_loader.get_emoji_with_fallback(self.emoji_icon, size=32, allow_download=True)
+            logger.debug(f"get_emoji_with_fallback returned: {img is not None}")
             
-            pixels[y][x] = [r, g, b]
+            if img:
+                # Convert to icon JSON format
+                logger.debug(f"Converting emoji to icon JSON")
+                icon_data = emoji_loader.emoji_to_icon_json(self.emoji_icon, size=32)
+                if icon_data:
+                    # Convert to RGB format expected by launcher
+                    logger.debug(f"Emoji icon loaded successfully")
+                    return _pack_emoji_icon(icon_data)
+            else:
+                logger.warning(f"Emoji '{self.emoji_icon}' not available")
+                print(f"Warning: Emoji '{self.emoji_icon}' not available (sprite sheet: no, download: disabled/failed)")
+        except Exception as e:
+            logger.error(f"Error loading emoji icon '{self.emoji_icon}': {e}")
+            print(f"Error loading emoji icon '{self.emoji_icon}': {e}")
+            import traceback
+            traceback.print_exc()
+        return None
+
+    @property
+    def icon_pending(self):
+        """True while an emoji icon is still being rendered in the background."""
+        return self._emoji_job is not None
+
+    def poll_icon(self, wait=False):
+        """Install the background-rendered emoji icon once it is ready.
+
+        Args:
+            wait: Block until the emoji has been rendered
+
+        Returns:
+            True if the job finished (the icon may have changed), else False
+        """
+        job = self._emoji_job
+        if job is None or (not wait and not job.done()):
+            return False
+        self._emoji_job = None
+        if job.cancelled():
+            # The launcher shut its worker down before this icon was rendered
+            return True
+        result = job.result()
+        if result:
+            self._set_icon(*result)
+        return True
+    
+    def _set_icon(self, rgb, alpha, size):
+        """Install packed icon buffers and index their colors.
         
-        self.icon_pixels = pixels
-        self.icon_format = "rgb"
+        Args:
+            rgb: Packed RGB bytes, row-major
+            alpha: Opacity mask, one byte per pixel
+            size: Icon edge length
+        """
+        self.icon_rgb = rgb
+        self.icon_alpha = alpha
         self.icon_native_size = size
+        self.icon_palette, self.icon_indices = _build_palette(rgb, alpha)
+        self._scaled = {}
     
     def _parse_icon_file(self, path):
-        """Parse icon file and return (pixels, format) tuple.
+        """Parse icon file into packed RGB/alpha buffers.
         
         Returns:
-            Tuple of (pixel_data, format_string) or None if invalid
-            format_string is "rgb", "hex", or "palette"
+            Tuple of (rgb, alpha, size) or None if invalid
         """
         try:
-            with open(path, 'r') as f:
-                icon_data = json.load(f)
+            icon_data = load_json(path)
             
             pixels = icon_data.get("pixels", [])
             if not pixels:
@@ -193,35 +562,41 @@ class App:
             
             if format_type == "rgb" or (format_type == "auto" and isinstance(pixels[0][0], list)):
                 # RGB format: [[[r,g,b], [r,g,b], ...], ...]
-                return (pixels, "rgb")
+                return _pack_icon(pixels, "rgb")
             
             elif format_type == "hex" or (format_type == "auto" and isinstance(pixels[0][0], str)):
                 # Hex format: [["#RRGGBB", "#RRGGBB", ...], ...]
-                # Convert to RGB
-                rgb_pixels = []
-                for row in pixels:
-                    rgb_row = []
-                    for hex_color in row:
-                        if hex_color is None or hex_color == "null" or hex_color == "":
-                            rgb_row.append(None)
-                        else:
-                            # Parse hex color
-                            hex_color = hex_color.lstrip('#')
-                            r = int(hex_color[0:2], 16)
-                            g = int(hex_color[2:4], 16)
-                            b = int(hex_color[4:6], 16)
-                            rgb_row.append([r, g, b])
-                    rgb_pixels.append(rgb_row)
-                return (rgb_pixels, "rgb")
+                return _pack_hex_icon(pixels)
             
             else:
                 # Palette format (legacy): [[0-7, 0-7, ...], ...]
-                return (pixels, "palette")
+                return _pack_icon(pixels, "palette")
         
         except Exception as e:
             print(f"Error loading icon {path}: {e}")
             return None
 
+    def get_scaled_icon(self, size):
+        """Get the icon resampled to size×size, computing it only once.
+        
+        Args:
+            size: Target edge length in pixels
+            
+        Returns:
+            Tuple of (rgb, alpha) packed buffers, or None if there is no icon
+        """
+        if self.icon_rgb is None:
+            return None
+        if size == self.icon_native_size:
+            return self.icon_rgb, self.icon_alpha
+        
+        scaled = self._scaled.get(size)
+        if scaled is None:
+            scaled = _nearest_resample(self.icon_rgb, self.icon_alpha,
+                                       self.icon_native_size, size)
+            self._scaled[size] = scaled
+        return scaled
+
     def draw_icon(self, matrix, x, y, size=16):
         """Draw the app icon at the given position, scaled to size.
         
@@ -230,62 +605,57 @@ class App:
             x, y: Top-left position
             size: Icon size (default 16, but can be 32 for larger displays)
         """
-        if not self.icon_pixels:
+        if self.icon_rgb is None:
             # Draw default icon if no icon file
             matrix.rect(x, y, size, size, (100, 100, 100), fill=True)
             return
 
-        # Calculate scale factor
-        scale = size / self.icon_native_size
-        
-        # ALWAYS use rect rendering to avoid gridline artifacts
-        # (set_pixel seems to create gaps, rect with fill=True doesn't)
-        for row_idx, row in enumerate(self.icon_pixels):
-            for col_idx, pixel in enumerate(row):
-                color = self._get_pixel_color(pixel)
-                if color:  # Skip transparent pixels
-                    # Draw scaled pixel as a rectangle (even if scale=1)
-                    px = int(x + col_idx * scale)
-                    py = int(y + row_idx * scale)
-                    pw = max(1, int(scale))
-                    ph = max(1, int(scale))
-                    # Always use rect, never set_pixel
-                    matrix.rect(px, py, pw, ph, color, fill=True)
-    
-    def _get_pixel_color(self, pixel):
-        """Convert pixel data to RGB color tuple.
-        
-        Args:
-            pixel: Either a palette index (int), RGB list [r,g,b], or None
-            
-        Returns:
-            RGB tuple (r,g,b) or None for transparent
-        """
-        if pixel is None:
-            return None
-        
-        if self.icon_format == "rgb":
-            # Direct RGB format
-            if pixel is None or pixel == []:
-                return None
-            
-            color = tuple(pixel)
-            
-            # Filter out near-black pixels (anti-aliasing artifacts from emoji rendering)
-            # These create the gridline effect when displayed
-            if color != (0, 0, 0):  # Not pure black
-                r, g, b = color
-                # If all components are very dark, treat as transparent
-                if r < 30 and g < 30 and b < 30:
-                    return None
-            
-            return color
+        blit_rgb = getattr(matrix, 'blit_rgb', None)
+        if blit_rgb is not None:
+            # One buffer copy of the cached size×size bitmap per icon
+            rgb, alpha = self.get_scaled_icon(size)
+            blit_rgb(x, y, size, size, rgb, alpha)
+            return
+
+        # Fallback for matrices without blit_rgb: one rect per drawn pixel,
+        # with colors reused from the icon palette (no per-pixel allocation)
+        native = self.icon_native_size
+        palette = self.icon_palette
+        indices = self.icon_indices
+        rect = matrix.rect
         
-        else:  # palette format
-            # Legacy palette index
-            if pixel == 0:
-                return None  # Transparent
-            return COLOR_PALETTE.get(pixel, (255, 255, 255))
+        if size < native:
+            # Downscaling: sample nearest source pixels so each is drawn once
+            src = [i * native // size for i in range(size)]
+            for ty, sy in enumerate(src):
+                row = sy * native
+                for tx, sx in enumerate(src):
+                    color = palette[indices[row + sx]]
+                    if color is not None:
+                        rect(x + tx, y + ty, 1, 1, color, fill=True)
+            return
+
+        if size % native == 0:
+            # Integer upscale (e.g. 16 -> 32): fixed blocks, integer math only
+            ratio = size // native
+            for i, index in enumerate(indices):
+                if index:  # Skip transparent pixels
+                    row_idx, col_idx = divmod(i, native)
+                    rect(x + col_idx * ratio, y + row_idx * ratio, ratio, ratio,
+                         palette[index], fill=True)
+            return
+
+        # Fractional upscale (e.g. 32 -> 48): block edges come from one lookup
+        # table, rounded up so blocks tile without gaps and cover the same
+        # pixels as the nearest-neighbour resample used by blit_rgb
+        edges = [-(-c * size // native) for c in range(native + 1)]
+        for i, index in enumerate(indices):
+            if index:  # Skip transparent pixels
+                row_idx, col_idx = divmod(i, native)
+                px = edges[col_idx]
+                py = edges[row_idx]
+                rect(x + px, y + py, edges[col_idx + 1] - px, edges[row_idx + 1] - py,
+                     palette[index], fill=True)
 
     def launch(self, os_context):
         """Launch the app using the framework.
@@ -297,27 +667,38 @@ class App:
             True if app was launched successfully
         """
         logger.info(f"Launch requested for: {self.name}")
-        main_py = self.folder_path / "main.py"
-        if not main_py.exists():
+        main_py = os.path.join(self.folder_path, "main.py")
+        try:
+            st = os.stat(main_py)
+        except OSError:
             logger.error(f"main.py not found for {self.name}")
             return False
+        module_key = (st.st_mtime_ns, st.st_size)
+        import importlib.util
 
         print(f"\n{'='*64}")
         print(f"Launching: {self.name}")
         print(f"{'='*64}\n")
 
         try:
-            # Import app module
-            logger.debug(f"Creating module spec for {self.name}")
-            spec = importlib.util.spec_from_file_location(
-                f"app_{self.folder_path.name}",
-                main_py
-            )
-            logger.debug(f"Creating module from spec for {self.name}")
-            module = importlib.util.module_from_spec(spec)
-            logger.debug(f"Executing module for {self.name}")
-            spec.loader.exec_module(module)
-            logger.debug(f"Module executed successfully for {self.name}")
+            module = self._module
+            if module is not None and module_key == self._module_key and not self.always_reload:
+                # main.py unchanged since last launch - reuse the loaded module
+                logger.debug(f"Reusing cached module for {self.name}")
+            else:
+                # Import app module
+                logger.debug(f"Creating module spec for {self.name}")
+                spec = importlib.util.spec_from_file_location(
+                    f"app_{self.folder_name}",
+                    main_py
+                )
+                logger.debug(f"Creating module from spec for {self.name}")
+                module = importlib.util.module_from_spec(spec)
+                logger.debug(f"Executing module for {self.name}")
+                spec.loader.exec_module(module)
+                logger.debug(f"Module executed successfully for {self.name}")
+                self._module = module
+                self._module_key = module_key
 
             # Call the app's run() function
             if hasattr(module, 'run'):
@@ -348,7 +729,10 @@ class Launcher:
         self.matrix = matrix
         self.input_handler = input_handler
         self.os_context = os_context
-        self.apps_base_dir = Path(apps_base_dir) if apps_base_dir else Path(__file__).parent.parent.parent
+        if apps_base_dir:
+            self.apps_base_dir = os.fspath(apps_base_dir)
+        else:
+            self.apps_base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
         self.apps = []
         self.selected_index = 0
         self.current_page = 0  # For pagination
@@ -362,6 +746,18 @@ class Launcher:
         self.grid_height = (matrix.height - 10 + self.padding) // (self.icon_size + self.padding)  # Reserve 10px for text at bottom
         self.apps_per_page = self.grid_width * self.grid_height
 
+        # What is currently on screen, so moving the selection only
+        # repaints the outlines and the name strip (None = full redraw)
+        self._drawn_page = None
+        self._drawn_selection = None
+
+        self._manifest_path = os.path.join(self.apps_base_dir, MANIFEST_PATH)
+        self._manifest = self._load_manifest()
+        self._manifest_dirty = False
+        self._manifest_lock = threading.Lock()  # Apps are loaded from worker threads
+        self._pending_icons = []  # (folder, app, stamp) with emoji icons still rendering
+        self._icon_worker = None  # Renders emoji icons, started on first use
+        self._icon_worker_lock = threading.Lock()  # Apps are created from worker threads
         self._discover_apps()
 
     def get_help_text(self):
@@ -389,86 +785,288 @@ class Launcher:
         3. matrixos/apps/ - System apps (Settings) - listed last
         """
         logger.info("Starting app discovery")
+        candidates = []
+        candidates += self._scan_dir(os.path.join(self.apps_base_dir, "examples"))
+        candidates += self._scan_dir(os.path.join(self.apps_base_dir, "apps"))
+        candidates += self._scan_dir(os.path.join(self.apps_base_dir, "matrixos", "apps"))
+        self._seen_folders = {folder for _, folder, _ in candidates}
+
+        # Load apps concurrently; map() keeps results in discovery order
+        if len(candidates) > 1:
+            workers = min(DISCOVERY_WORKERS, len(candidates))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(self._safe_make_app, candidates))
+        else:
+            results = [self._safe_make_app(candidate) for candidate in candidates]
+        self.apps.extend(app for app in results if app is not None)
         
-        # Example apps first (examples/)
-        examples_dir = self.apps_base_dir / "examples"
-        if examples_dir.exists():
-            logger.debug(f"Scanning examples directory: {examples_dir}")
-            for folder in sorted(examples_dir.iterdir()):
-                if folder.is_dir() and self._is_valid_app(folder):
-                    logger.debug(f"Loading app from: {folder.name}")
-                    try:
-                        app = App(folder)
-                        self.apps.append(app)
-                        logger.info(f"Loaded: {app.name} ({folder.name})")
-                    except Exception as e:
-                        logger.error(f"Failed to load {folder.name}: {e}")
-        
-        # User apps second (apps/)
-        user_apps_dir = self.apps_base_dir / "apps"
-        if user_apps_dir.exists():
-            logger.debug(f"Scanning user apps directory: {user_apps_dir}")
-            for folder in sorted(user_apps_dir.iterdir()):
-                if folder.is_dir() and self._is_valid_app(folder):
-                    logger.debug(f"Loading app from: {folder.name}")
-                    try:
-                        app = App(folder)
-                        self.apps.append(app)
-                        logger.info(f"Loaded: {app.name} ({folder.name})")
-                    except Exception as e:
-                        logger.error(f"Failed to load {folder.name}: {e}")
-        
-        # System apps last (matrixos/apps/) - Settings at the end
-        system_apps_dir = self.apps_base_dir / "matrixos" / "apps"
-        if system_apps_dir.exists():
-            logger.debug(f"Scanning system apps directory: {system_apps_dir}")
-            for folder in sorted(system_apps_dir.iterdir()):
-                if folder.is_dir() and self._is_valid_app(folder):
-                    logger.debug(f"Loading app from: {folder.name}")
-                    try:
-                        app = App(folder)
-                        self.apps.append(app)
-                        logger.info(f"Loaded: {app.name} ({folder.name})")
-                    except Exception as e:
-                        logger.error(f"Failed to load {folder.name}: {e}")
-        
+        # Drop entries for apps that were removed, then persist any changes
+        stale = [folder for folder in self._manifest if folder not in self._seen_folders]
+        for folder in stale:
+            del self._manifest[folder]
+        if stale or self._manifest_dirty:
+            self._save_manifest(self._manifest)
+            self._manifest_dirty = False
+
         logger.info(f"Discovery complete: Found {len(self.apps)} apps")
 
-    def _is_valid_app(self, folder_path):
-        """Check if a folder is a valid app."""
-        main_py = folder_path / "main.py"
-        config_json = folder_path / "config.json"
-        return main_py.exists() and config_json.exists()
+    def _scan_dir(self, apps_dir):
+        """List the valid app folders in one apps directory, sorted by name.
+
+        Args:
+            apps_dir: Directory containing app folders (skipped if missing)
+
+        Returns:
+            List of (name, folder path, set of file names) tuples
+        """
+        try:
+            with os.scandir(apps_dir) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            # Missing directory - nothing to load (saves a separate isdir stat)
+            return []
+        logger.debug(f"Scanning apps directory: {apps_dir}")
+        candidates = []
+        for entry in entries:
+            files = self._list_app_files(entry)
+            if files is not None and self._is_valid_app(files):
+                candidates.append((entry.name, entry.path, files))
+        return candidates
+
+    def _safe_make_app(self, candidate):
+        """Load one discovered app, logging (not raising) failures.
+
+        Args:
+            candidate: (name, folder path, set of file names) from _scan_dir
+
+        Returns:
+            App instance, or None if it failed to load
+        """
+        name, folder, files = candidate
+        logger.debug(f"Loading app from: {name}")
+        try:
+            app = self._make_app(folder, files)
+        except Exception as e:
+            logger.error(f"Failed to load {name}: {e}")
+            return None
+        logger.info(f"Loaded: {app.name} ({name})")
+        return app
+
+    def _load_manifest(self):
+        """Load cached app entries from the launcher manifest.
+
+        Returns:
+            Dict of folder path -> manifest entry (empty if missing/outdated)
+        """
+        try:
+            manifest = load_json(self._manifest_path)
+        except (OSError, ValueError):
+            return {}
+
+        if manifest.get("version") != MANIFEST_VERSION:
+            logger.info("Launcher manifest is outdated, rebuilding")
+            return {}
+        return manifest.get("apps", {})
+
+    def _save_manifest(self, entries):
+        """Write app entries back to the launcher manifest.
+
+        Args:
+            entries: Dict of folder path -> manifest entry
+        """
+        tmp_path = self._manifest_path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self._manifest_path), exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump({"version": MANIFEST_VERSION, "apps": entries}, f, separators=(',', ':'))
+            os.replace(tmp_path, self._manifest_path)
+            logger.debug(f"Saved launcher manifest ({len(entries)} apps)")
+        except OSError as e:
+            # Caching is optional - a read-only filesystem just means slower boots
+            logger.warning(f"Could not save launcher manifest: {e}")
+
+    def _make_app(self, folder, files):
+        """Create an App, reusing the manifest entry if its files are unchanged.
+
+        Args:
+            folder: App folder path
+            files: Set of file names in the folder
+        """
+        stamp = App.source_stamp(folder, files)
+        entry = self._manifest.get(folder)
+        if entry is not None and entry.get("stamp") == stamp:
+            logger.debug(f"Using cached manifest entry for {folder}")
+            app = App.from_manifest(folder, entry)
+        else:
+            app = App(folder, files, submit=self._submit_icon_job)
+            if app.icon_pending:
+                # Cached once its emoji has been rendered (see _poll_icons)
+                with self._manifest_lock:
+                    self._pending_icons.append((folder, app, stamp))
+            else:
+                self._remember_app(folder, app, stamp)
+        return app
+
+    def _submit_icon_job(self, fn):
+        """Run fn on the icon worker, starting it if needed.
+
+        Emoji icons are rendered in the background so they never hold up the
+        first paint. One worker: Pillow images aren't safe to decode from
+        several threads at once, and downloads shouldn't flood the network.
+
+        Returns:
+            Future for fn's result
+        """
+        with self._icon_worker_lock:
+            if self._icon_worker is None:
+                self._icon_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="emoji-icons")
+            return self._icon_worker.submit(fn)
+
+    def close(self):
+        """Stop the icon worker, dropping emoji icons that haven't started."""
+        with self._icon_worker_lock:
+            worker, self._icon_worker = self._icon_worker, None
+        if worker is not None:
+            worker.shutdown(wait=False, cancel_futures=True)
+
+    def _remember_app(self, folder, app, stamp):
+        """Store a freshly loaded app in the manifest.
+
+        Args:
+            folder: App folder path (manifest key)
+            app: App built from its files
+            stamp: source_stamp() taken before the files were read
+        """
+        # Don't pin a missing emoji icon - it may become available later
+        if app.icon_rgb is not None or not app.emoji_icon:
+            entry = app.to_manifest(stamp)
+            with self._manifest_lock:
+                self._manifest[folder] = entry
+                self._manifest_dirty = True
+
+    def _poll_icons(self):
+        """Install emoji icons that finished rendering in the background.
+
+        The manifest is saved once every pending icon has finished.
+
+        Returns:
+            True if any app's icon finished (the grid needs a full redraw)
+        """
+        finished = False
+        still_pending = []
+        for pending in self._pending_icons:
+            folder, app, stamp = pending
+            app.poll_icon()
+            if app.icon_pending:
+                still_pending.append(pending)
+            else:
+                finished = True
+                self._remember_app(folder, app, stamp)
+        self._pending_icons = still_pending
+
+        if finished and not still_pending and self._manifest_dirty:
+            self._save_manifest(self._manifest)
+            self._manifest_dirty = False
+        return finished
+
+    def _list_app_files(self, entry):
+        """List a candidate app folder once.
+
+        Args:
+            entry: os.DirEntry from scanning an apps directory
+
+        Returns:
+            Set of file names, or None if the entry is not a readable folder
+        """
+        if not entry.is_dir():
+            return None
+        try:
+            return set(os.listdir(entry.path))
+        except OSError:
+            return None
+
+    def _is_valid_app(self, files):
+        """Check if a folder's file listing makes it a valid app."""
+        return "main.py" in files and "config.json" in files
 
     def draw(self):
         """Draw the launcher UI."""
+        if (self._drawn_page == self.current_page
+                and self._drawn_selection is not None
+                and self._grid_clear_of_text()):
+            self._redraw_selection(self._drawn_selection, self.selected_index)
+            return
+
+        # clear() already resets every pixel to black on all backends
         self.matrix.clear()
-        self.matrix.fill((0, 0, 0))
 
         # Calculate pagination
-        total_pages = (len(self.apps) + self.apps_per_page - 1) // self.apps_per_page
         start_idx = self.current_page * self.apps_per_page
         end_idx = min(start_idx + self.apps_per_page, len(self.apps))
         page_apps = self.apps[start_idx:end_idx]
 
         # Draw app icons in grid
         for page_idx, app in enumerate(page_apps):
-            actual_idx = start_idx + page_idx
-            
-            row = page_idx // self.grid_width
-            col = page_idx % self.grid_width
-
-            x = col * (self.icon_size + self.padding) + self.padding
-            y = row * (self.icon_size + self.padding) + self.padding
+            x, y = self._cell_origin(page_idx)
 
             # Draw selection box
-            if actual_idx == self.selected_index:
-                self.matrix.rect(x - 1, y - 1, self.icon_size + 2, self.icon_size + 2, (255, 255, 0), fill=False)
+            if start_idx + page_idx == self.selected_index:
+                self._draw_outline(x, y, (255, 255, 0))
 
             # Draw icon (passing size for scaling!)
             app.draw_icon(self.matrix, x, y, size=self.icon_size)
 
-        # Draw selected app name at bottom (using layout helper!)
+        self._draw_name_strip()
+        self.matrix.show()
+
+        self._drawn_page = self.current_page
+        self._drawn_selection = self.selected_index
+
+    def invalidate(self):
+        """Force the next draw() to repaint the whole screen."""
+        self._drawn_page = None
+        self._drawn_selection = None
+
+    def _redraw_selection(self, prev_index, new_index):
+        """Move the selection box without repainting any icons.
+
+        Args:
+            prev_index: App index that currently has the outline
+            new_index: App index that should get the outline
+        """
+        if prev_index != new_index:
+            page_start = self.current_page * self.apps_per_page
+            x, y = self._cell_origin(prev_index - page_start)
+            self._draw_outline(x, y, (0, 0, 0))
+            x, y = self._cell_origin(new_index - page_start)
+            self._draw_outline(x, y, (255, 255, 0))
+
+            # Only the name strip changes besides the outlines
+            text_y = self.matrix.height - 8
+            self.matrix.rect(0, text_y, self.matrix.width, 8, (0, 0, 0), fill=True)
+            self._draw_name_strip()
+
+        self.matrix.show()
+        self._drawn_selection = new_index
+
+    def _cell_origin(self, page_idx):
+        """Return the top-left pixel of a grid cell on the current page."""
+        row, col = divmod(page_idx, self.grid_width)
+        x = col * (self.icon_size + self.padding) + self.padding
+        y = row * (self.icon_size + self.padding) + self.padding
+        return x, y
+
+    def _draw_outline(self, x, y, color):
+        """Draw (or erase, with black) the selection box around an icon."""
+        self.matrix.rect(x - 1, y - 1, self.icon_size + 2, self.icon_size + 2, color, fill=False)
+
+    def _grid_clear_of_text(self):
+        """Check that selection boxes never overlap the name strip."""
+        grid_bottom = self.grid_height * (self.icon_size + self.padding) + 1
+        return grid_bottom <= self.matrix.height - 8
+
+    def _draw_name_strip(self):
+        """Draw the selected app name (and page indicator) at the bottom."""
         if 0 <= self.selected_index < len(self.apps):
             selected_app = self.apps[self.selected_index]
             text_y = self.matrix.height - 8
@@ -481,96 +1079,116 @@ class Launcher:
             else:
                 layout.center_text(self.matrix, selected_app.name.upper(), text_y, (255, 255, 255))
 
-        self.matrix.show()
-
     def run(self):
         """Run the launcher main loop."""
+        try:
+            self._run_loop()
+        finally:
+            self.close()
+
+    def _run_loop(self):
+        """Draw the grid and handle input until HOME is pressed."""
         running = True
         needs_redraw = True  # Initial draw
 
+        # The app list and grid don't change while the launcher runs,
+        # so bind them (and the key constants) once outside the loop
+        num_apps = len(self.apps)
+        apps_per_page = self.apps_per_page
+        grid_w = self.grid_width
+        total_pages = (num_apps + apps_per_page - 1) // apps_per_page
+        key_l1 = InputEvent.L1
+        key_r1 = InputEvent.R1
+        key_home = InputEvent.HOME
+        get_key = self.input_handler.get_key
+
         while running:
+            # Swap in emoji icons as they finish rendering (each get_key
+            # timeout is a poll tick, so placeholders upgrade within ~0.1s)
+            if self._pending_icons and self._poll_icons():
+                self.invalidate()
+                needs_redraw = True
+
             # Only draw when needed (not every frame)
             if needs_redraw:
                 self.draw()
                 needs_redraw = False
 
             # Handle input
-            event = self.input_handler.get_key(timeout=0.1)
+            event = get_key(timeout=0.1)
 
             if event:
+                key = event.key
+                selected = self.selected_index
+                current_page = self.current_page
+
                 # Calculate current page bounds
-                total_pages = (len(self.apps) + self.apps_per_page - 1) // self.apps_per_page
-                page_start = self.current_page * self.apps_per_page
-                page_end = min(page_start + self.apps_per_page, len(self.apps))
-                page_size = page_end - page_start
+                page_start = current_page * apps_per_page
+                page_end = min(page_start + apps_per_page, num_apps)
                 
                 # Get position within current page
-                page_index = self.selected_index - page_start
-                page_row = page_index // self.grid_width
-                page_col = page_index % self.grid_width
+                page_row, page_col = divmod(selected - page_start, grid_w)
                 
-                if event.key == 'UP':
+                if key == 'UP':
                     if page_row > 0:
-                        self.selected_index -= self.grid_width
+                        self.selected_index = selected - grid_w
                         needs_redraw = True
-                    elif self.current_page > 0:
+                    elif current_page > 0:
                         # At top of page, go to previous page
-                        self.current_page -= 1
+                        self.current_page = current_page - 1
                         # Select bottom row of previous page, same column
-                        prev_page_start = self.current_page * self.apps_per_page
-                        prev_page_end = min(prev_page_start + self.apps_per_page, len(self.apps))
-                        prev_page_size = prev_page_end - prev_page_start
+                        prev_page_start = page_start - apps_per_page
+                        prev_page_end = page_start
                         # Find last row on previous page
-                        last_row = (prev_page_size - 1) // self.grid_width
-                        self.selected_index = prev_page_start + (last_row * self.grid_width) + page_col
+                        last_row = (apps_per_page - 1) // grid_w
                         # Make sure we don't go past the end
-                        self.selected_index = min(self.selected_index, prev_page_end - 1)
+                        self.selected_index = min(prev_page_start + (last_row * grid_w) + page_col,
+                                                  prev_page_end - 1)
                         needs_redraw = True
 
-                elif event.key == 'DOWN':
-                    new_index = self.selected_index + self.grid_width
+                elif key == 'DOWN':
+                    new_index = selected + grid_w
                     if new_index < page_end:
                         self.selected_index = new_index
                         needs_redraw = True
-                    elif self.current_page < total_pages - 1:
+                    elif current_page < total_pages - 1:
                         # At bottom of page, go to next page
-                        self.current_page += 1
+                        self.current_page = current_page + 1
                         # Select top row of next page, same column
-                        next_page_start = self.current_page * self.apps_per_page
-                        self.selected_index = next_page_start + page_col
+                        next_page_start = page_start + apps_per_page
                         # Make sure we don't go past the end
-                        next_page_end = min(next_page_start + self.apps_per_page, len(self.apps))
-                        self.selected_index = min(self.selected_index, next_page_end - 1)
+                        next_page_end = min(next_page_start + apps_per_page, num_apps)
+                        self.selected_index = min(next_page_start + page_col, next_page_end - 1)
                         needs_redraw = True
 
-                elif event.key == 'LEFT':
+                elif key == 'LEFT':
                     if page_col > 0:
-                        self.selected_index -= 1
+                        self.selected_index = selected - 1
                         needs_redraw = True
 
-                elif event.key == 'RIGHT':
-                    if page_col < self.grid_width - 1 and self.selected_index < page_end - 1:
-                        self.selected_index += 1
+                elif key == 'RIGHT':
+                    if page_col < grid_w - 1 and selected < page_end - 1:
+                        self.selected_index = selected + 1
                         needs_redraw = True
                 
-                elif event.key == InputEvent.L1:  # Previous page
-                    if self.current_page > 0:
-                        self.current_page -= 1
-                        self.selected_index = self.current_page * self.apps_per_page
+                elif key == key_l1:  # Previous page
+                    if current_page > 0:
+                        self.current_page = current_page - 1
+                        self.selected_index = self.current_page * apps_per_page
                         needs_redraw = True
                 
-                elif event.key == InputEvent.R1:  # Next page
-                    if self.current_page < total_pages - 1:
-                        self.current_page += 1
-                        self.selected_index = self.current_page * self.apps_per_page
+                elif key == key_r1:  # Next page
+                    if current_page < total_pages - 1:
+                        self.current_page = current_page + 1
+                        self.selected_index = self.current_page * apps_per_page
                         needs_redraw = True
 
-                elif event.key == 'OK':  # Enter key maps to OK
-                    if 0 <= self.selected_index < len(self.apps):
-                        selected_app = self.apps[self.selected_index]
-                        selected_app.launch(self.os_context)
-                        # Redraw after returning from app
+                elif key == 'OK':  # Enter key maps to OK
+                    if 0 <= selected < num_apps:
+                        self.apps[selected].launch(self.os_context)
+                        # The app drew over everything - repaint in full
+                        self.invalidate()
                         needs_redraw = True
 
-                elif event.key == InputEvent.HOME:  # ESC to exit launcher
+                elif key == key_home:  # ESC to exit launcher
                     running = False
@@ -5,19 +5,78 @@ Central registry and lifecycle manager for all device drivers.
 Handles platform detection, driver selection, and device initialization.
 """
 
+import importlib
 import json
 import os
 import platform as platform_module
-from typing import Dict, List, Optional, Type
+from functools import lru_cache
+from typing import Dict, List, Optional, Type, Union
+from matrixos.json_utils import load_json
 from .base import DisplayDriver, InputDriver
 
 
+# Parsed config files by absolute path: (mtime_ns, size, config)
+_config_cache: Dict[str, tuple] = {}
+
+
+def _copy_config(value):
+    """Copy parsed JSON data (plain dicts/lists, so cheaper than deepcopy)"""
+    if isinstance(value, dict):
+        return {key: _copy_config(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_config(item) for item in value]
+    return value
+
+
+@lru_cache(maxsize=1)
+def _detect_platform() -> str:
+    """
+    Detect current platform (once per process - it can't change while running).
+    
+    Returns:
+        str: 'macos', 'linux', 'raspberry-pi', 'windows', or 'unknown'
+    """
+    system = platform_module.system().lower()
+    
+    if system == "darwin":
+        return "macos"
+    elif system == "linux":
+        # Check if Raspberry Pi
+        try:
+            with open("/proc/cpuinfo", 'r') as f:
+                if "Raspberry Pi" in f.read():
+                    return "raspberry-pi"
+        except OSError:
+            pass
+        return "linux"
+    elif system == "windows":
+        return "windows"
+    
+    return "unknown"
+
+
 class DeviceManager:
-    """Manages device drivers throughout MatrixOS lifecycle"""
+    """Manages device drivers throughout MatrixOS lifecycle
+    
+    Drivers can be registered as classes or as "package.module:ClassName"
+    paths. Paths are imported only when the driver is actually considered,
+    so optional backends (e.g. Pygame) cost nothing unless they are used.
+    """
+    
+    # Fixed attribute set: no per-instance dict and faster attribute access
+    __slots__ = (
+        'display_drivers', 'input_drivers', '_driver_classes', '_driver_errors',
+        '_display_order', '_input_index', 'active_display', 'active_inputs', 'config_path',
+        'config', 'platform',
+    )
     
     def __init__(self, config_path: str = None):
-        self.display_drivers: Dict[str, Type[DisplayDriver]] = {}
-        self.input_drivers: Dict[str, Type[InputDriver]] = {}
+        self.display_drivers: Dict[str, Union[str, Type[DisplayDriver]]] = {}
+        self.input_drivers: Dict[str, Union[str, Type[InputDriver]]] = {}
+        self._driver_classes: Dict[str, Optional[type]] = {}  # Resolved driver paths
+        self._driver_errors: Dict[str, ImportError] = {}  # Why a driver path failed to import
+        self._display_order: Optional[list] = None  # (priority, name, class), best first
+        self._input_index: Optional[dict] = None  # platform -> ranked input drivers
         self.active_display: Optional[DisplayDriver] = None
         self.active_inputs: List[InputDriver] = []
         
@@ -33,12 +92,26 @@ class DeviceManager:
         self.platform = self.auto_detect_platform()
     
     def load_config(self) -> dict:
-        """Load system configuration"""
+        """
+        Load system configuration.
+        
+        The parsed file is cached per process and only re-read when its
+        modification time or size changes. Each caller gets its own copy,
+        so changing one manager's config never leaks into another's.
+        """
         try:
-            with open(self.config_path, 'r') as f:
-                return json.load(f)
+            stat = os.stat(self.config_path)
         except FileNotFoundError:
             return self.get_default_config()
+        
+        path = os.path.abspath(self.config_path)
+        cached = _config_cache.get(path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return _copy_config(cached[2])
+        
+        config = load_json(self.config_path)
+        _config_cache[path] = (stat.st_mtime_ns, stat.st_size, config)
+        return _copy_config(config)
     
     def save_config(self):
         """Save system configuration"""
@@ -65,38 +138,57 @@ class DeviceManager:
             }
         }
     
-    def register_display_driver(self, name: str, driver_class: Type[DisplayDriver]):
-        """Register a display driver"""
+    def register_display_driver(self, name: str, driver_class: Union[str, Type[DisplayDriver]]):
+        """Register a display driver (class or "module:ClassName" path)"""
         self.display_drivers[name] = driver_class
+        self._display_order = None  # Re-rank on next selection
     
-    def register_input_driver(self, name: str, driver_class: Type[InputDriver]):
-        """Register an input driver"""
+    def register_input_driver(self, name: str, driver_class: Union[str, Type[InputDriver]]):
+        """Register an input driver (class or "module:ClassName" path)"""
         self.input_drivers[name] = driver_class
+        self._input_index = None  # Re-index on next auto-selection
+    
+    def _resolve_driver(self, driver, requested: bool = False) -> Optional[type]:
+        """
+        Get the class for a registered driver, importing it on first use.
+        
+        Args:
+            driver: Driver class, or "package.module:ClassName" path
+            requested: The driver was named in the config, so report it if
+                       it can't be imported (otherwise it is skipped silently)
+            
+        Returns:
+            Driver class, or None if its module can't be imported
+        """
+        if not isinstance(driver, str):
+            return driver
+        
+        if driver not in self._driver_classes:
+            module_name, _, class_name = driver.partition(":")
+            try:
+                module = importlib.import_module(module_name)
+                self._driver_classes[driver] = getattr(module, class_name)
+            except ImportError as e:
+                # Missing optional dependency - treat the driver as unavailable
+                self._driver_classes[driver] = None
+                self._driver_errors[driver] = e
+        
+        driver_class = self._driver_classes[driver]
+        if driver_class is None and requested:
+            print(f"[DeviceManager] Driver {driver} unavailable: {self._driver_errors[driver]}")
+        return driver_class
     
     def auto_detect_platform(self) -> str:
         """
         Detect current platform.
         
+        The result is cached for the process, so /proc/cpuinfo is read at
+        most once no matter how many managers are created.
+        
         Returns:
             str: 'macos', 'linux', 'raspberry-pi', or 'windows'
         """
-        system = platform_module.system().lower()
-        
-        if system == "darwin":
-            return "macos"
-        elif system == "linux":
-            # Check if Raspberry Pi
-            try:
-                with open("/proc/cpuinfo", 'r') as f:
-                    if "Raspberry Pi" in f.read():
-                        return "raspberry-pi"
-            except:
-                pass
-            return "linux"
-        elif system == "windows":
-            return "windows"
-        
-        return "unknown"
+        return _detect_platform()
     
     def select_best_display(self, width: int, height: int, **kwargs) -> DisplayDriver:
         """
@@ -110,31 +202,42 @@ class DeviceManager:
         Returns:
             DisplayDriver: Instantiated driver
         """
-        available = []
+        for priority, name, driver_class in self._ranked_display_drivers():
+            if driver_class.is_available():
+                print(f"[DeviceManager] Selected display driver: {name} (priority: {priority})")
+                return driver_class(width=width, height=height, **kwargs)
         
-        for name, driver_class in self.display_drivers.items():
-            if not driver_class.is_available():
-                continue
-            
-            priority = driver_class.get_priority()
-            
-            # Boost priority if driver prefers this platform
-            preferred_platform = driver_class.get_platform_preference()
-            if preferred_platform == self.platform:
-                priority += 50
-            
-            available.append((priority, name, driver_class))
-        
-        if not available:
-            raise RuntimeError("No display driver available!")
-        
-        # Sort by priority (highest first)
-        available.sort(reverse=True, key=lambda x: x[0])
+        raise RuntimeError("No display driver available!")
+    
+    def _ranked_display_drivers(self) -> list:
+        """
+        Get importable display drivers sorted by priority (highest first).
         
-        priority, name, driver_class = available[0]
-        print(f"[DeviceManager] Selected display driver: {name} (priority: {priority})")
+        Ranking needs each driver's class, so it is built on first use and
+        reused until another display driver is registered.
         
-        return driver_class(width=width, height=height, **kwargs)
+        Returns:
+            list: (priority, name, driver_class) tuples
+        """
+        if self._display_order is None:
+            ranked = []
+            for name, driver in self.display_drivers.items():
+                driver_class = self._resolve_driver(driver)
+                if driver_class is None:
+                    continue
+                
+                priority = driver_class.get_priority()
+                
+                # Boost priority if driver prefers this platform
+                if driver_class.get_platform_preference() == self.platform:
+                    priority += 50
+                
+                ranked.append((priority, name, driver_class))
+            
+            # Sort by priority (highest first; ties keep registration order)
+            ranked.sort(reverse=True, key=lambda x: x[0])
+            self._display_order = ranked
+        return self._display_order
     
     def initialize_display(self, driver_name: str = None) -> bool:
         """
@@ -159,14 +262,17 @@ class DeviceManager:
         if driver_name is None:
             driver_name = config.get("driver", "auto")
         
-        if driver_name == "auto" or driver_name not in self.display_drivers:
+        driver_class = None
+        if driver_name != "auto" and driver_name in self.display_drivers:
+            driver_class = self._resolve_driver(self.display_drivers[driver_name], requested=True)
+        
+        if driver_class is None:
             # Auto-select best driver with settings
             self.active_display = self.select_best_display(
                 width, height, scale=scale, pixel_gap=pixel_gap
             )
         else:
             # Use specified driver with settings
-            driver_class = self.display_drivers[driver_name]
             self.active_display = driver_class(
                 width=width, height=height, scale=scale, pixel_gap=pixel_gap
             )
@@ -199,7 +305,9 @@ class DeviceManager:
         for input_config in configured_inputs:
             driver_name = input_config.get("driver")
             if driver_name in self.input_drivers:
-                driver_class = self.input_drivers[driver_name]
+                driver_class = self._resolve_driver(self.input_drivers[driver_name], requested=True)
+                if driver_class is None:
+                    continue
                 driver = driver_class()
                 if driver.initialize():
                     self.active_inputs.append(driver)
@@ -214,10 +322,11 @@ class DeviceManager:
     
     def initialize_auto_input(self) -> bool:
         """Auto-detect best input driver for current display"""
-        # If Pygame display is active, try Pygame input first
-        if self.active_display and "pygame" in self.active_display.name.lower():
-            if "pygame" in self.input_drivers:
-                driver_class = self.input_drivers["pygame"]
+        # Prefer input drivers made for the active display's platform
+        # (e.g. Pygame keyboard for the Pygame window)
+        platform = self.active_display.platform if self.active_display else None
+        if platform is not None:
+            for priority, name, driver_class in self._input_drivers_for(platform):
                 if driver_class.is_available():
                     driver = driver_class()
                     if driver.initialize():
@@ -228,10 +337,34 @@ class DeviceManager:
         # Fallback to terminal
         return self.initialize_terminal_input()
     
+    def _input_drivers_for(self, platform: str) -> list:
+        """
+        Get importable input drivers that prefer a platform, highest priority first.
+        
+        The platform index is built on first use and reused until another
+        input driver is registered.
+        
+        Returns:
+            list: (priority, name, driver_class) tuples
+        """
+        if self._input_index is None:
+            index = {}
+            for name, driver in self.input_drivers.items():
+                driver_class = self._resolve_driver(driver)
+                if driver_class is None:
+                    continue
+                preference = driver_class.get_platform_preference()
+                index.setdefault(preference, []).append(
+                    (driver_class.get_priority(), name, driver_class))
+            for ranked in index.values():
+                ranked.sort(reverse=True, key=lambda x: x[0])
+            self._input_index = index
+        return self._input_index.get(platform, [])
+    
     def initialize_terminal_input(self) -> bool:
         """Fallback to terminal input"""
-        if "terminal" in self.input_drivers:
-            driver_class = self.input_drivers["terminal"]
+        driver_class = self._resolve_driver(self.input_drivers.get("terminal"))
+        if driver_class is not None:
             driver = driver_class()
             if driver.initialize():
                 self.active_inputs.append(driver)
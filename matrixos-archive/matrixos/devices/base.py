@@ -11,6 +11,10 @@ from typing import Tuple, List, Optional
 class DisplayDriver(ABC):
     """Abstract base class for all display drivers"""
     
+    # Slots for the common attributes; drivers that don't declare their
+    # own __slots__ still get an instance dict for everything else
+    __slots__ = ('width', 'height', 'color_mode', 'name', 'platform')
+    
     def __init__(self, width: int, height: int):
         self.width = width
         self.height = height
@@ -44,10 +48,59 @@ class DisplayDriver(ABC):
         pass
     
     def fill(self, color: Tuple[int, int, int] = (0, 0, 0)):
-        """Fill entire display with color (default implementation)"""
-        for y in range(self.height):
-            for x in range(self.width):
-                self.set_pixel(x, y, color)
+        """
+        Fill entire display with color (default implementation).
+        
+        Black is a clear(); any other color is written as one blit_rgb()
+        block, so drivers with a bulk blit_rgb() get a bulk fill.
+        """
+        try:
+            pixel = bytes(tuple(color))
+        except (TypeError, ValueError):
+            pixel = None
+        if pixel == b'\x00\x00\x00':
+            self.clear()
+            return
+        if pixel is None or len(pixel) != 3:
+            # Not three byte-sized channels (or not a sequence at all) -
+            # let set_pixel() coerce them
+            for y in range(self.height):
+                for x in range(self.width):
+                    self.set_pixel(x, y, color)
+            return
+        self.blit_rgb(0, 0, self.width, self.height, pixel * (self.width * self.height))
+    
+    def blit_rgb(self, x: int, y: int, width: int, height: int,
+                 rgb: bytes, alpha: Optional[bytes] = None):
+        """
+        Copy a block of packed RGB pixels (default implementation).
+        
+        Args:
+            x, y: Top-left destination position
+            width, height: Block size in pixels
+            rgb: Packed r, g, b bytes per pixel, row-major
+            alpha: Optional mask with one byte per pixel; zero bytes are skipped
+        """
+        i = 0
+        for row in range(height):
+            for col in range(width):
+                if alpha is None or alpha[i]:
+                    j = i * 3
+                    self.set_pixel(x + col, y + row, (rgb[j], rgb[j + 1], rgb[j + 2]))
+                i += 1
+    
+    def darken_rect(self, x: int, y: int, width: int, height: int):
+        """
+        Halve the brightness of every pixel in a rectangle (default implementation).
+        
+        Args:
+            x, y: Top-left corner (may be off-screen; clipped)
+            width, height: Rectangle size in pixels
+        """
+        for row in range(max(0, y), min(self.height, y + height)):
+            for col in range(max(0, x), min(self.width, x + width)):
+                r, g, b = self.get_pixel(col, row)
+                self.set_pixel(col, row, (r // 2, g // 2, b // 2))
     
     @abstractmethod
     def show(self):
@@ -93,6 +146,10 @@ class DisplayDriver(ABC):
 class InputDriver(ABC):
     """Abstract base class for all input drivers"""
     
+    # Slots for the common attributes; drivers that don't declare their
+    # own __slots__ still get an instance dict for everything else
+    __slots__ = ('name', 'device_id', 'connected')
+    
     def __init__(self):
         self.name = "Generic Input"
         self.device_id = None
@@ -175,3 +232,14 @@ class InputDriver(ABC):
             int: Priority value (0-100)
         """
         return 0
+    
+    @classmethod
+    def get_platform_preference(cls) -> Optional[str]:
+        """
+        Display platform this driver pairs with (e.g. "macos" for the
+        Pygame window). Used to auto-select input for the active display.
+        
+        Returns:
+            str: Platform name or None for no preference
+        """
+        return None
@@ -1,6 +1,9 @@
 """Display drivers for MatrixOS"""
 
 from .terminal import TerminalDisplayDriver
-from .macos_window import MacOSWindowDriver
 
-__all__ = ['TerminalDisplayDriver', 'MacOSWindowDriver']
+try:
+    from .macos_window import MacOSWindowDriver
+    __all__ = ['TerminalDisplayDriver', 'MacOSWindowDriver']
+except ImportError:
+    __all__ = ['TerminalDisplayDriver']
@@ -5,11 +5,30 @@ Uses Pygame to create a native window displaying the LED matrix.
 Pixels are scaled 2x for better visibility (256x192 -> 512x384 window).
 """
 
+import sys
 import pygame
 from typing import Tuple
 from ..base import DisplayDriver
 
 
+def _to_rgb(color) -> Tuple[int, int, int]:
+    """Coerce a non-standard color (bool, floats, out of range) to RGB bytes"""
+    if isinstance(color, bool):
+        return (255, 255, 255) if color else (0, 0, 0)
+    r, g, b = (max(0, min(255, int(c))) for c in color[:3])
+    return (r, g, b)
+
+
+# Bit positions of R, G and B inside one native-endian RGBX pixel word
+if sys.byteorder == 'little':
+    _R_SHIFT, _G_SHIFT, _B_SHIFT = 0, 8, 16
+else:
+    _R_SHIFT, _G_SHIFT, _B_SHIFT = 24, 16, 8
+
+# Transparent colour of the gap overlay (never drawn by the overlay itself)
+_MASK_KEY = (255, 0, 255)
+
+
 class MacOSWindowDriver(DisplayDriver):
     """Pygame-based window display for macOS development"""
     
@@ -22,7 +41,12 @@ class MacOSWindowDriver(DisplayDriver):
         self.window_width = width * scale
         self.window_height = height * scale
         self.screen = None
-        self.buffer = None
+        self.buffer = None  # Flat RGBX framebuffer: 4 bytes per pixel (pad unused), row-major
+        self._pixels = None  # The buffer viewed as one 32-bit word per pixel
+        self._frame = None  # width×height Surface sharing memory with self.buffer
+        self._small = None  # width×height Surface in the window's pixel format
+        self._gap_mask = None  # Gap overlay for LED matrix mode (rebuilt on resize)
+        self._shown = None  # Copy of the buffer as last drawn (None = redraw everything)
         self.current_scale = scale  # Track current scale for resizing
         self.aspect_ratio = width / height  # Store aspect ratio for proportional resizing
         
@@ -40,8 +64,15 @@ class MacOSWindowDriver(DisplayDriver):
             )
             pygame.display.set_caption("MatrixOS - ZX Spectrum Edition")
             
-            # Create pixel buffer
-            self.buffer = [[(0, 0, 0) for _ in range(self.width)] for _ in range(self.height)]
+            # Create pixel buffer (one contiguous block, no per-pixel tuples)
+            # Padded to 32 bits so a pixel is one store and blits use SDL's
+            # 32-bit paths
+            self.buffer = bytearray(self.width * self.height * 4)
+            self._pixels = memoryview(self.buffer).cast('I')
+            # Wraps the buffer without copying, so it always shows the
+            # current pixels (the buffer is only ever modified in place)
+            self._frame = pygame.image.frombuffer(self.buffer, (self.width, self.height), 'RGBX')
+            self._small = pygame.Surface((self.width, self.height)).convert(self.screen)
             
             # Clear to black
             self.clear()
@@ -55,25 +86,57 @@ class MacOSWindowDriver(DisplayDriver):
     def set_pixel(self, x: int, y: int, color: Tuple[int, int, int]):
         """Set pixel in buffer"""
         if 0 <= x < self.width and 0 <= y < self.height:
-            self.buffer[y][x] = color
+            try:
+                r, g, b = color
+                if (r | g | b) & ~0xFF:
+                    raise ValueError(color)
+                self._pixels[y * self.width + x] = (r << _R_SHIFT) | (g << _G_SHIFT) | (b << _B_SHIFT)
+            except (TypeError, ValueError):
+                i = (y * self.width + x) * 4
+                self.buffer[i:i + 3] = bytes(_to_rgb(color))
     
     def get_pixel(self, x: int, y: int) -> Tuple[int, int, int]:
         """Get pixel from buffer"""
         if 0 <= x < self.width and 0 <= y < self.height:
-            return self.buffer[y][x]
+            i = (y * self.width + x) * 4
+            return tuple(self.buffer[i:i + 3])
         return (0, 0, 0)
     
     def clear(self):
         """Clear buffer to black"""
-        for y in range(self.height):
-            for x in range(self.width):
-                self.buffer[y][x] = (0, 0, 0)
+        # Slice assignment keeps the same bytearray (same size, in place)
+        self.buffer[:] = bytes(len(self.buffer))
     
     def fill(self, color=(0, 0, 0)):
         """Fill buffer with color"""
-        for y in range(self.height):
-            for x in range(self.width):
-                self.buffer[y][x] = color
+        self.buffer[:] = (bytes(_to_rgb(color)) + b'\x00') * (self.width * self.height)
+    
+    def blit_rgb(self, x, y, width, height, rgb, alpha=None):
+        """Copy a block of packed RGB pixels straight into the buffer"""
+        col_start = max(0, -x)
+        col_end = min(width, self.width - x)
+        if col_start >= col_end:
+            return
+        
+        buffer = self.buffer
+        count = col_end - col_start
+        for row in range(max(0, -y), min(height, self.height - y)):
+            src = (row * width + col_start) * 3
+            dst = ((y + row) * self.width + x + col_start) * 4
+            if alpha is None:
+                # Opaque rows are one strided slice copy per channel
+                end = dst + count * 4
+                src_end = src + count * 3
+                buffer[dst:end:4] = rgb[src:src_end:3]
+                buffer[dst + 1:end:4] = rgb[src + 1:src_end:3]
+                buffer[dst + 2:end:4] = rgb[src + 2:src_end:3]
+                continue
+            base = row * width
+            for col in range(col_start, col_end):
+                if alpha[base + col]:
+                    buffer[dst:dst + 3] = rgb[src:src + 3]
+                src += 3
+                dst += 4
     
     def show(self):
         """
@@ -84,63 +147,145 @@ class MacOSWindowDriver(DisplayDriver):
             return
         
         # Process Pygame events to keep window responsive and handle resize
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                # Don't handle quit here - let the input system handle it
-                pass
-            elif event.type == pygame.VIDEORESIZE:
-                # Calculate best scale that fits the requested size
-                width_scale = event.w / self.width
-                height_scale = event.h / self.height
-                
-                # Use the smaller scale to maintain aspect ratio
-                # Round to nearest integer for clean pixel scaling
-                new_scale = max(1, int(min(width_scale, height_scale) + 0.5))
-                
-                print(f"[Resize] Request: {event.w}×{event.h}, scales: w={width_scale:.2f}, h={height_scale:.2f}, new_scale={new_scale}")
-                
-                # Only update if scale actually changed
-                if new_scale != self.current_scale:
-                    self.current_scale = new_scale
-                    
-                    # Force exact proportional size
-                    new_width = self.width * self.current_scale
-                    new_height = self.height * self.current_scale
-                    
-                    print(f"[Resize] Snapping to: {new_width}×{new_height}")
-                    
-                    self.screen = pygame.display.set_mode((new_width, new_height), pygame.RESIZABLE)
-        
-        # Draw pixels based on gap setting
+        # QUIT and keys stay queued for the input driver; everything else
+        # (mouse motion, key up, text input...) is drained here so the
+        # queue can't fill up and start dropping key presses
+        pending_resize = None
+        for event in pygame.event.get(exclude=(pygame.QUIT, pygame.KEYDOWN)):
+            if event.type == pygame.VIDEORESIZE:
+                # Dragging queues many resizes; only the last one matters
+                pending_resize = (event.w, event.h)
+            elif event.type == pygame.VIDEOEXPOSE:
+                # Window contents need repainting
+                self._shown = None
+        
+        if pending_resize is not None:
+            self._resize(*pending_resize)
+        
+        buffer = self.buffer
+        shown = self._shown
+        width = self.width
+        height = self.height
+        
+        # Nothing drawn since the last frame: skip it (one memcmp)
+        if shown == buffer:
+            return
+        
+        # Only redraw the band of rows that changed since the last frame
+        if shown is None:
+            first, last = 0, height
+        else:
+            band = self._dirty_rows()
+            if band is None:
+                return
+            first, last = band
+        
+        # Convert the changed rows to the window's pixel format (small), then
+        # scale them in C straight into the window (nearest-neighbour, so
+        # every LED is a solid block) and cut the gaps between LEDs if enabled
+        scale = self.current_scale
+        screen = self.screen
+        band = pygame.Rect(0, first, width, last - first)
+        small = self._small
+        small.blit(self._frame, band, band)
+        if last - first < height:
+            small = small.subsurface(band)
+        area = pygame.Rect(0, first * scale, width * scale, (last - first) * scale)
+        pygame.transform.scale(small, (width * scale, (last - first) * scale),
+                               screen.subsurface(area))
         if self.pixel_gap > 0:
-            # LED matrix mode: clear background and draw pixels with gaps
-            self.screen.fill((0, 0, 0))
-            pixel_size = max(1, self.current_scale - self.pixel_gap)
+            # LED matrix mode: cut the gaps between LEDs with one blit of a
+            # pre-rendered mask (black strips, transparent LEDs)
+            if self._gap_mask is None:
+                self._gap_mask = self._build_gap_mask()
+            screen.blit(self._gap_mask, area, area)
+        
+        if shown is None:
+            self._shown = bytearray(buffer)
+            pygame.display.flip()
+        else:
+            stride = width * 4
+            shown[first * stride:last * stride] = buffer[first * stride:last * stride]
+            pygame.display.update(area)
+    
+    def _resize(self, width: int, height: int):
+        """Snap the window to the integer scale that best fits a requested size"""
+        # Use the smaller scale to maintain aspect ratio
+        # Round half up to an integer for clean pixel scaling, using
+        # integer math only: (2n + d) // 2d == int(n / d + 0.5)
+        new_scale = max(1, min((2 * width + self.width) // (2 * self.width),
+                               (2 * height + self.height) // (2 * self.height)))
+        
+        print(f"[Resize] Request: {width}×{height}, scales: w={width / self.width:.2f}, h={height / self.height:.2f}, new_scale={new_scale}")
+        
+        # Only update if scale actually changed
+        if new_scale != self.current_scale:
+            self.current_scale = new_scale
+            self._gap_mask = None
+            self._shown = None
             
-            for y in range(self.height):
-                for x in range(self.width):
-                    color = self.buffer[y][x]
-                    # Use fill instead of draw.rect to avoid antialiasing
-                    rect = pygame.Rect(
-                        x * self.current_scale,
-                        y * self.current_scale,
-                        pixel_size,
-                        pixel_size
-                    )
-                    self.screen.fill(color, rect)
+            # Force exact proportional size
+            new_width = self.width * self.current_scale
+            new_height = self.height * self.current_scale
+            
+            print(f"[Resize] Snapping to: {new_width}×{new_height}")
+            
+            self.screen = pygame.display.set_mode((new_width, new_height), pygame.RESIZABLE)
+            # Match the (possibly new) window pixel format
+            self._small = self._small.convert(self.screen)
+    
+    def _dirty_rows(self):
+        """
+        Find the rows that differ from the last drawn frame.
+        
+        Returns:
+            (first, last) row range with last exclusive, or None if unchanged
+        """
+        buffer = self.buffer
+        shown = self._shown
+        height = self.height
+        stride = self.width * 4
+        
+        first = 0
+        while first < height:
+            start = first * stride
+            if buffer[start:start + stride] != shown[start:start + stride]:
+                break
+            first += 1
         else:
-            # Full pixel mode: no gaps, draw solid blocks without any spacing
+            return None
+        
+        last = height
+        while last > first:
+            start = last * stride - stride
+            if buffer[start:start + stride] != shown[start:start + stride]:
+                break
+            last -= 1
+        return first, last
+    
+    def _build_gap_mask(self):
+        """
+        Build the gap overlay for the current scale.
+        
+        A window-sized surface that is black in the strips between LED
+        columns and rows and colour-keyed (transparent) everywhere else.
+        """
+        scale = self.current_scale
+        pixel_size = max(1, scale - self.pixel_gap)
+        gap = scale - pixel_size
+        frame_width = self.width * scale
+        frame_height = self.height * scale
+        
+        mask = pygame.Surface((frame_width, frame_height)).convert(self.screen)
+        mask.fill(_MASK_KEY)
+        if gap > 0:
+            fill = mask.fill
+            for x in range(self.width):
+                fill((0, 0, 0), (x * scale + pixel_size, 0, gap, frame_height))
             for y in range(self.height):
-                y_pos = y * self.current_scale
-                for x in range(self.width):
-                    x_pos = x * self.current_scale
-                    color = self.buffer[y][x]
-                    
-                    # Use pygame.draw.rect instead of surface.fill for guaranteed solid blocks
-                    pygame.draw.rect(self.screen, color, 
-                                   (x_pos, y_pos, self.current_scale, self.current_scale), 0)
-        
-        pygame.display.flip()
+                fill((0, 0, 0), (0, y * scale + pixel_size, frame_width, gap))
+        mask.set_colorkey(_MASK_KEY)
+        return mask
     
     def cleanup(self):
         """Cleanup Pygame"""
@@ -5,10 +5,9 @@ Cross-platform display driver that renders to terminal using ANSI escape codes.
 Uses the existing Display and TerminalRenderer classes.
 """
 
-import sys
 from typing import Tuple
 from ..base import DisplayDriver
-from ...display import Display, TerminalRenderer
+from ...display import Display, TerminalRenderer, write_to_terminal
 
 
 class TerminalDisplayDriver(DisplayDriver):
@@ -52,6 +51,11 @@ class TerminalDisplayDriver(DisplayDriver):
         if self.display:
             self.display.fill(color)
     
+    def blit_rgb(self, x, y, width, height, rgb, alpha=None):
+        """Copy a block of packed RGB pixels"""
+        if self.display:
+            self.display.blit_rgb(x, y, width, height, rgb, alpha)
+    
     def show(self):
         """Push buffer to terminal"""
         if self.renderer:
@@ -63,8 +67,7 @@ class TerminalDisplayDriver(DisplayDriver):
     def cleanup(self):
         """Cleanup terminal state"""
         # Clear screen and reset cursor
-        print('\033[2J\033[H\033[0m', end='')
-        sys.stdout.flush()
+        write_to_terminal('\033[2J\033[H\033[0m')
     
     @classmethod
     def is_available(cls) -> bool:
@@ -44,7 +44,8 @@ class PygameInputDriver(InputDriver):
         """
         events = []
         
-        for event in pygame.event.get():
+        # Leave window events queued for the display driver
+        for event in pygame.event.get((pygame.QUIT, pygame.KEYDOWN)):
             if event.type == pygame.QUIT:
                 # Window close button pressed
                 events.append(InputEvent('HOME'))
@@ -4,6 +4,8 @@ Provides a framebuffer for LED matrix displays with terminal rendering.
 """
 
 import os
+import sys
+import time
 from typing import Tuple, Optional
 
 
@@ -31,19 +33,20 @@ class Display:
         # Initialize framebuffer
         if color_mode == 'mono':
             # Boolean array: True = on, False = off
-            self.buffer = [[False for _ in range(width)] for _ in range(height)]
+            self._off = False
         elif color_mode == 'rgb':
             # RGB tuples: (r, g, b) each 0-255
-            self.buffer = [[(0, 0, 0) for _ in range(width)] for _ in range(height)]
+            self._off = (0, 0, 0)
         else:
             raise ValueError(f"Unknown color_mode: {color_mode}")
+        self.clear()
 
     def clear(self):
         """Clear the entire display (turn all pixels off)."""
-        if self.color_mode == 'mono':
-            self.buffer = [[False for _ in range(self.width)] for _ in range(self.height)]
-        else:
-            self.buffer = [[(0, 0, 0) for _ in range(self.width)] for _ in range(self.height)]
+        # Pixel values are immutable, so every cell can share the one
+        # off value and each row is built by a single list repeat
+        off_row = [self._off] * self.width
+        self.buffer = [off_row[:] for _ in range(self.height)]
 
     def set_pixel(self, x: int, y: int, value=True):
         """
@@ -61,13 +64,105 @@ class Display:
         """Get the value of a pixel at the given coordinates."""
         if 0 <= x < self.width and 0 <= y < self.height:
             return self.buffer[y][x]
-        return False if self.color_mode == 'mono' else (0, 0, 0)
+        return self._off
+
+    def fill_rect(self, x: int, y: int, width: int, height: int, value=True):
+        """
+        Fill a rectangle with one value, a whole row span at a time.
+
+        Args:
+            x, y: Top-left corner (may be off-screen; clipped)
+            width, height: Rectangle size in pixels
+            value: For mono: True/False. For RGB: (r, g, b) tuple
+        """
+        left = max(0, x)
+        right = min(self.width, x + width)
+        if left >= right:
+            return
+
+        span = [value] * (right - left)
+        for row in range(max(0, y), min(self.height, y + height)):
+            self.buffer[row][left:right] = span
+
+    def darken_rect(self, x: int, y: int, width: int, height: int):
+        """
+        Halve the brightness of every RGB pixel in a rectangle.
+
+        Each row span is rewritten as one slice, and each distinct color
+        is halved only once.
+
+        Args:
+            x, y: Top-left corner (may be off-screen; clipped)
+            width, height: Rectangle size in pixels
+        """
+        left = max(0, x)
+        right = min(self.width, x + width)
+        if left >= right:
+            return
+
+        halves = {}
+
+        def halve(pixel):
+            try:
+                darker = halves.get(pixel)
+            except TypeError:
+                # Unhashable pixel value (e.g. a list)
+                darker = None
+            if darker is None:
+                r, g, b = pixel
+                darker = (r // 2, g // 2, b // 2)
+                if isinstance(pixel, tuple):
+                    halves[pixel] = darker
+            return darker
+
+        for row in range(max(0, y), min(self.height, y + height)):
+            line = self.buffer[row]
+            line[left:right] = [halve(pixel) for pixel in line[left:right]]
 
     def fill(self, value=True):
         """Fill the entire display with the given value."""
-        for y in range(self.height):
-            for x in range(self.width):
-                self.buffer[y][x] = value
+        row = [value] * self.width
+        for line in self.buffer:
+            line[:] = row
+
+    def blit_rgb(self, x: int, y: int, width: int, height: int,
+                 rgb: bytes, alpha: Optional[bytes] = None):
+        """
+        Copy a block of packed RGB pixels into the buffer in one call.
+
+        Args:
+            x: Left edge of the destination (may be off-screen; clipped)
+            y: Top edge of the destination (may be off-screen; clipped)
+            width: Block width in pixels
+            height: Block height in pixels
+            rgb: Packed r, g, b bytes per pixel, row-major (width*height*3 long)
+            alpha: Optional mask with one byte per pixel; zero bytes are skipped
+        """
+        col_start = max(0, -x)
+        col_end = min(width, self.width - x)
+        if col_start >= col_end:
+            return
+
+        for row in range(max(0, -y), min(height, self.height - y)):
+            line = self.buffer[y + row]
+            base = row * width
+            for col in range(col_start, col_end):
+                i = base + col
+                if alpha is None or alpha[i]:
+                    j = i * 3
+                    line[x + col] = (rgb[j], rgb[j + 1], rgb[j + 2])
+
+
+# 216-color cube lookup tables: each channel value's contribution to the
+# 256-color code, and the escape string for every code
+_CUBE_RED = {v: 16 + 36 * int(v / 255 * 5) for v in range(256)}
+_CUBE_GREEN = {v: 6 * int(v / 255 * 5) for v in range(256)}
+_CUBE_BLUE = {v: int(v / 255 * 5) for v in range(256)}
+_FG_ESCAPES = tuple(f'\033[38;5;{code}m' for code in range(256))
+_BG_ESCAPES = tuple(f'\033[48;5;{code}m' for code in range(256))
+
+# Rendered RGB cells kept between frames before the cache starts over
+_CELL_CACHE_LIMIT = 4096
 
 
 class TerminalRenderer:
@@ -81,6 +176,10 @@ class TerminalRenderer:
     # ANSI color codes
     RESET = '\033[0m'
 
+    # Seconds between full repaints while only changed rows are being
+    # redrawn, so the picture recovers if log output scrolls the terminal
+    FULL_REDRAW_INTERVAL = 1.0
+
     def __init__(self, display: Display, pixel_char: str = '█', off_char: str = ' ', ascii_mode: bool = False):
         """
         Initialize the renderer.
@@ -105,18 +204,35 @@ class TerminalRenderer:
             self.upper_half_char = '▀'
             self.lower_half_char = '▄'
 
+        # Rows drawn by the last full-screen frame, for redrawing only changes
+        self._last_frame = None
+        self._last_pixels = None
+        self._last_full_redraw = 0.0
+
+        # Terminal cell string for each RGB pixel (or top/bottom pixel pair)
+        # seen so far, for the characters they were built with; frames use
+        # few distinct colors
+        self._cells = {}
+        self._cell_chars = None
+
     @staticmethod
     def rgb_to_ansi(r: int, g: int, b: int, background: bool = False) -> str:
         """Convert RGB values to ANSI 256-color escape code."""
         # Simple conversion to 256-color palette
-        # Using the 216-color cube (16-231)
-        r_idx = int(r / 255 * 5)
-        g_idx = int(g / 255 * 5)
-        b_idx = int(b / 255 * 5)
-        color_code = 16 + 36 * r_idx + 6 * g_idx + b_idx
-
-        prefix = '48' if background else '38'
-        return f'\033[{prefix};5;{color_code}m'
+        # Using the 216-color cube (16-231), looked up from prebuilt tables
+        try:
+            color_code = _CUBE_RED[r] + _CUBE_GREEN[g] + _CUBE_BLUE[b]
+        except KeyError:
+            # Fractional or out-of-range channel values
+            r_idx = int(r / 255 * 5)
+            g_idx = int(g / 255 * 5)
+            b_idx = int(b / 255 * 5)
+            color_code = 16 + 36 * r_idx + 6 * g_idx + b_idx
+            if not 0 <= color_code < 256:
+                prefix = '48' if background else '38'
+                return f'\033[{prefix};5;{color_code}m'
+
+        return _BG_ESCAPES[color_code] if background else _FG_ESCAPES[color_code]
 
     def render(self, use_half_blocks: bool = True) -> str:
         """
@@ -129,72 +245,131 @@ class TerminalRenderer:
         Returns:
             String with ANSI escape codes for terminal display
         """
+        return '\n'.join(self.render_lines(use_half_blocks))
+
+    def render_lines(self, use_half_blocks: bool = True) -> list:
+        """
+        Render the display to one string per terminal row.
+
+        Args:
+            use_half_blocks: If True, use ▀/▄ to pack 2 vertical pixels per char.
+                           If False, use one character per pixel.
+
+        Returns:
+            List of strings with ANSI escape codes, top row first
+        """
         output = []
+        display = self.display
+        mono = display.color_mode == 'mono'
+        off_char = self.off_char
+        pixel_char = self.pixel_char
+        cells = self._cells
+        cell_chars = (pixel_char, off_char, self.upper_half_char, self.lower_half_char)
+        if cell_chars != self._cell_chars or len(cells) > _CELL_CACHE_LIMIT:
+            cells.clear()
+            self._cell_chars = cell_chars
 
         if not use_half_blocks:
             # Simple mode: one character per pixel
-            for y in range(self.display.height):
+            for row in display.buffer:
+                if mono:
+                    output.append(''.join([pixel_char if pixel else off_char for pixel in row]))
+                    continue
+
+                # One escape per run of same-colored pixels; single pixels
+                # (the common case in busy images) come from the cache
                 line = []
-                for x in range(self.display.width):
-                    pixel = self.display.buffer[y][x]
-
-                    if self.display.color_mode == 'mono':
-                        line.append(self.pixel_char if pixel else self.off_char)
-                    else:  # RGB
-                        r, g, b = pixel
-                        if r == 0 and g == 0 and b == 0:
-                            line.append(self.off_char)
+                run_pixel = None
+                run_length = 0
+                for pixel in row + [None]:
+                    if pixel == run_pixel:
+                        run_length += 1
+                        continue
+                    if run_length > 1:
+                        line.append(self._pixel_run(run_pixel, run_length))
+                    elif run_length:
+                        try:
+                            cell = cells.get(run_pixel)
+                        except TypeError:
+                            # Unhashable pixel value (e.g. a list)
+                            cell = self._pixel_run(run_pixel, 1)
                         else:
-                            color = self.rgb_to_ansi(r, g, b)
-                            line.append(f'{color}{self.pixel_char}{self.RESET}')
-
+                            if cell is None:
+                                cell = cells[run_pixel] = self._pixel_run(run_pixel, 1)
+                        line.append(cell)
+                    run_pixel = pixel
+                    run_length = 1
                 output.append(''.join(line))
         else:
             # Half-block mode: pack 2 vertical pixels per character
-            # Process pairs of rows
-            for y in range(0, self.display.height, 2):
+            # Walk pairs of rows together (an odd last row pairs with blanks)
+            buffer = display.buffer
+            height = display.height
+            blank_row = [False if mono else (0, 0, 0)] * display.width
+            upper_char = self.upper_half_char
+            lower_char = self.lower_half_char
+
+            for y in range(0, height, 2):
+                top_row = buffer[y]
+                bottom_row = buffer[y + 1] if y + 1 < height else blank_row
+
+                if mono:
+                    if not (any(top_row) or any(bottom_row)):
+                        # Nothing lit in either row
+                        output.append(off_char * len(top_row))
+                        continue
+                    # Full block, upper half, lower half or empty
+                    output.append(''.join([
+                        (pixel_char if bottom_pixel else upper_char) if top_pixel
+                        else (lower_char if bottom_pixel else off_char)
+                        for top_pixel, bottom_pixel in zip(top_row, bottom_row)
+                    ]))
+                    continue
+
                 line = []
-                for x in range(self.display.width):
-                    top_pixel = self.display.buffer[y][x]
-                    bottom_pixel = self.display.buffer[y + 1][x] if y + 1 < self.display.height else (False if self.display.color_mode == 'mono' else (0, 0, 0))
-
-                    if self.display.color_mode == 'mono':
-                        # Determine which character to use
-                        if top_pixel and bottom_pixel:
-                            line.append(self.pixel_char)  # Full block
-                        elif top_pixel and not bottom_pixel:
-                            line.append(self.upper_half_char)  # Upper half
-                        elif not top_pixel and bottom_pixel:
-                            line.append(self.lower_half_char)  # Lower half
-                        else:
-                            line.append(self.off_char)  # Empty
-                    else:  # RGB mode
-                        r1, g1, b1 = top_pixel
-                        r2, g2, b2 = bottom_pixel
-
-                        top_on = not (r1 == 0 and g1 == 0 and b1 == 0)
-                        bottom_on = not (r2 == 0 and g2 == 0 and b2 == 0)
-
-                        if top_on and bottom_on:
-                            # Both on - use foreground color for top, background for bottom
-                            fg = self.rgb_to_ansi(r1, g1, b1, False)
-                            bg = self.rgb_to_ansi(r2, g2, b2, True)
-                            line.append(f'{fg}{bg}{self.upper_half_char}{self.RESET}')
-                        elif top_on:
-                            # Only top on
-                            fg = self.rgb_to_ansi(r1, g1, b1, False)
-                            line.append(f'{fg}{self.upper_half_char}{self.RESET}')
-                        elif bottom_on:
-                            # Only bottom on
-                            fg = self.rgb_to_ansi(r2, g2, b2, False)
-                            line.append(f'{fg}{self.lower_half_char}{self.RESET}')
-                        else:
-                            # Both off
-                            line.append(self.off_char)
+                for pair in zip(top_row, bottom_row):
+                    try:
+                        cell = cells.get(pair)
+                    except TypeError:
+                        # Unhashable pixel value (e.g. a list)
+                        line.append(self._pair_cell(*pair))
+                        continue
+                    if cell is None:
+                        cell = cells[pair] = self._pair_cell(*pair)
+                    line.append(cell)
 
                 output.append(''.join(line))
 
-        return '\n'.join(output)
+        return output
+
+    def _pixel_run(self, pixel, count: int) -> str:
+        """Terminal cells for a run of identical RGB pixels (one-character-per-pixel mode)."""
+        r, g, b = pixel
+        if r == 0 and g == 0 and b == 0:
+            return self.off_char * count
+        return f'{self.rgb_to_ansi(r, g, b)}{self.pixel_char * count}{self.RESET}'
+
+    def _pair_cell(self, top, bottom) -> str:
+        """Terminal cell for a vertical pair of RGB pixels (half-block mode)."""
+        r1, g1, b1 = top
+        r2, g2, b2 = bottom
+        top_on = not (r1 == 0 and g1 == 0 and b1 == 0)
+        bottom_on = not (r2 == 0 and g2 == 0 and b2 == 0)
+
+        if top_on and bottom_on:
+            # Both on - use foreground color for top, background for bottom
+            fg = self.rgb_to_ansi(r1, g1, b1, False)
+            bg = self.rgb_to_ansi(r2, g2, b2, True)
+            return f'{fg}{bg}{self.upper_half_char}{self.RESET}'
+        elif top_on:
+            # Only top on
+            return f'{self.rgb_to_ansi(r1, g1, b1, False)}{self.upper_half_char}{self.RESET}'
+        elif bottom_on:
+            # Only bottom on
+            return f'{self.rgb_to_ansi(r2, g2, b2, False)}{self.lower_half_char}{self.RESET}'
+        else:
+            # Both off
+            return self.off_char
 
     def display_in_terminal(self, use_half_blocks: bool = True, clear_screen: bool = True):
         """
@@ -202,15 +377,49 @@ class TerminalRenderer:
 
         Args:
             use_half_blocks: Use half-block characters for compact display
-            clear_screen: Clear terminal before rendering
+            clear_screen: Clear terminal before rendering (between periodic
+                          full repaints only rows that changed are redrawn)
         """
+        now = time.monotonic()
+        buffer = self.display.buffer
+
+        # Nothing drawn since the last frame: skip rendering it at all
+        if (clear_screen and self._last_frame is not None
+                and self._last_frame[0] == use_half_blocks
+                and now - self._last_full_redraw < self.FULL_REDRAW_INTERVAL
+                and buffer == self._last_pixels):
+            return
+        self._last_pixels = [row[:] for row in buffer] if clear_screen else None
+
+        lines = self.render_lines(use_half_blocks)
+
+        if clear_screen:
+            previous = self._last_frame
+            self._last_frame = (use_half_blocks, lines)
+            if (previous is not None and previous[0] == use_half_blocks
+                    and len(previous[1]) == len(lines)
+                    and now - self._last_full_redraw < self.FULL_REDRAW_INTERVAL):
+                # Only rewrite rows that changed, then put the cursor back
+                # where log output left it
+                changed = [f'\033[{row};1H{line}'
+                           for row, (line, old) in enumerate(zip(lines, previous[1]), 1)
+                           if line != old]
+                if changed:
+                    write_to_terminal('\0337' + ''.join(changed) + '\0338')
+                return
+            self._last_full_redraw = now
+        else:
+            self._last_frame = None
+
+        # Build the whole frame first and write it in one go
+        parts = []
+
         if clear_screen:
             # Clear terminal and move cursor to home
-            print('\033[2J\033[H', end='')
+            parts.append('\033[2J\033[H')
 
         # Render the matrix
-        matrix_output = self.render(use_half_blocks)
-        print(matrix_output)
+        parts.append('\n'.join(lines))
 
         # Calculate number of rows used by matrix
         # Half-block mode uses height/2 rows, full mode uses height rows
@@ -218,7 +427,28 @@ class TerminalRenderer:
 
         # Position cursor below matrix for log output (leave 1 blank line)
         # This ensures any print() statements appear below the matrix
-        print(f'\033[{rows_used + 2};1H', end='')
+        parts.append(f'\n\033[{rows_used + 2};1H')
 
         # Add a separator line
-        print('─' * min(self.display.width, 80))
+        parts.append('─' * min(self.display.width, 80) + '\n')
+
+        write_to_terminal(''.join(parts))
+
+
+def write_to_terminal(text: str):
+    """
+    Write text to stdout with a single write and flush.
+
+    Goes straight to the binary buffer when there is one, after flushing
+    any pending print() output so ordering is kept.
+    """
+    stdout = sys.stdout
+    stream = getattr(stdout, 'buffer', None)
+    if stream is None:
+        stdout.write(text)
+        stdout.flush()
+        return
+
+    stdout.flush()
+    stream.write(text.encode(stdout.encoding or 'utf-8', stdout.errors or 'strict'))
+    stream.flush()
@@ -8,8 +8,11 @@ or simple text fallbacks.
 """
 
 import os
-import json
 import hashlib
+from collections import OrderedDict
+from functools import lru_cache
+
+from matrixos.json_utils import load_json, dump_json
 
 
 # Common emojis to bundle (will be pre-generated)
@@ -26,7 +29,24 @@ BUNDLED_EMOJIS = [
     "1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "▶️", "⏸️", "⏹️", "🔄",
 ]
 
+# Parsed icon files, keyed by (emoji, size), least recently used first
+_PIXELS_CACHE = OrderedDict()
+_PIXELS_CACHE_SIZE = 256
+
+# Icon file paths that were found, keyed by (emoji, size), least recently
+# used first. Misses aren't kept, so an icon written later is picked up
+_PATH_CACHE = OrderedDict()
+_PATH_CACHE_SIZE = 1024
+
+# Emoji font per render size (None = no emoji font found)
+_FONT_CACHE = {}
+
+# Bundled icon directory and its file names (listed once, on first lookup)
+_BUNDLED_DIR = os.path.join(os.path.dirname(__file__), "emoji_icons")
+_bundled_files = None
+
 
+@lru_cache(maxsize=512)
 def emoji_to_codepoint_hex(emoji):
     """Convert emoji to hex codepoint string for filenames.
     
@@ -36,56 +56,113 @@ def emoji_to_codepoint_hex(emoji):
     Returns:
         Hex string (e.g., "1f579-fe0f")
     """
-    codepoints = [f"{ord(c):x}" for c in emoji]
-    return "-".join(codepoints)
+    return "-".join(["%x" % ord(c) for c in emoji])
+
+
+def _get_bundled_files():
+    """Names of the bundled icon files, from one directory listing."""
+    global _bundled_files
+    if _bundled_files is None:
+        try:
+            _bundled_files = frozenset(os.listdir(_BUNDLED_DIR))
+        except OSError:
+            _bundled_files = frozenset()
+    return _bundled_files
+
+
+# Bundled icon path for every (emoji, size) in BUNDLED_EMOJIS, built once
+_BUNDLED_PATHS = {
+    (emoji, size): os.path.join(_BUNDLED_DIR, f"{emoji_to_codepoint_hex(emoji)}_{size}.json")
+    for emoji in BUNDLED_EMOJIS
+    for size in (16, 32)
+}
 
 
 def get_emoji_icon_path(emoji, size=32):
     """Get path to bundled or cached emoji icon.
     
+    Found paths are cached; misses are looked up again on every call.
+    
     Args:
         emoji: Emoji character
         size: Icon size (16 or 32)
     
     Returns:
-        Path to icon JSON file, or None if not found
+        Path to icon file (.json, or packed .rgb in the user cache),
+        or None if not found
     """
+    key = (emoji, size)
+    path = _PATH_CACHE.get(key)
+    if path is not None:
+        _PATH_CACHE.move_to_end(key)
+        return path
+    
+    path = _find_emoji_icon_path(emoji, size)
+    if path is not None:
+        _PATH_CACHE[key] = path
+        if len(_PATH_CACHE) > _PATH_CACHE_SIZE:
+            _PATH_CACHE.popitem(last=False)
+    return path
+
+
+def _find_emoji_icon_path(emoji, size):
+    """Look up an icon file on disk (see get_emoji_icon_path())."""
+    # Known bundled emojis need no filename formatting
+    bundled = _BUNDLED_PATHS.get((emoji, size))
+    if bundled is not None and os.path.basename(bundled) in _get_bundled_files():
+        return bundled
+    
     codepoint = emoji_to_codepoint_hex(emoji)
     
     # Check bundled emojis first
-    bundled = os.path.join(
-        os.path.dirname(__file__),
-        f"emoji_icons/{codepoint}_{size}.json"
-    )
-    if os.path.exists(bundled):
-        return bundled
+    filename = f"{codepoint}_{size}.json"
+    if filename in _get_bundled_files():
+        return os.path.join(_BUNDLED_DIR, filename)
     
-    # Check user cache
+    # Check user cache (packed icons first, then older JSON ones)
     cache_dir = os.path.expanduser("~/.matrixos/emoji_cache")
-    cached = os.path.join(cache_dir, f"{codepoint}_{size}.json")
-    if os.path.exists(cached):
-        return cached
+    for cached in (os.path.join(cache_dir, f"{codepoint}_{size}.rgb"),
+                   os.path.join(cache_dir, filename)):
+        if os.path.exists(cached):
+            return cached
     
     return None
 
 
-def render_emoji_icon(emoji, size=32):
-    """Render emoji to icon pixel array.
-    
-    This requires PIL and an emoji font to be installed.
-    Used for development or first-time generation.
-    
-    Args:
-        emoji: Emoji character
-        size: Icon size (16 or 32)
+def _forget_emoji_icon(emoji, size):
+    """Drop cached lookups for an icon whose file was just written."""
+    global _bundled_files
+    _bundled_files = None
+    _PATH_CACHE.pop((emoji, size), None)
+    _PIXELS_CACHE.pop((emoji, size), None)
+
+
+def _load_icon_pixels(path, size):
+    """Read icon pixels from a JSON or packed .rgb icon file.
     
-    Returns:
-        2D array of RGB pixel values, or None if can't render
+    Packed files hold size × size r, g, b bytes, row-major, with no header.
     """
-    try:
-        from PIL import Image, ImageDraw, ImageFont
-    except ImportError:
-        return None
+    if not path.endswith('.rgb'):
+        return load_json(path)['pixels']
+    
+    with open(path, 'rb') as f:
+        data = f.read()
+    stride = size * 3
+    if len(data) != size * stride:
+        raise ValueError(f"Packed icon {path} is not {size}×{size}")
+    pixels = []
+    for start in range(0, len(data), stride):
+        row = data[start:start + stride]
+        pixels.append([[r, g, b] for r, g, b in zip(row[0::3], row[1::3], row[2::3])])
+    return pixels
+
+
+def _find_emoji_font(size):
+    """Load the first available emoji font for a render size (cached)."""
+    if size in _FONT_CACHE:
+        return _FONT_CACHE[size]
+    
+    from PIL import ImageFont
     
     # Find emoji font
     font_paths = [
@@ -103,6 +180,29 @@ def render_emoji_icon(emoji, size=32):
             except:
                 continue
     
+    _FONT_CACHE[size] = font
+    return font
+
+
+def render_emoji_icon(emoji, size=32):
+    """Render emoji to icon pixel array.
+    
+    This requires PIL and an emoji font to be installed.
+    Used for development or first-time generation.
+    
+    Args:
+        emoji: Emoji character
+        size: Icon size (16 or 32)
+    
+    Returns:
+        2D array of RGB pixel values, or None if can't render
+    """
+    try:
+        from PIL import Image, ImageChops, ImageDraw
+    except ImportError:
+        return None
+    
+    font = _find_emoji_font(size)
     if not font:
         return None
     
@@ -140,21 +240,21 @@ def render_emoji_icon(emoji, size=32):
     # Apply threshold to eliminate near-black anti-aliasing artifacts
     # Any pixel darker than this threshold becomes pure black (transparent in icon)
     threshold = 30  # Adjust this value: lower = more aggressive filtering
-    pixels_data = rgb_img.load()
-    for py in range(size):
-        for px in range(size):
-            r, g, b = pixels_data[px, py]
-            # If pixel is very dark (likely anti-aliasing artifact), make it pure black
-            if r < threshold and g < threshold and b < threshold:
-                pixels_data[px, py] = (0, 0, 0)
-    
-    # Convert to pixel array
+    
+    # Done in PIL's C code: a 255/0 mask per band, combined with a minimum
+    # so only pixels dark in all three bands are blacked out
+    dark = [255] * threshold + [0] * (256 - threshold)
+    r_mask, g_mask, b_mask = (band.point(dark) for band in rgb_img.split())
+    mask = ImageChops.darker(ImageChops.darker(r_mask, g_mask), b_mask)
+    rgb_img.paste((0, 0, 0), mask=mask)
+    
+    # Convert to pixel array in one pass over the raw bytes
+    data = rgb_img.tobytes()
+    stride = size * 3
     pixels = []
-    for y in range(size):
-        row = []
-        for x in range(size):
-            row.append(list(rgb_img.getpixel((x, y))))
-        pixels.append(row)
+    for start in range(0, size * stride, stride):
+        row = data[start:start + stride]
+        pixels.append([[r, g, b] for r, g, b in zip(row[0::3], row[1::3], row[2::3])])
     
     return pixels
 
@@ -165,7 +265,8 @@ def generate_emoji_icon(emoji, size=32, output_path=None):
     Args:
         emoji: Emoji character
         size: Icon size (16 or 32)
-        output_path: Where to save (default: user cache)
+        output_path: Where to save (default: packed .rgb in the user cache;
+                     paths ending in .rgb are packed, anything else is JSON)
     
     Returns:
         Path to saved icon, or None on failure
@@ -178,17 +279,24 @@ def generate_emoji_icon(emoji, size=32, output_path=None):
         cache_dir = os.path.expanduser("~/.matrixos/emoji_cache")
         os.makedirs(cache_dir, exist_ok=True)
         codepoint = emoji_to_codepoint_hex(emoji)
-        output_path = os.path.join(cache_dir, f"{codepoint}_{size}.json")
+        output_path = os.path.join(cache_dir, f"{codepoint}_{size}.rgb")
     
-    icon_data = {
-        "format": "rgb",
-        "emoji": emoji,
-        "codepoint": emoji_to_codepoint_hex(emoji),
-        "pixels": pixels
-    }
+    if output_path.endswith('.rgb'):
+        # Packed: raw bytes, no parsing needed to load them back
+        with open(output_path, 'wb') as f:
+            f.write(bytes([value for row in pixels for pixel in row for value in pixel]))
+    else:
+        icon_data = {
+            "format": "rgb",
+            "emoji": emoji,
+            "codepoint": emoji_to_codepoint_hex(emoji),
+            "pixels": pixels
+        }
+        
+        dump_json(output_path, icon_data)
     
-    with open(output_path, 'w') as f:
-        json.dump(icon_data, f)
+    # The cached path and pixels (or the bundled listing) may now be stale
+    _forget_emoji_icon(emoji, size)
     
     return output_path
 
@@ -224,20 +332,22 @@ def render_text_fallback(text, size=32):
     
     # Scale up to fill icon
     scale = size // 7
-    pixels = []
     
+    # Map each icon column to a pattern column once, then work out which
+    # columns are lit for each pattern row (icon rows repeat `scale` times)
+    offset = (size // scale - 5) // 2
+    columns = [x // scale - offset for x in range(size)]
+    blank = [False] * size
+    lit_rows = [
+        [0 <= px < len(row) and bool(row[px]) for px in columns]
+        for row in pattern
+    ]
+    
+    pixels = []
     for y in range(size):
-        row = []
-        for x in range(size):
-            # Map to pattern coordinates
-            py = y // scale
-            px = x // scale - (size // scale - 5) // 2
-            
-            if 0 <= py < len(pattern) and 0 <= px < len(pattern[0]) and pattern[py][px]:
-                row.append([200, 200, 200])  # Gray
-            else:
-                row.append([0, 0, 0])  # Black
-        pixels.append(row)
+        py = y // scale
+        lit = lit_rows[py] if py < len(lit_rows) else blank
+        pixels.append([[200, 200, 200] if on else [0, 0, 0] for on in lit])  # Gray / Black
     
     return pixels
 
@@ -256,14 +366,22 @@ def get_emoji_icon(emoji, size=32):
         size: Icon size (16 or 32)
     
     Returns:
-        2D array of RGB pixel values
+        2D array of RGB pixel values (icons loaded from a file are cached
+        and shared between callers, so treat them as read-only)
     """
-    # Try existing icon
+    # Try existing icon (parsed once per process)
+    key = (emoji, size)
+    pixels = _PIXELS_CACHE.get(key)
+    if pixels is not None:
+        _PIXELS_CACHE.move_to_end(key)
+        return pixels
+    
     icon_path = get_emoji_icon_path(emoji, size)
     if icon_path:
-        with open(icon_path, 'r') as f:
-            data = json.load(f)
-            return data['pixels']
+        pixels = _PIXELS_CACHE[key] = _load_icon_pixels(icon_path, size)
+        if len(_PIXELS_CACHE) > _PIXELS_CACHE_SIZE:
+            _PIXELS_CACHE.popitem(last=False)
+        return pixels
     
     # Try to render it
     pixels = render_emoji_icon(emoji, size)
@@ -277,27 +395,44 @@ def get_emoji_icon(emoji, size=32):
 
 
 # For bundled emoji generation (run during development)
+def _generate_task(task):
+    """Pool worker: generate one (emoji, size, output_path) icon."""
+    return generate_emoji_icon(*task)
+
+
 def generate_bundled_emojis():
     """Generate all bundled emojis (run once during development)."""
-    output_dir = os.path.join(os.path.dirname(__file__), "emoji_icons")
+    output_dir = _BUNDLED_DIR
     os.makedirs(output_dir, exist_ok=True)
     
     print(f"Generating {len(BUNDLED_EMOJIS)} bundled emojis...")
     
+    tasks = []
     for emoji in BUNDLED_EMOJIS:
         for size in [16, 32]:
-            codepoint = emoji_to_codepoint_hex(emoji)
-            output_path = os.path.join(output_dir, f"{codepoint}_{size}.json")
+            output_path = _BUNDLED_PATHS[(emoji, size)]
             
             if os.path.exists(output_path):
                 print(f"  ✓ {emoji} ({size}×{size}) - already exists")
                 continue
             
-            result = generate_emoji_icon(emoji, size, output_path)
-            if result:
-                print(f"  ✅ {emoji} ({size}×{size}) - generated")
-            else:
-                print(f"  ❌ {emoji} ({size}×{size}) - failed!")
+            tasks.append((emoji, size, output_path))
+    
+    if tasks:
+        # Each render is independent CPU work, so spread them over processes
+        # (results come back in task order)
+        import multiprocessing
+        with multiprocessing.Pool() as pool:
+            results = pool.imap(_generate_task, tasks)
+            for (emoji, size, _), result in zip(tasks, results):
+                if result:
+                    print(f"  ✅ {emoji} ({size}×{size}) - generated")
+                else:
+                    print(f"  ❌ {emoji} ({size}×{size}) - failed!")
+        
+        # The workers wrote the files, so this process's lookups are stale
+        for emoji, size, _ in tasks:
+            _forget_emoji_icon(emoji, size)
     
     print(f"\nDone! Bundled icons saved to {output_dir}")
 
@@ -6,16 +6,45 @@ offline icon support. Can also download emojis on-demand if enabled.
 """
 
 import os
-import json
+import threading
 import urllib.request
 import io
+from collections import OrderedDict
+from functools import cached_property, lru_cache
 from pathlib import Path
 from PIL import Image
 
+from matrixos.json_utils import load_json
+
+
+# Resampling filter for resized emojis (Image.Resampling needs Pillow 9.1+)
+try:
+    _LANCZOS = Image.Resampling.LANCZOS
+except AttributeError:
+    _LANCZOS = Image.LANCZOS
+
+# RGB565 contribution of each 8-bit channel value
+_RED_565 = [(v >> 3) << 11 for v in range(256)]
+_GREEN_565 = [(v >> 2) << 5 for v in range(256)]
+_BLUE_565 = [v >> 3 for v in range(256)]
+
+# Decoded sprite sheets shared by every loader in the process, keyed by path
+_SPRITESHEETS = {}
+_SPRITESHEETS_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=8)
+def _pixel_coords(size):
+    """(y, x) of every pixel in a size × size image, in row-major order."""
+    return tuple(divmod(i, size) for i in range(size * size))
+
 
 class EmojiLoader:
     """Loads emojis from sprite sheet."""
     
+    # Most emoji images kept in memory (least recently used are dropped)
+    CACHE_SIZE = 256
+    
     def __init__(self, spritesheet_path=None, metadata_path=None):
         """Initialize emoji loader.
         
@@ -37,24 +66,52 @@ class EmojiLoader:
         
         # Lazy load
         self._spritesheet = None
-        self._metadata = None
-        self._cache = {}  # Cache extracted emoji images
+        # Cached emoji images in LRU order: sprite sheet crops (always 32×32)
+        # keyed by emoji, downloaded images keyed by (emoji, size)
+        self._cache = OrderedDict()
+        # Icons are rendered off the main thread, so the LRU updates above
+        # (which reorder the dict) are made under this lock
+        self._cache_lock = threading.Lock()
     
     def _load_spritesheet(self):
         """Load sprite sheet image (lazy)."""
         if self._spritesheet is None:
-            if not os.path.exists(self.spritesheet_path):
-                raise FileNotFoundError(f"Sprite sheet not found: {self.spritesheet_path}")
-            self._spritesheet = Image.open(self.spritesheet_path)
+            with _SPRITESHEETS_LOCK:
+                # Another loader may already have decoded this sheet
+                sheet = _SPRITESHEETS.get(self.spritesheet_path)
+                if sheet is None:
+                    if not os.path.exists(self.spritesheet_path):
+                        raise FileNotFoundError(f"Sprite sheet not found: {self.spritesheet_path}")
+                    # Decode the whole sheet once, up front, into one RGBA image in
+                    # memory; every tile is then a plain crop of decoded pixels and
+                    # the file handle is released straight away
+                    with Image.open(self.spritesheet_path) as sheet:
+                        sheet.load()
+                        if sheet.mode != 'RGBA':
+                            sheet = sheet.convert('RGBA')
+                    _SPRITESHEETS[self.spritesheet_path] = sheet
+            self._spritesheet = sheet
         return self._spritesheet
     
+    @cached_property
+    def _metadata(self):
+        """Metadata JSON, parsed once on first access."""
+        if not os.path.exists(self.metadata_path):
+            raise FileNotFoundError(f"Metadata not found: {self.metadata_path}")
+        return load_json(self.metadata_path)
+    
+    @cached_property
+    def _emoji_boxes(self):
+        """Crop box (left, top, right, bottom) of every emoji in the sheet."""
+        metadata = self._metadata
+        size = metadata['emoji_size']
+        return {
+            emoji: (data['x'], data['y'], data['x'] + size, data['y'] + size)
+            for emoji, data in metadata['emojis'].items()
+        }
+    
     def _load_metadata(self):
         """Load metadata JSON (lazy)."""
-        if self._metadata is None:
-            if not os.path.exists(self.metadata_path):
-                raise FileNotFoundError(f"Metadata not found: {self.metadata_path}")
-            with open(self.metadata_path, 'r') as f:
-                self._metadata = json.load(f)
         return self._metadata
     
     def has_emoji(self, emoji):
@@ -66,8 +123,7 @@ class EmojiLoader:
         Returns:
             True if emoji is in sprite sheet
         """
-        metadata = self._load_metadata()
-        return emoji in metadata['emojis']
+        return emoji in self._emoji_boxes
     
     def get_emoji_image(self, emoji):
         """Extract emoji image from sprite sheet.
@@ -79,29 +135,41 @@ class EmojiLoader:
             PIL Image object (32×32 RGBA), or None if not found
         """
         # Check cache first
-        if emoji in self._cache:
-            return self._cache[emoji]
-        
-        # Load metadata
-        metadata = self._load_metadata()
-        if emoji not in metadata['emojis']:
-            return None
+        cached = self._cached_image(emoji)
+        if cached is not None:
+            return cached
         
         # Get position
-        emoji_data = metadata['emojis'][emoji]
-        x = emoji_data['x']
-        y = emoji_data['y']
-        size = metadata['emoji_size']
+        box = self._emoji_boxes.get(emoji)
+        if box is None:
+            return None
         
         # Extract from sprite sheet
         spritesheet = self._load_spritesheet()
-        emoji_img = spritesheet.crop((x, y, x + size, y + size))
+        emoji_img = spritesheet.crop(box)
         
         # Cache it
-        self._cache[emoji] = emoji_img
+        self._cache_image(emoji, emoji_img)
         
         return emoji_img
     
+    def _cache_image(self, key, img):
+        """Remember an emoji image, dropping the least recently used if full."""
+        cache = self._cache
+        with self._cache_lock:
+            cache[key] = img
+            cache.move_to_end(key)
+            while len(cache) > self.CACHE_SIZE:
+                cache.popitem(last=False)
+    
+    def _cached_image(self, key):
+        """A cached emoji image (marked as recently used), or None."""
+        with self._cache_lock:
+            img = self._cache.get(key)
+            if img is not None:
+                self._cache.move_to_end(key)
+        return img
+    
     def emoji_to_icon_json(self, emoji, size=32):
         """Convert emoji to MatrixOS icon JSON format.
         
@@ -112,39 +180,39 @@ class EmojiLoader:
         Returns:
             Icon data dict with 'width', 'height', 'data' keys, or None if not found
         """
-        img = self.get_emoji_image(emoji)
+        # Sprite sheet, or an emoji already downloaded at this size (never
+        # downloads - get_emoji_with_fallback() does that first)
+        img = self.get_emoji_with_fallback(emoji, size, allow_download=False)
         if img is None:
             return None
         
         # Resize if needed
-        if size != 32:
-            img = img.resize((size, size), Image.Resampling.LANCZOS)
+        if img.size != (size, size):
+            img = img.resize((size, size), _LANCZOS)
         
-        # Convert to RGB565 format for MatrixOS
+        # Convert to RGB565 format for MatrixOS, scanning the raw RGBA
+        # bytes once instead of calling getpixel() per pixel
+        if img.mode != 'RGBA':
+            img = img.convert('RGBA')
+        raw = img.tobytes()
+        red, green, blue = _RED_565, _GREEN_565, _BLUE_565
         pixels = []
-        for y in range(size):
-            for x in range(size):
-                r, g, b, a = img.getpixel((x, y))
-                
-                # Skip transparent pixels
-                if a < 128:
-                    continue
-                
-                # Skip black pixels (background/anti-aliasing artifacts)
-                if r < 30 and g < 30 and b < 30:
-                    continue
-                
-                # Convert to RGB565
-                r5 = (r >> 3) & 0x1F
-                g6 = (g >> 2) & 0x3F
-                b5 = (b >> 3) & 0x1F
-                rgb565 = (r5 << 11) | (g6 << 5) | b5
-                
-                pixels.append({
-                    'x': x,
-                    'y': y,
-                    'c': rgb565
-                })
+        append = pixels.append
+        for (y, x), r, g, b, a in zip(_pixel_coords(size), raw[0::4], raw[1::4], raw[2::4], raw[3::4]):
+            # Skip transparent pixels
+            if a < 128:
+                continue
+            
+            # Skip black pixels (background/anti-aliasing artifacts)
+            if r < 30 and g < 30 and b < 30:
+                continue
+            
+            # Convert to RGB565 via per-channel lookup tables
+            append({
+                'x': x,
+                'y': y,
+                'c': red[r] | green[g] | blue[b]
+            })
         
         return {
             'width': size,
@@ -192,7 +260,7 @@ class EmojiLoader:
                 img = Image.open(io.BytesIO(img_data))
                 
                 # Cache it
-                self._cache[emoji] = img
+                self._cache_image((emoji, size), img)
                 
                 # Optionally save to cache directory
                 self._save_to_cache(emoji, img, size)
@@ -202,7 +270,9 @@ class EmojiLoader:
             print(f"Failed to download emoji '{emoji}': {e}")
             return None
     
-    def _emoji_to_codepoint(self, emoji):
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _emoji_to_codepoint(emoji):
         """Convert emoji character to codepoint string.
         
         Args:
@@ -213,11 +283,52 @@ class EmojiLoader:
         """
         try:
             # Handle multi-codepoint emojis (like flags, skin tones, etc.)
-            codepoints = [f"{ord(c):04x}" for c in emoji]
-            return "_".join(codepoints)
+            return "_".join(["%04x" % ord(c) for c in emoji])
         except:
             return None
     
+    def _cache_file(self, emoji, size):
+        """Path of the on-disk cache file for a downloaded emoji.
+        
+        Args:
+            emoji: Emoji character
+            size: Image size
+            
+        Returns:
+            Path to the cached PNG (which may not exist yet)
+        """
+        # Get cache directory from system config
+        try:
+            from matrixos.system_config_loader import get_emoji_cache_dir
+            cache_dir = get_emoji_cache_dir()
+        except:
+            # Fallback if system config not available
+            cache_dir = Path.home() / ".matrixos" / "emoji_cache"
+        
+        codepoint = self._emoji_to_codepoint(emoji)
+        return cache_dir / f"emoji_{codepoint}_{size}.png"
+    
+    def _load_from_cache(self, emoji, size):
+        """Load a previously downloaded emoji from the cache directory.
+        
+        Args:
+            emoji: Emoji character
+            size: Image size
+            
+        Returns:
+            PIL Image object, or None if it was never downloaded
+        """
+        try:
+            cache_file = self._cache_file(emoji, size)
+            if not cache_file.is_file():
+                return None
+            with Image.open(cache_file) as cached:
+                cached.load()
+            return cached
+        except Exception:
+            # Unreadable cache entry - treat as missing
+            return None
+    
     def _save_to_cache(self, emoji, img, size):
         """Save downloaded emoji to cache directory.
         
@@ -227,19 +338,8 @@ class EmojiLoader:
             size: Image size
         """
         try:
-            # Get cache directory from system config
-            try:
-                from matrixos.system_config_loader import get_emoji_cache_dir
-                cache_dir = get_emoji_cache_dir()
-            except:
-                # Fallback if system config not available
-                cache_dir = Path.home() / ".matrixos" / "emoji_cache"
-            
-            cache_dir.mkdir(parents=True, exist_ok=True)
-            
-            codepoint = self._emoji_to_codepoint(emoji)
-            cache_file = cache_dir / f"emoji_{codepoint}_{size}.png"
-            
+            cache_file = self._cache_file(emoji, size)
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
             img.save(cache_file, "PNG")
         except Exception as e:
             # Silent fail - caching is optional
@@ -258,10 +358,19 @@ class EmojiLoader:
         """
         # Try sprite sheet first
         img = self.get_emoji_image(emoji)
-        if img and size != 32:
-            img = img.resize((size, size), Image.Resampling.LANCZOS)
+        if img is not None:
+            if size == 32:
+                return img
+            return img.resize((size, size), _LANCZOS)
         
-        if img:
+        # Downloaded already, in this session or an earlier one? (no
+        # network needed)
+        img = self._cached_image((emoji, size))
+        if img is not None:
+            return img
+        img = self._load_from_cache(emoji, size)
+        if img is not None:
+            self._cache_image((emoji, size), img)
             return img
         
         # Not in sprite sheet - check if downloads enabled
@@ -58,6 +58,11 @@ def draw_rect(display, x: int, y: int, width: int, height: int,
     """
     if fill:
         # Filled rectangle
+        fill_rect = getattr(display, 'fill_rect', None)
+        if fill_rect is not None:
+            # One row span per scanline instead of one call per pixel
+            fill_rect(x, y, width, height, color)
+            return
         for dy in range(height):
             for dx in range(width):
                 display.set_pixel(x + dx, y + dy, color)
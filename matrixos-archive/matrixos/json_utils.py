@@ -0,0 +1,78 @@
+"""
+JSON helpers for MatrixOS.
+
+Uses a faster JSON parser when one is installed and falls back to the
+standard library otherwise, so nothing here is a hard dependency:
+
+- orjson (fastest, preferred)
+- ujson
+- json (stdlib fallback)
+
+Parse errors are always raised as ValueError subclasses, matching the
+stdlib json module.
+
+Example:
+    from matrixos.json_utils import load_json, dump_json
+
+    config = load_json('config.json')
+    dump_json('config.json', config)
+"""
+
+try:
+    import orjson as _backend
+    loads = _backend.loads
+    _dumps = _backend.dumps  # Already returns UTF-8 bytes
+    BACKEND = "orjson"
+except ImportError:
+    try:
+        import ujson as _backend
+        loads = _backend.loads
+        BACKEND = "ujson"
+    except ImportError:
+        import json as _backend
+        loads = _backend.loads
+        BACKEND = "json"
+
+    def _dumps(obj):
+        return _backend.dumps(obj).encode('utf-8')
+
+
+def load_json(path):
+    """
+    Read and parse a JSON file.
+
+    The file is read as bytes in one call and handed to the fastest
+    available parser.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not valid JSON
+    """
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def dump_json(path, obj):
+    """
+    Serialize a value and write it to a JSON file.
+
+    The whole document is encoded by the fastest available serializer
+    and written as bytes in one call.
+
+    Args:
+        path: Path to the JSON file
+        obj: JSON-serializable value
+
+    Raises:
+        OSError: If the file cannot be written
+        TypeError: If obj is not JSON-serializable
+    """
+    data = _dumps(obj)
+    with open(path, 'wb') as f:
+        f.write(data)
@@ -16,9 +16,22 @@ Example:
         print(f"User entered: {city}")
 """
 
+import time
+from functools import lru_cache
+
 from matrixos.input import InputEvent
 
 
+# Seconds between cursor blinks; show_keyboard also waits for input this long
+CURSOR_BLINK_INTERVAL = 0.5
+
+# Pause between polls when the input handler ignores its timeout
+_POLL_INTERVAL = 0.02
+
+# Most frames per second show_keyboard sends while keys are arriving
+KEYBOARD_FPS = 60
+
+
 class KeyboardLayout:
     """Keyboard layout definitions."""
     
@@ -46,22 +59,46 @@ class KeyboardLayout:
         ['_', ' ', ',', '.', '✓']
     ]
     
+    # Immutable copies of the layouts above, by mode
+    _LAYOUTS = {
+        'lower': tuple(map(tuple, QWERTY_LOWER)),
+        'upper': tuple(map(tuple, QWERTY_UPPER)),
+        'numbers': tuple(map(tuple, NUMBERS)),
+    }
+    
     @staticmethod
-    def get_layout(mode: str) -> list:
-        """Get keyboard layout for mode."""
-        if mode == 'lower':
-            return KeyboardLayout.QWERTY_LOWER
-        elif mode == 'upper':
-            return KeyboardLayout.QWERTY_UPPER
-        elif mode == 'numbers':
-            return KeyboardLayout.NUMBERS
-        else:
-            return KeyboardLayout.QWERTY_LOWER
+    def get_layout(mode: str) -> tuple:
+        """Get keyboard layout for mode (rows of keys, lowercase if unknown)."""
+        return KeyboardLayout._LAYOUTS.get(mode, KeyboardLayout._LAYOUTS['lower'])
+
+
+@lru_cache(maxsize=None)
+def _row_lengths(mode: str) -> tuple:
+    """Number of keys in each row of a mode's layout."""
+    return tuple(len(row) for row in KeyboardLayout.get_layout(mode))
 
 
 class OnScreenKeyboard:
     """On-screen keyboard for text input."""
     
+    # Keyboard area background
+    BG_COLOR = (30, 30, 40)
+    
+    # Key backgrounds: regular, special (shift, backspace, done, symbols),
+    # space bar and the highlighted key
+    KEY_COLOR = (70, 70, 90)
+    KEY_SPECIAL_COLOR = (60, 60, 80)
+    KEY_SPACE_COLOR = (50, 50, 60)
+    KEY_SELECTED_COLOR = (100, 150, 255)
+    
+    # Key label colors
+    LABEL_COLOR = (200, 200, 200)
+    LABEL_SELECTED_COLOR = (255, 255, 255)
+    
+    # Entered text and its cursor
+    TEXT_COLOR = (255, 255, 255)
+    CURSOR_COLOR = (100, 200, 255)
+    
     def __init__(self, prompt: str = "Enter text:", initial: str = ""):
         """
         Initialize keyboard.
@@ -71,17 +108,51 @@ class OnScreenKeyboard:
             initial: Initial text value
         """
         self.prompt = prompt
-        self.text = initial
+        # Text is kept as a list of characters so typing edits in place;
+        # the version counter changes on every edit
+        self._chars = list(initial)
+        self._text_version = 0
         self.cursor_pos = len(initial)
         
         self.mode = 'lower'  # 'lower', 'upper', 'numbers'
         self.layout = KeyboardLayout.get_layout(self.mode)
+        self._row_lens = _row_lengths(self.mode)
         
         self.selected_row = 0
         self.selected_col = 0
         
         self.done = False
         self.cancelled = False
+        
+        # Redraw tracking: everything until the first render, then only
+        # the key rows and text line that actually changed
+        self.needs_full_redraw = True
+        self._dirty_rows = set()
+        self._dirty_text = False
+        self._dirty_cursor = False
+        
+        self._cursor_on = True
+        # (x, y, width, height) of the cursor block, None when off-screen
+        self._cursor_rect = None
+        
+        # Text line as displayed, rebuilt when the text or width changes
+        self._visible_key = None
+        self._visible = ('', 4)
+        
+        # Key positions, rebuilt when the layout or screen size changes
+        self._geometry_key = None
+        self._geometry = []
+    
+    @property
+    def text(self) -> str:
+        """The entered text."""
+        return ''.join(self._chars)
+    
+    @text.setter
+    def text(self, value: str):
+        self._chars = list(value)
+        self._text_version += 1
+        self._dirty_text = True
     
     def handle_input(self, event: InputEvent) -> bool:
         """
@@ -93,28 +164,38 @@ class OnScreenKeyboard:
         Returns:
             True if event was handled
         """
+        old_selection = (self.selected_row, self.selected_col)
+        handled = self._handle_key(event)
+        if (self.selected_row, self.selected_col) != old_selection:
+            # Old key loses its highlight, new key gains it
+            self._dirty_rows.add(old_selection[0])
+            self._dirty_rows.add(self.selected_row)
+        return handled
+    
+    def _handle_key(self, event: InputEvent) -> bool:
+        """Apply an input event to the keyboard state."""
+        row_lens = self._row_lens
+        
         if event.key == InputEvent.UP:
-            self.selected_row = (self.selected_row - 1) % len(self.layout)
+            self.selected_row = (self.selected_row - 1) % len(row_lens)
             # Adjust column if row is shorter
-            if self.selected_col >= len(self.layout[self.selected_row]):
-                self.selected_col = len(self.layout[self.selected_row]) - 1
+            if self.selected_col >= row_lens[self.selected_row]:
+                self.selected_col = row_lens[self.selected_row] - 1
             return True
         
         elif event.key == InputEvent.DOWN:
-            self.selected_row = (self.selected_row + 1) % len(self.layout)
+            self.selected_row = (self.selected_row + 1) % len(row_lens)
             # Adjust column if row is shorter
-            if self.selected_col >= len(self.layout[self.selected_row]):
-                self.selected_col = len(self.layout[self.selected_row]) - 1
+            if self.selected_col >= row_lens[self.selected_row]:
+                self.selected_col = row_lens[self.selected_row] - 1
             return True
         
         elif event.key == InputEvent.LEFT:
-            row = self.layout[self.selected_row]
-            self.selected_col = (self.selected_col - 1) % len(row)
+            self.selected_col = (self.selected_col - 1) % row_lens[self.selected_row]
             return True
         
         elif event.key == InputEvent.RIGHT:
-            row = self.layout[self.selected_row]
-            self.selected_col = (self.selected_col + 1) % len(row)
+            self.selected_col = (self.selected_col + 1) % row_lens[self.selected_row]
             return True
         
         elif event.key == InputEvent.OK:
@@ -148,36 +229,42 @@ class OnScreenKeyboard:
         elif key == '←':
             # Backspace
             if self.cursor_pos > 0:
-                self.text = self.text[:self.cursor_pos - 1] + self.text[self.cursor_pos:]
+                del self._chars[self.cursor_pos - 1]
                 self.cursor_pos -= 1
+                self._text_version += 1
+                self._dirty_text = True
             return True
         
         elif key == '↑':
             # Shift (toggle case)
-            if self.mode == 'lower':
-                self.mode = 'upper'
-            elif self.mode == 'upper':
-                self.mode = 'lower'
-            elif self.mode == 'numbers':
-                self.mode = 'lower'
-            self.layout = KeyboardLayout.get_layout(self.mode)
+            self._set_mode('upper' if self.mode == 'lower' else 'lower')
             return True
         
         elif key == '_':
             # Switch to numbers/symbols
-            if self.mode == 'numbers':
-                self.mode = 'lower'
-            else:
-                self.mode = 'numbers'
-            self.layout = KeyboardLayout.get_layout(self.mode)
+            self._set_mode('lower' if self.mode == 'numbers' else 'numbers')
             return True
         
         else:
             # Regular character
-            self.text = self.text[:self.cursor_pos] + key + self.text[self.cursor_pos:]
+            self._chars.insert(self.cursor_pos, key)
             self.cursor_pos += 1
+            self._text_version += 1
+            self._dirty_text = True
             return True
     
+    def _set_mode(self, mode: str):
+        """Switch layout ('lower', 'upper' or 'numbers')."""
+        self.mode = mode
+        self.layout = KeyboardLayout.get_layout(mode)
+        self._row_lens = _row_lengths(self.mode)
+        self.needs_full_redraw = True
+    
+    def blink_cursor(self):
+        """Toggle the text cursor (call every CURSOR_BLINK_INTERVAL)."""
+        self._cursor_on = not self._cursor_on
+        self._dirty_cursor = True
+    
     def render(self, matrix):
         """
         Render keyboard on bottom half of screen.
@@ -186,53 +273,147 @@ class OnScreenKeyboard:
             matrix: Display matrix
         """
         width = matrix.width
-        height = matrix.height
-        
-        # Keyboard takes bottom half (or at least 48 pixels)
-        kbd_height = max(height // 2, 48)
-        kbd_y = height - kbd_height
+        kbd_y = self._keyboard_top(matrix)
         
         # Background for keyboard area (darker to distinguish)
-        matrix.rect(0, kbd_y, width, kbd_height, (30, 30, 40), fill=True)
+        matrix.rect(0, kbd_y, width, matrix.height - kbd_y, self.BG_COLOR, fill=True)
         
         # Prompt and text input area
-        y = kbd_y + 2
-        matrix.text(self.prompt, 2, y, (200, 200, 200))
-        y += 10
+        matrix.text(self.prompt, 2, kbd_y + 2, (200, 200, 200))
+        self._draw_text_line(matrix, kbd_y + 12)
         
-        # Text with cursor
-        text_color = (255, 255, 255)
-        cursor_color = (100, 200, 255)
+        # Keyboard layout
+        for row_idx in range(len(self.layout)):
+            self._draw_row(matrix, row_idx)
         
-        # Show text (truncate if too long)
-        display_text = self.text
-        if len(display_text) * 6 > width - 8:
-            # Show end of text if it's too long
-            max_chars = (width - 8) // 6
-            display_text = "..." + display_text[-(max_chars - 3):]
+        self.needs_full_redraw = False
+        self._dirty_rows.clear()
+        self._dirty_text = False
+        self._dirty_cursor = False
+    
+    def render_diff(self, matrix) -> bool:
+        """
+        Repaint only what changed since the last render.
+        
+        Only valid while needs_full_redraw is False, i.e. after render()
+        has drawn the whole keyboard once.
+        
+        Args:
+            matrix: Display matrix
+            
+        Returns:
+            True if anything was drawn
+        """
+        cursor_only = (self._dirty_cursor and not self._dirty_text
+                       and self._cursor_rect is not None)
+        if not (self._dirty_rows or self._dirty_text or cursor_only):
+            self._dirty_cursor = False
+            return False
+        
+        kbd_y = self._keyboard_top(matrix)
+        
+        if self._dirty_text:
+            # Wipe the old text and cursor, then draw the new ones
+            matrix.rect(0, kbd_y + 12, matrix.width, 12, self.BG_COLOR, fill=True)
+            self._draw_text_line(matrix, kbd_y + 12)
+        elif cursor_only:
+            # A blink: repaint just the cursor's 2x7 block
+            self._draw_cursor(matrix)
+        
+        if self._dirty_rows:
+            rows = sorted(self._dirty_rows)
+            key_height, key_spacing = self._key_size(matrix)[1:]
+            if key_height + key_spacing < 9:
+                # Labels (8px font, 1px down) reach into the next row, which
+                # is normally painted over them - so repaint down to the end
+                rows = range(rows[0], len(self.layout))
+            for row_idx in rows:
+                self._draw_row(matrix, row_idx)
+        
+        self._dirty_rows.clear()
+        self._dirty_text = False
+        self._dirty_cursor = False
+        return True
+    
+    @staticmethod
+    def _keyboard_top(matrix) -> int:
+        """Top edge of the keyboard area."""
+        # Keyboard takes bottom half (or at least 48 pixels)
+        return matrix.height - max(matrix.height // 2, 48)
+    
+    @staticmethod
+    def _key_size(matrix) -> tuple:
+        """(key_width, key_height, key_spacing) for the screen size."""
+        # Calculate key width based on screen size
+        if matrix.width >= 128:
+            return 10, 8, 2
+        return 6, 6, 2
+    
+    def _draw_text_line(self, matrix, y: int):
+        """Draw the entered text and cursor at y."""
+        width = matrix.width
         
-        matrix.text(display_text, 4, y, text_color)
+        # Text with cursor
+        display_text, cursor_x = self._visible_text(width)
+        matrix.text(display_text, 4, y, self.TEXT_COLOR)
         
         # Cursor
-        cursor_x = 4 + len(display_text) * 6
         if cursor_x < width - 4:
-            matrix.rect(cursor_x, y, 2, 7, cursor_color, fill=True)
+            self._cursor_rect = (cursor_x, y, 2, 7)
+            if self._cursor_on:
+                matrix.rect(*self._cursor_rect, self.CURSOR_COLOR, fill=True)
+        else:
+            self._cursor_rect = None
+    
+    def _draw_cursor(self, matrix):
+        """Show or hide the cursor without redrawing the rest of the text line."""
+        if self._cursor_on:
+            matrix.rect(*self._cursor_rect, self.CURSOR_COLOR, fill=True)
+            return
+        
+        matrix.rect(*self._cursor_rect, self.BG_COLOR, fill=True)
+        # Glyph cells are wider than the 6px the cursor position assumes, so
+        # text can sit under the cursor. Text is drawn without a background,
+        # so redrawing it only restores the pixels the cursor covered.
+        matrix.text(self._visible_text(matrix.width)[0], 4, self._cursor_rect[1],
+                    self.TEXT_COLOR)
+    
+    def _visible_text(self, width: int) -> tuple:
+        """(text as displayed, cursor x), rebuilt only when text or width change."""
+        key = (self._text_version, width)
+        if key != self._visible_key:
+            # Show text (truncate if too long)
+            max_chars = (width - 8) // 6
+            if len(self._chars) > max_chars:
+                # Show end of text if it's too long; only that tail is joined
+                display_text = "..." + ''.join(self._chars[-(max_chars - 3):])
+            else:
+                display_text = ''.join(self._chars)
+            
+            self._visible_key = key
+            self._visible = (display_text, 4 + len(display_text) * 6)
+        return self._visible
+    
+    def _key_rows(self, matrix) -> list:
+        """
+        Key geometry for the current layout and screen size.
         
-        y += 12
+        Built once per (mode, width, height) and reused until one changes.
         
-        # Keyboard layout
-        key_spacing = 2
+        Returns:
+            One list per row of (key_x, key_y, bg_color, label, label_x, label_y)
+        """
+        width = matrix.width
+        height = matrix.height
+        geometry_key = (self.mode, width, height)
+        if geometry_key == self._geometry_key:
+            return self._geometry
         
-        # Calculate key width based on screen size
-        if width >= 128:
-            key_width = 10
-            key_height = 8
-            start_x = 8
-        else:
-            key_width = 6
-            key_height = 6
-            start_x = 2
+        key_width, key_height, key_spacing = self._key_size(matrix)
+        start_x = 8 if width >= 128 else 2
+        y = self._keyboard_top(matrix) + 24
         
+        rows = []
         for row_idx, row in enumerate(self.layout):
             row_y = y + row_idx * (key_height + key_spacing)
             
@@ -240,40 +421,44 @@ class OnScreenKeyboard:
             row_width = len(row) * (key_width + key_spacing) - key_spacing
             row_x = start_x + (width - start_x * 2 - row_width) // 2
             
+            keys = []
             for col_idx, key in enumerate(row):
                 key_x = row_x + col_idx * (key_width + key_spacing)
                 
-                # Key appearance
-                is_selected = (row_idx == self.selected_row and col_idx == self.selected_col)
-                
-                if is_selected:
-                    # Highlighted key
-                    bg_color = (100, 150, 255)
-                    text_color = (255, 255, 255)
+                # Normal key appearance
+                if key in ['↑', '←', '✓', '_']:
+                    bg_color = self.KEY_SPECIAL_COLOR
+                elif key == ' ':
+                    bg_color = self.KEY_SPACE_COLOR
                 else:
-                    # Normal key
-                    if key in ['↑', '←', '✓', '_']:
-                        # Special keys
-                        bg_color = (60, 60, 80)
-                    elif key == ' ':
-                        # Space bar
-                        bg_color = (50, 50, 60)
-                    else:
-                        # Regular keys
-                        bg_color = (70, 70, 90)
-                    text_color = (200, 200, 200)
-                
-                # Draw key background
-                matrix.rect(key_x, row_y, key_width, key_height, bg_color, fill=True)
-                
-                # Draw key label (centered)
-                label = key
-                if label == ' ':
-                    label = 'SPC'
+                    bg_color = self.KEY_COLOR
                 
+                # Key label (centered)
+                label = 'SPC' if key == ' ' else key
                 label_x = key_x + (key_width - len(label) * 6) // 2
-                label_y = row_y + 1
-                matrix.text(label, label_x, label_y, text_color)
+                keys.append((key_x, row_y, bg_color, label, label_x, row_y + 1))
+            rows.append(keys)
+        
+        self._geometry_key = geometry_key
+        self._geometry = rows
+        return rows
+    
+    def _draw_row(self, matrix, row_idx: int):
+        """Draw one row of keys."""
+        key_width, key_height = self._key_size(matrix)[:2]
+        selected_col = self.selected_col if row_idx == self.selected_row else -1
+        keys = self._key_rows(matrix)[row_idx]
+        
+        for col_idx, (key_x, key_y, bg_color, label, label_x, label_y) in enumerate(keys):
+            if col_idx == selected_col:
+                # Highlighted key
+                bg_color = self.KEY_SELECTED_COLOR
+                text_color = self.LABEL_SELECTED_COLOR
+            else:
+                text_color = self.LABEL_COLOR
+            
+            matrix.rect(key_x, key_y, key_width, key_height, bg_color, fill=True)
+            matrix.text(label, label_x, label_y, text_color)
 
 
 def show_keyboard(matrix, input_handler, prompt: str = "Enter text:", 
@@ -302,6 +487,17 @@ def show_keyboard(matrix, input_handler, prompt: str = "Enter text:",
         pass
     
     keyboard = OnScreenKeyboard(prompt, initial)
+    last_blink = last_frame = time.monotonic()
+    frame_interval = 1.0 / KEYBOARD_FPS
+    
+    def take(event):
+        try:
+            with open('/tmp/matrixos_debug.log', 'a') as f:
+                f.write(f"[KEYBOARD] Got event: {event.key}\n")
+                f.flush()
+        except:
+            pass
+        keyboard.handle_input(event)
     
     iteration = 0
     while not keyboard.done:
@@ -314,43 +510,69 @@ def show_keyboard(matrix, input_handler, prompt: str = "Enter text:",
             except:
                 pass
         
-        # Clear screen
-        try:
-            matrix.clear()
-        except Exception as e:
-            with open('/tmp/matrixos_debug.log', 'a') as f:
-                f.write(f"[KEYBOARD ERROR] matrix.clear() failed: {e}\n")
-                f.flush()
-            break
+        # Clear screen (only when everything is redrawn)
+        full_redraw = keyboard.needs_full_redraw
+        if full_redraw:
+            try:
+                matrix.clear()
+            except Exception as e:
+                with open('/tmp/matrixos_debug.log', 'a') as f:
+                    f.write(f"[KEYBOARD ERROR] matrix.clear() failed: {e}\n")
+                    f.flush()
+                break
         
-        # Render keyboard
+        # Render keyboard (or just the parts that changed)
         try:
-            keyboard.render(matrix)
+            if full_redraw:
+                keyboard.render(matrix)
+                changed = True
+            else:
+                changed = keyboard.render_diff(matrix)
         except Exception as e:
             with open('/tmp/matrixos_debug.log', 'a') as f:
                 f.write(f"[KEYBOARD ERROR] keyboard.render() failed: {e}\n")
                 f.flush()
             break
         
-        # Display
-        try:
-            matrix.show()
-        except Exception as e:
-            with open('/tmp/matrixos_debug.log', 'a') as f:
-                f.write(f"[KEYBOARD ERROR] matrix.show() failed: {e}\n")
-                f.flush()
-            break
-        
-        # Handle input
-        event = input_handler.get_key(timeout=0.1)
-        if event:
+        # Display (nothing to send if nothing changed)
+        if changed:
+            last_frame = time.monotonic()
             try:
+                matrix.show()
+            except Exception as e:
                 with open('/tmp/matrixos_debug.log', 'a') as f:
-                    f.write(f"[KEYBOARD] Got event: {event.key}\n")
+                    f.write(f"[KEYBOARD ERROR] matrix.show() failed: {e}\n")
                     f.flush()
-            except:
-                pass
-            keyboard.handle_input(event)
+                break
+        
+        # Wait for input, but no longer than the next cursor blink
+        wait = max(0.0, last_blink + CURSOR_BLINK_INTERVAL - time.monotonic())
+        event = input_handler.get_key(timeout=wait)
+        if event:
+            take(event)
+            # Batch whatever else arrives before the next frame is due, so
+            # a held key costs one render per frame rather than per event
+            frame_due = last_frame + frame_interval
+            while not keyboard.done:
+                remaining = frame_due - time.monotonic()
+                if remaining <= 0:
+                    break
+                event = input_handler.get_key(timeout=remaining)
+                if event:
+                    take(event)
+                else:
+                    time.sleep(max(0.0, frame_due - time.monotonic()))
+                    break
+        else:
+            # Some drivers return straight away; don't spin on them
+            remaining = last_blink + CURSOR_BLINK_INTERVAL - time.monotonic()
+            if remaining > 0:
+                time.sleep(min(remaining, _POLL_INTERVAL))
+        
+        now = time.monotonic()
+        if now - last_blink >= CURSOR_BLINK_INTERVAL:
+            keyboard.blink_cursor()
+            last_blink = now
     
     # DEBUG
     try:
@@ -50,6 +50,23 @@ class LEDMatrix:
         """Get pixel value at position."""
         return self.display.get_pixel(x, y)
 
+    def blit_rgb(self, x: int, y: int, width: int, height: int,
+                 rgb: bytes, alpha: Optional[bytes] = None):
+        """
+        Copy a block of packed RGB pixels in a single call.
+
+        Args:
+            x, y: Top-left pixel position
+            width, height: Block size in pixels
+            rgb: Packed r, g, b bytes per pixel, row-major
+            alpha: Optional mask with one byte per pixel; zero bytes are skipped
+        """
+        self.display.blit_rgb(x, y, width, height, rgb, alpha)
+
+    def darken_rect(self, x: int, y: int, width: int, height: int):
+        """Halve the brightness of every pixel in a rectangle."""
+        self.display.darken_rect(x, y, width, height)
+
     # Graphics primitives
 
     def line(self, x0: int, y0: int, x1: int, y1: int, color: Color = True):
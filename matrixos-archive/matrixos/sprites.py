@@ -1026,9 +1026,9 @@ class EmojiSprite(Sprite):
     
     def _preload_images(self):
         """Pre-load and cache all emoji images."""
-        from matrixos.emoji_loader import EmojiLoader
+        from matrixos.emoji_loader import get_emoji_loader
         
-        loader = EmojiLoader()
+        loader = get_emoji_loader()
         
         for emoji in self.emoji_frames:
             if emoji not in self._image_cache:
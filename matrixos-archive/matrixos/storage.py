@@ -21,12 +21,57 @@ Example:
 import sqlite3
 import json
 import os
+import threading
+import weakref
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Optional
 
 
+# Connection settings for a small, write-light settings store: WAL with
+# NORMAL sync skips the per-write journal fsync of the rollback journal
+# (a crash can lose the last writes, never corrupt the file).
+# journal_mode is persistent; the others must be set on every connection.
+_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-2000',
+    'PRAGMA mmap_size=67108864',
+)
+
+
+# Statements, written once so each method reuses sqlite3's cached
+# compiled statement for the same text
+_SQL_SET = 'INSERT OR REPLACE INTO storage (key, value, type) VALUES (?, ?, ?)'
+_SQL_GET = 'SELECT value, type FROM storage WHERE key = ?'
+_SQL_DELETE = 'DELETE FROM storage WHERE key = ?'
+_SQL_KEYS = 'SELECT key FROM storage ORDER BY key'
+_SQL_CLEAR = 'DELETE FROM storage'
+
+# Prefix matches as key ranges, which SQLite answers from the primary key
+# index ('_FROM' variants have no upper bound; see _prefix_range)
+_SQL_KEYS_RANGE = 'SELECT key FROM storage WHERE key >= ? AND key < ? ORDER BY key'
+_SQL_KEYS_FROM = 'SELECT key FROM storage WHERE key >= ? ORDER BY key'
+_SQL_CLEAR_RANGE = 'DELETE FROM storage WHERE key >= ? AND key < ?'
+_SQL_CLEAR_FROM = 'DELETE FROM storage WHERE key >= ?'
+
+# Cache marker for keys not looked up yet (None marks keys known to be absent)
+_UNCACHED = object()
+
+
 class Storage:
-    """Key-value storage backed by SQLite."""
+    """
+    Key-value storage backed by SQLite.
+    
+    Recently used rows are cached in memory, so a store assumes it is the
+    only writer to its database file while open. Values written by another
+    Storage or process are seen only for keys not cached yet, or after
+    close() (the cache is dropped when the store reopens).
+    """
+    
+    # Most rows kept in memory (least recently used are dropped)
+    CACHE_SIZE = 256
     
     def __init__(self, db_path: Optional[str] = None):
         """
@@ -42,14 +87,32 @@ class Storage:
             db_path = str(config_dir / 'storage.db')
         
         self.db_path = db_path
-        self._init_db()
-    
-    def _init_db(self):
-        """Initialize database schema."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
         
-        cursor.execute('''
+        # One connection for the lifetime of the store, in autocommit mode
+        # (each statement commits on its own). Background tasks may use
+        # storage too, so calls are serialised with a lock.
+        self._db = None
+        self._closer = None
+        self._lock = threading.Lock()
+        
+        # Write-through cache of stored (value, type) columns by key, so
+        # repeated reads of hot settings skip SQLite. Rows rather than
+        # decoded values are kept so callers can't mutate cached lists.
+        # Assumes this store is the only writer while it is open (see the
+        # class docstring).
+        self._rows = OrderedDict()
+        
+        with self._lock:
+            self._open()
+    
+    def _open(self) -> sqlite3.Connection:
+        """Connect and initialize the database schema. Call with the lock held."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                               isolation_level=None)
+        for pragma in _PRAGMAS:
+            conn.execute(pragma)
+        
+        conn.execute('''
             CREATE TABLE IF NOT EXISTS storage (
                 key TEXT PRIMARY KEY,
                 value TEXT NOT NULL,
@@ -57,8 +120,33 @@ class Storage:
             )
         ''')
         
-        conn.commit()
-        conn.close()
+        # Closed when this store is garbage collected or at exit, whichever
+        # comes first, without the exit hook keeping the store alive
+        self._closer = weakref.finalize(self, conn.close)
+        self._db = conn
+        return conn
+    
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        """The database connection, reopened after close(). Call with the lock held."""
+        conn = self._db
+        if conn is None:
+            conn = self._open()
+        return conn
+    
+    def close(self) -> None:
+        """
+        Close the database connection.
+        
+        Safe to call more than once; using the store afterwards reopens it
+        with an empty row cache.
+        """
+        with self._lock:
+            if self._db is not None:
+                self._closer()
+                self._db = None
+            # Others may write while it is closed, so reads start afresh
+            self._rows.clear()
     
     def set(self, key: str, value: Any) -> None:
         """
@@ -68,37 +156,12 @@ class Storage:
             key: Storage key (use dotted notation: 'app.setting')
             value: Value to store (strings, numbers, lists, dicts supported)
         """
-        # Determine type and serialize
-        if isinstance(value, str):
-            value_type = 'str'
-            value_str = value
-        elif isinstance(value, bool):
-            value_type = 'bool'
-            value_str = json.dumps(value)
-        elif isinstance(value, int):
-            value_type = 'int'
-            value_str = str(value)
-        elif isinstance(value, float):
-            value_type = 'float'
-            value_str = str(value)
-        elif isinstance(value, (list, dict)):
-            value_type = 'json'
-            value_str = json.dumps(value)
-        else:
-            value_type = 'json'
-            value_str = json.dumps(value)
+        value_str, value_type = self._encode(value)
         
         # Store in database
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO storage (key, value, type)
-            VALUES (?, ?, ?)
-        ''', (key, value_str, value_type))
-        
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self._conn.execute(_SQL_SET, (key, value_str, value_type))
+            self._cache_row(key, (value_str, value_type))
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -111,24 +174,123 @@ class Storage:
         Returns:
             Stored value or default
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT value, type FROM storage WHERE key = ?', (key,))
-        row = cursor.fetchone()
-        
-        conn.close()
+        with self._lock:
+            row = self._lookup(key)
         
         if row is None:
             return default
         
-        value_str, value_type = row
+        return self._decode(*row)
+    
+    def set_many(self, items: dict) -> None:
+        """
+        Store several values in one transaction.
         
+        Args:
+            items: Dict of storage key -> value
+        """
+        rows = [(key, *self._encode(value)) for key, value in items.items()]
+        
+        with self._lock:
+            self._conn.execute('BEGIN')
+            try:
+                self._conn.executemany(_SQL_SET, rows)
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+            
+            for key, value_str, value_type in rows:
+                self._cache_row(key, (value_str, value_type))
+    
+    def get_many(self, keys: list, default: Any = None) -> dict:
+        """
+        Retrieve several values with as few queries as possible.
+        
+        Args:
+            keys: Storage keys
+            default: Value for keys that don't exist
+            
+        Returns:
+            Dict of key -> stored value (or default) for every key requested
+        """
+        keys = list(keys)
+        found = {}
+        
+        with self._lock:
+            # Cached rows first; only the rest go to the database
+            missing = []
+            for key in keys:
+                row = self._rows.get(key, _UNCACHED)
+                if row is _UNCACHED:
+                    missing.append(key)
+                else:
+                    found[key] = row
+            
+            # Stay well inside SQLite's limit on bound parameters
+            for start in range(0, len(missing), 500):
+                chunk = missing[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                for key, value_str, value_type in self._conn.execute(
+                    f'SELECT key, value, type FROM storage WHERE key IN ({placeholders})',
+                    chunk
+                ):
+                    found[key] = (value_str, value_type)
+            
+            for key in missing:
+                self._cache_row(key, found.get(key))
+        
+        result = {}
+        for key in keys:
+            row = found.get(key)
+            result[key] = default if row is None else self._decode(*row)
+        return result
+    
+    def _lookup(self, key: str) -> Optional[tuple]:
+        """(value, type) stored for key, or None. Call with the lock held."""
+        rows = self._rows
+        row = rows.get(key, _UNCACHED)
+        if row is _UNCACHED:
+            row = self._conn.execute(_SQL_GET, (key,)).fetchone()
+            self._cache_row(key, row)
+        else:
+            rows.move_to_end(key)
+        return row
+    
+    def _cache_row(self, key: str, row: Optional[tuple]):
+        """Remember key's row (None = absent), dropping the oldest if full."""
+        rows = self._rows
+        rows[key] = row
+        rows.move_to_end(key)
+        while len(rows) > self.CACHE_SIZE:
+            rows.popitem(last=False)
+    
+    @staticmethod
+    def _encode(value: Any) -> tuple:
+        """Serialize a value to its (value_str, value_type) columns."""
+        # Determine type and serialize
+        if isinstance(value, str):
+            return value, 'str'
+        elif isinstance(value, bool):
+            # Checked before int, since bool is a subclass of int
+            return ('1' if value else '0'), 'bool'
+        elif isinstance(value, int):
+            return str(value), 'int'
+        elif isinstance(value, float):
+            return str(value), 'float'
+        else:
+            # Lists, dicts and anything else JSON can represent
+            return json.dumps(value, separators=(',', ':'), ensure_ascii=False), 'json'
+    
+    @staticmethod
+    def _decode(value_str: str, value_type: str) -> Any:
+        """Deserialize a stored value from its value and type columns."""
         # Deserialize based on type
         if value_type == 'str':
             return value_str
         elif value_type == 'bool':
-            return json.loads(value_str)
+            # Older databases stored JSON 'true'/'false'
+            return value_str == '1' or value_str == 'true'
         elif value_type == 'int':
             return int(value_str)
         elif value_type == 'float':
@@ -148,16 +310,10 @@ class Storage:
         Returns:
             True if key was deleted, False if it didn't exist
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('DELETE FROM storage WHERE key = ?', (key,))
-        deleted = cursor.rowcount > 0
-        
-        conn.commit()
-        conn.close()
-        
-        return deleted
+        with self._lock:
+            cursor = self._conn.execute(_SQL_DELETE, (key,))
+            self._cache_row(key, None)
+            return cursor.rowcount > 0
     
     def exists(self, key: str) -> bool:
         """
@@ -169,15 +325,8 @@ class Storage:
         Returns:
             True if key exists
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT 1 FROM storage WHERE key = ? LIMIT 1', (key,))
-        exists = cursor.fetchone() is not None
-        
-        conn.close()
-        
-        return exists
+        with self._lock:
+            return self._lookup(key) is not None
     
     def keys(self, prefix: str = '') -> list:
         """
@@ -189,22 +338,15 @@ class Storage:
         Returns:
             List of matching keys
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        if prefix:
-            cursor.execute(
-                'SELECT key FROM storage WHERE key LIKE ? ORDER BY key',
-                (f'{prefix}%',)
-            )
-        else:
-            cursor.execute('SELECT key FROM storage ORDER BY key')
-        
-        keys = [row[0] for row in cursor.fetchall()]
-        
-        conn.close()
-        
-        return keys
+        with self._lock:
+            if not prefix:
+                cursor = self._conn.execute(_SQL_KEYS)
+            else:
+                bounds = self._prefix_range(prefix)
+                sql = _SQL_KEYS_RANGE if len(bounds) == 2 else _SQL_KEYS_FROM
+                cursor = self._conn.execute(sql, bounds)
+            
+            return [key for key, in cursor]
     
     def clear(self, prefix: str = '') -> int:
         """
@@ -216,20 +358,34 @@ class Storage:
         Returns:
             Number of keys deleted
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        if prefix:
-            cursor.execute('DELETE FROM storage WHERE key LIKE ?', (f'{prefix}%',))
-        else:
-            cursor.execute('DELETE FROM storage')
-        
-        deleted = cursor.rowcount
-        
-        conn.commit()
-        conn.close()
+        with self._lock:
+            if not prefix:
+                cursor = self._conn.execute(_SQL_CLEAR)
+                self._rows.clear()
+            else:
+                bounds = self._prefix_range(prefix)
+                sql = _SQL_CLEAR_RANGE if len(bounds) == 2 else _SQL_CLEAR_FROM
+                cursor = self._conn.execute(sql, bounds)
+                for key in [key for key in self._rows if key.startswith(prefix)]:
+                    del self._rows[key]
+            
+            return cursor.rowcount
+    
+    @staticmethod
+    def _prefix_range(prefix: str) -> tuple:
+        """
+        Key range holding exactly the keys that start with prefix.
         
-        return deleted
+        Returns:
+            (low, high) for low <= key < high, or just (low,) when no upper
+            bound is needed (prefix is all U+10FFFF, so nothing sorts after it)
+        """
+        # Smallest string above every key starting with prefix: bump the
+        # last character that isn't already the highest code point
+        stem = prefix.rstrip('\U0010ffff')
+        if not stem:
+            return (prefix,)
+        return prefix, stem[:-1] + chr(ord(stem[-1]) + 1)
 
 
 # Global storage instance (singleton)
@@ -255,6 +411,16 @@ def get(key: str, default: Any = None) -> Any:
     return get_storage().get(key, default)
 
 
+def set_many(items: dict) -> None:
+    """Store several values in global storage in one transaction."""
+    get_storage().set_many(items)
+
+
+def get_many(keys: list, default: Any = None) -> dict:
+    """Retrieve several values from global storage."""
+    return get_storage().get_many(keys, default)
+
+
 def delete(key: str) -> bool:
     """Delete a key from global storage."""
     return get_storage().delete(key)
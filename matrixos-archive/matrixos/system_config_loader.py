@@ -14,20 +14,71 @@ Configuration strategy:
 import os
 import json
 import shutil
+import time
+from functools import lru_cache
 from pathlib import Path
 
+from matrixos.json_utils import load_json
+
 
 _config_cache = None
 
+# (mtime_ns, size) of the runtime config when _config_cache was loaded or
+# saved, and when it was last compared against the file
+_config_stamp = None
+_config_checked = 0.0
+
+# Seconds between checks for edits made to the runtime config on disk
+CONFIG_CHECK_INTERVAL = 1.0
+
+# Resolved get_setting() paths for the config dict in _settings_source
+# (_NOT_FOUND marks paths that resolve to nothing)
+_settings = {}
+_settings_source = None
+_NOT_FOUND = object()
+
+
+def _file_stamp(path):
+    """(mtime_ns, size) of a file, or None if it can't be stat'ed."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def invalidate_cache():
+    """Forget the cached config so the next read loads it from disk."""
+    global _config_cache, _config_stamp
+    _config_cache = None
+    _config_stamp = None
+    _forget_settings()
+
+
+def _forget_settings():
+    """Drop resolved get_setting() paths (the config changed or was replaced)."""
+    global _settings_source
+    _settings.clear()
+    _settings_source = None
+
+
+# Fixed locations, worked out once at import
+_PROJECT_ROOT = Path(__file__).parent.parent
+_TEMPLATE_CONFIG_PATH = _PROJECT_ROOT / "matrixos" / "system_config.json"
+_LOCAL_RUNTIME_CONFIG = _PROJECT_ROOT / "settings" / "config" / "system_config.json"
+
+# Runtime config location, chosen on first use (see get_runtime_config_path)
+_runtime_config_path = None
+
 
 def get_project_root():
     """Get project root directory."""
-    return Path(__file__).parent.parent
+    return _PROJECT_ROOT
 
 
 def get_template_config_path():
     """Get path to template system config in repo."""
-    return get_project_root() / "matrixos" / "system_config.json"
+    return _TEMPLATE_CONFIG_PATH
 
 
 def get_runtime_config_path():
@@ -36,14 +87,21 @@ def get_runtime_config_path():
     Tries in order:
     1. PROJECT_ROOT/settings/config/system_config.json (local to project)
     2. ~/settings/config/system_config.json (user's home directory)
+    
+    The choice is made on the first call and kept for the process.
     """
-    # Try local settings first
-    local_settings = get_project_root() / "settings" / "config" / "system_config.json"
-    if local_settings.parent.exists() or not Path.home().exists():
-        return local_settings
+    global _runtime_config_path
+    
+    if _runtime_config_path is None:
+        # Try local settings first
+        home = Path.home()
+        if _LOCAL_RUNTIME_CONFIG.parent.exists() or not home.exists():
+            _runtime_config_path = _LOCAL_RUNTIME_CONFIG
+        else:
+            # Fall back to home directory
+            _runtime_config_path = home / "settings" / "config" / "system_config.json"
     
-    # Fall back to home directory
-    return Path.home() / "settings" / "config" / "system_config.json"
+    return _runtime_config_path
 
 
 def deep_merge(template, user):
@@ -56,17 +114,22 @@ def deep_merge(template, user):
         user: User's configuration dict
         
     Returns:
-        Merged configuration dict
+        Merged configuration dict (template itself if user is empty, and
+        nested dicts may be shared with either input)
     """
-    result = template.copy()
+    if not user:
+        return template
+    
+    # User values win; only keys where both sides hold a dict need a
+    # second look
+    result = {**template, **user}
     
     for key, value in user.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            # Recursively merge nested dicts
-            result[key] = deep_merge(result[key], value)
-        else:
-            # User value wins
-            result[key] = value
+        if isinstance(value, dict):
+            current = template.get(key)
+            if isinstance(current, dict) and current is not value:
+                # Recursively merge nested dicts
+                result[key] = deep_merge(current, value)
     
     return result
 
@@ -81,21 +144,30 @@ def load_system_config():
     4. If yes: merge template with runtime (picks up new settings from updates)
     5. Save merged config back to runtime location
     
+    The result is cached; the runtime file is re-read only if it has
+    changed on disk (checked at most every CONFIG_CHECK_INTERVAL seconds).
+    
     Returns:
         dict: System configuration
     """
-    global _config_cache
+    global _config_cache, _config_stamp, _config_checked
     
     if _config_cache is not None:
-        return _config_cache
+        now = time.monotonic()
+        if now - _config_checked < CONFIG_CHECK_INTERVAL:
+            return _config_cache
+        _config_checked = now
+        if _file_stamp(get_runtime_config_path()) == _config_stamp:
+            return _config_cache
     
     template_path = get_template_config_path()
     runtime_path = get_runtime_config_path()
+    _config_checked = time.monotonic()
+    _forget_settings()
     
     # Load template
     try:
-        with open(template_path, 'r') as f:
-            template_config = json.load(f)
+        template_config = load_json(template_path)
     except Exception as e:
         print(f"Warning: Could not load template config: {e}")
         template_config = _get_default_config()
@@ -110,12 +182,12 @@ def load_system_config():
             print(f"Warning: Could not create runtime config: {e}")
         
         _config_cache = template_config
+        _config_stamp = _file_stamp(runtime_path)
         return template_config
     
     # Load existing runtime config
     try:
-        with open(runtime_path, 'r') as f:
-            runtime_config = json.load(f)
+        runtime_config = load_json(runtime_path)
     except Exception as e:
         print(f"Warning: Could not load runtime config: {e}")
         runtime_config = {}
@@ -123,14 +195,17 @@ def load_system_config():
     # Merge template with runtime (user values win, new keys added)
     merged_config = deep_merge(template_config, runtime_config)
     
-    # Save merged config back (picks up new settings from updates)
-    try:
-        with open(runtime_path, 'w') as f:
-            json.dump(merged_config, f, indent=2)
-    except Exception as e:
-        print(f"Warning: Could not save merged config: {e}")
+    # Save merged config back (picks up new settings from updates), unless
+    # the template added nothing
+    if merged_config != runtime_config:
+        try:
+            with open(runtime_path, 'w') as f:
+                json.dump(merged_config, f, indent=2)
+        except Exception as e:
+            print(f"Warning: Could not save merged config: {e}")
     
     _config_cache = merged_config
+    _config_stamp = _file_stamp(runtime_path)
     return merged_config
 
 
@@ -160,7 +235,7 @@ def save_system_config(config):
     Args:
         config: Configuration dict to save
     """
-    global _config_cache
+    global _config_cache, _config_stamp
     
     runtime_path = get_runtime_config_path()
     runtime_path.parent.mkdir(parents=True, exist_ok=True)
@@ -170,6 +245,10 @@ def save_system_config(config):
             json.dump(config, f, indent=2)
         
         _config_cache = config
+        _config_stamp = _file_stamp(runtime_path)
+        # The dict may have been edited in place, so the same object can
+        # now hold different values
+        _forget_settings()
         return True
     except Exception as e:
         print(f"Error saving system config: {e}")
@@ -186,18 +265,27 @@ def get_setting(path, default=None):
     Returns:
         Setting value or default
     """
-    config = load_system_config()
-    
-    parts = path.split('.')
-    value = config
+    global _settings_source
     
-    for part in parts:
-        if isinstance(value, dict) and part in value:
-            value = value[part]
-        else:
-            return default
+    config = load_system_config()
+    if config is not _settings_source:
+        # Config was (re)loaded or changed - resolve paths afresh
+        _settings.clear()
+        _settings_source = config
     
-    return value
+    try:
+        value = _settings[path]
+    except KeyError:
+        value = config
+        for part in path.split('.'):
+            if isinstance(value, dict) and part in value:
+                value = value[part]
+            else:
+                value = _NOT_FOUND
+                break
+        _settings[path] = value
+    
+    return default if value is _NOT_FOUND else value
 
 
 def set_setting(path, value):
@@ -223,6 +311,7 @@ def set_setting(path, value):
     
     # Set value
     current[parts[-1]] = value
+    _forget_settings()
     
     return save_system_config(config)
 
@@ -240,12 +329,17 @@ def set_emoji_download_enabled(enabled):
 
 def get_emoji_cache_dir():
     """Get emoji cache directory path."""
-    cache_dir = get_setting('system.emoji_cache_dir', 'settings/cache')
+    return _resolve_cache_dir(get_setting('system.emoji_cache_dir', 'settings/cache'))
+
+
+@lru_cache(maxsize=8)
+def _resolve_cache_dir(cache_dir):
+    """Absolute Path for a configured cache directory."""
     cache_path = Path(cache_dir)
     
     # If relative path, make it relative to project root
     if not cache_path.is_absolute():
-        cache_path = get_project_root() / cache_path
+        cache_path = _PROJECT_ROOT / cache_path
     
     return cache_path
 
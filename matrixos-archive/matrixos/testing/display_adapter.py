@@ -61,6 +61,18 @@ class HeadlessDisplay:
             for x in range(self.width):
                 self.buffer[y][x] = color
     
+    def blit_rgb(self, x: int, y: int, width: int, height: int,
+                 rgb: bytes, alpha: Optional[bytes] = None):
+        """Copy a block of packed RGB pixels (alpha byte 0 = skip)."""
+        self._log_call('blit_rgb', x=x, y=y, width=width, height=height)
+        i = 0
+        for dy in range(height):
+            for dx in range(width):
+                if alpha is None or alpha[i]:
+                    j = i * 3
+                    self.set_pixel(x + dx, y + dy, (rgb[j], rgb[j + 1], rgb[j + 2]))
+                i += 1
+    
     def line(self, x1: int, y1: int, x2: int, y2: int, color: Tuple[int, int, int]):
         """Draw a line."""
         self._log_call('line', x1=x1, y1=y1, x2=x2, y2=y2, color=color)
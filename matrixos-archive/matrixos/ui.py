@@ -23,6 +23,13 @@ from matrixos.input import InputEvent
 from matrixos import layout
 
 
+def _truncate(text: str, max_chars: int) -> str:
+    """text, or its start plus "..." if it is longer than max_chars."""
+    if len(text) <= max_chars:
+        return text
+    return text[:max_chars - 3] + "..."
+
+
 class Widget:
     """Base class for all UI widgets."""
     
@@ -192,10 +199,7 @@ class TextInput(Widget):
         
         if self.value:
             # Show value (truncate if too long)
-            display_text = self.value
-            max_chars = (self.width - 10) // 6
-            if len(display_text) > max_chars:
-                display_text = display_text[:max_chars - 3] + "..."
+            display_text = _truncate(self.value, (self.width - 10) // 6)
             
             matrix.text(display_text, text_x, text_y, (255, 255, 255))
             
@@ -269,6 +273,7 @@ class ListWidget(Widget):
             self.scroll_offset = self.selected_index - visible_count + 1
         
         # Render visible items
+        max_chars = (self.width - 8) // 6
         y = self.y + 2
         for i in range(self.scroll_offset, min(len(self.items), self.scroll_offset + visible_count)):
             item = self.items[i]
@@ -283,10 +288,7 @@ class ListWidget(Widget):
                 text_color = (200, 200, 200)
             
             # Truncate if needed
-            max_chars = (self.width - 8) // 6
-            display_text = item if len(item) <= max_chars else item[:max_chars - 3] + "..."
-            
-            matrix.text(display_text, self.x + 4, y, text_color)
+            matrix.text(_truncate(item, max_chars), self.x + 4, y, text_color)
             y += item_height
     
     def handle_input(self, event: InputEvent) -> bool:
@@ -331,6 +333,11 @@ class Dialog(Widget):
         self.buttons = buttons or ["OK"]
         self.on_button = on_button
         self.selected_button = 0
+        
+        # Box, wrapped message and button positions, rebuilt when the
+        # text, buttons or screen size change
+        self._layout_key = None
+        self._layout = None
     
     def render(self, matrix):
         """Render dialog (centered on screen)."""
@@ -339,21 +346,11 @@ class Dialog(Widget):
         
         width = matrix.width
         height = matrix.height
-        
-        # Dialog size
-        dialog_width = min(width - 16, 100)
-        dialog_height = min(height - 16, 60)
-        dialog_x = (width - dialog_width) // 2
-        dialog_y = (height - dialog_height) // 2
+        (dialog_x, dialog_y, dialog_width, dialog_height, title_x,
+         message_lines, button_y, button_width, button_xs) = self._dialog_layout(width, height)
         
         # Semi-transparent background (darken rest of screen)
-        for y in range(height):
-            for x in range(width):
-                if x < dialog_x or x >= dialog_x + dialog_width or \
-                   y < dialog_y or y >= dialog_y + dialog_height:
-                    # Darken pixels outside dialog
-                    r, g, b = matrix.get_pixel(x, y)
-                    matrix.set_pixel(x, y, (r // 2, g // 2, b // 2))
+        self._darken_outside(matrix, dialog_x, dialog_y, dialog_width, dialog_height)
         
         # Dialog background
         matrix.rect(dialog_x, dialog_y, dialog_width, dialog_height, 
@@ -363,44 +360,110 @@ class Dialog(Widget):
         
         # Title bar
         matrix.rect(dialog_x, dialog_y, dialog_width, 10, (70, 100, 180), fill=True)
-        title_x = dialog_x + (dialog_width - len(self.title) * 6) // 2
         matrix.text(self.title, title_x, dialog_y + 2, (255, 255, 255))
         
-        # Message (word wrap)
+        # Message (word wrapped)
         msg_x = dialog_x + 4
         msg_y = dialog_y + 14
+        for line in message_lines:
+            matrix.text(line, msg_x, msg_y, (220, 220, 220))
+            msg_y += 10
+        
+        # Buttons
+        for i, (btn_text, button_x, text_x) in enumerate(button_xs):
+            is_selected = (i == self.selected_button)
+            
+            # Button background
+            bg_color = (100, 150, 255) if is_selected else (70, 70, 90)
+            matrix.rect(button_x, button_y, button_width, 10, bg_color, fill=True)
+            
+            # Button text
+            text_color = (255, 255, 255) if is_selected else (200, 200, 200)
+            matrix.text(btn_text, text_x, button_y + 2, text_color)
+    
+    @staticmethod
+    def _darken_outside(matrix, x: int, y: int, width: int, height: int):
+        """Halve the brightness of every pixel outside the given rect."""
+        screen_width = matrix.width
+        screen_height = matrix.height
+        left = min(max(x, 0), screen_width)
+        right = min(max(x + width, left), screen_width)
+        
+        # Whole rows above and below the rect, and the parts either side
+        # of it on the rows it covers
+        rects = (
+            (0, 0, screen_width, y),
+            (0, y + height, screen_width, screen_height - (y + height)),
+            (0, y, left, height),
+            (right, y, screen_width - right, height),
+        )
+        
+        darken_rect = getattr(matrix, 'darken_rect', None)
+        if darken_rect is not None:
+            for rect in rects:
+                darken_rect(*rect)
+            return
+        
+        # Fallback for matrices without darken_rect: one pixel at a time
+        for rx, ry, rw, rh in rects:
+            for row in range(max(ry, 0), min(ry + rh, screen_height)):
+                for col in range(rx, rx + rw):
+                    r, g, b = matrix.get_pixel(col, row)
+                    matrix.set_pixel(col, row, (r // 2, g // 2, b // 2))
+    
+    def _dialog_layout(self, width: int, height: int) -> tuple:
+        """
+        Dialog geometry for the current text, buttons and screen size.
+        
+        Built once and reused until one of those changes.
+        
+        Returns:
+            (dialog_x, dialog_y, dialog_width, dialog_height, title_x,
+            message_lines, button_y, button_width, buttons), where buttons
+            holds (label, button_x, text_x) per button
+        """
+        layout_key = (self.title, self.message, tuple(self.buttons), width, height)
+        if layout_key == self._layout_key:
+            return self._layout
+        
+        # Dialog size
+        dialog_width = min(width - 16, 100)
+        dialog_height = min(height - 16, 60)
+        dialog_x = (width - dialog_width) // 2
+        dialog_y = (height - dialog_height) // 2
+        
+        title_x = dialog_x + (dialog_width - len(self.title) * 6) // 2
+        
+        # Message (word wrap)
         max_chars = (dialog_width - 8) // 6
+        message_lines = []
         
         words = self.message.split()
         line = ""
         for word in words:
             if len(line + word) > max_chars:
-                matrix.text(line, msg_x, msg_y, (220, 220, 220))
-                msg_y += 10
+                message_lines.append(line)
                 line = word + " "
             else:
                 line += word + " "
         if line:
-            matrix.text(line.strip(), msg_x, msg_y, (220, 220, 220))
+            message_lines.append(line.strip())
         
         # Buttons
         button_y = dialog_y + dialog_height - 14
         button_width = (dialog_width - 8 - (len(self.buttons) - 1) * 4) // len(self.buttons)
         button_x = dialog_x + 4
         
-        for i, btn_text in enumerate(self.buttons):
-            is_selected = (i == self.selected_button)
-            
-            # Button background
-            bg_color = (100, 150, 255) if is_selected else (70, 70, 90)
-            matrix.rect(button_x, button_y, button_width, 10, bg_color, fill=True)
-            
-            # Button text
-            text_color = (255, 255, 255) if is_selected else (200, 200, 200)
+        buttons = []
+        for btn_text in self.buttons:
             text_x = button_x + (button_width - len(btn_text) * 6) // 2
-            matrix.text(btn_text, text_x, button_y + 2, text_color)
-            
+            buttons.append((btn_text, button_x, text_x))
             button_x += button_width + 4
+        
+        self._layout_key = layout_key
+        self._layout = (dialog_x, dialog_y, dialog_width, dialog_height, title_x,
+                        message_lines, button_y, button_width, buttons)
+        return self._layout
     
     def handle_input(self, event: InputEvent) -> bool:
         """Handle input."""
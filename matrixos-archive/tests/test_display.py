@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the MatrixOS Display framebuffer
+
+Tests pixel access, clearing, span fills and block copies (blit_rgb).
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from matrixos.display import Display
+from matrixos.led_api import LEDMatrix
+from matrixos.devices.base import DisplayDriver
+
+
+class DictDriver(DisplayDriver):
+    """Minimal driver that only implements the abstract methods."""
+    
+    def __init__(self, width, height):
+        super().__init__(width, height)
+        self.pixels = {}
+    
+    def initialize(self):
+        return True
+    
+    def set_pixel(self, x, y, color):
+        self.pixels[(x, y)] = color
+    
+    def get_pixel(self, x, y):
+        return self.pixels.get((x, y), (0, 0, 0))
+    
+    def clear(self):
+        self.pixels.clear()
+    
+    def show(self):
+        pass
+    
+    def cleanup(self):
+        pass
+
+
+# ============================================================================
+# Basic Pixel Tests
+# ============================================================================
+
+def test_set_get_pixel():
+    """Test setting and reading back RGB pixels."""
+    print("TEST: Set/Get Pixel")
+    
+    display = Display(8, 8, 'rgb')
+    display.set_pixel(3, 4, (10, 20, 30))
+    
+    assert display.get_pixel(3, 4) == (10, 20, 30), "Pixel should round-trip"
+    assert display.get_pixel(4, 3) == (0, 0, 0), "Other pixels stay black"
+    assert display.get_pixel(-1, 0) == (0, 0, 0), "Off-screen reads are black"
+    
+    # Off-screen writes are ignored
+    display.set_pixel(8, 0, (255, 0, 0))
+    display.set_pixel(0, -1, (255, 0, 0))
+    
+    print("✓ Pixels round-trip and clip correctly")
+
+
+def test_clear_and_fill():
+    """Test clearing and filling the display."""
+    print("\nTEST: Clear and Fill")
+    
+    display = Display(4, 4, 'rgb')
+    display.fill((1, 2, 3))
+    assert all(display.get_pixel(x, y) == (1, 2, 3) for y in range(4) for x in range(4)), \
+        "Fill should set every pixel"
+    
+    display.clear()
+    assert all(display.get_pixel(x, y) == (0, 0, 0) for y in range(4) for x in range(4)), \
+        "Clear should reset every pixel to black"
+    
+    print("✓ Clear and fill cover the whole display")
+
+
+# ============================================================================
+# Blit Tests
+# ============================================================================
+
+def test_blit_rgb():
+    """Test copying a packed RGB block."""
+    print("\nTEST: Blit RGB")
+    
+    display = Display(8, 8, 'rgb')
+    rgb = bytes([
+        255, 0, 0,    0, 255, 0,
+        0, 0, 255,    9, 9, 9,
+    ])
+    display.blit_rgb(2, 3, 2, 2, rgb)
+    
+    assert display.get_pixel(2, 3) == (255, 0, 0), "Top-left pixel"
+    assert display.get_pixel(3, 3) == (0, 255, 0), "Top-right pixel"
+    assert display.get_pixel(2, 4) == (0, 0, 255), "Bottom-left pixel"
+    assert display.get_pixel(3, 4) == (9, 9, 9), "Bottom-right pixel"
+    assert display.get_pixel(4, 3) == (0, 0, 0), "Outside block untouched"
+    
+    print("✓ Blit copies a block row by row")
+
+
+def test_blit_rgb_alpha():
+    """Test that zero alpha bytes leave pixels untouched."""
+    print("\nTEST: Blit RGB With Alpha Mask")
+    
+    display = Display(4, 4, 'rgb')
+    display.fill((7, 7, 7))
+    rgb = bytes([100, 100, 100]) * 4
+    alpha = bytes([1, 0, 0, 1])
+    display.blit_rgb(0, 0, 2, 2, rgb, alpha)
+    
+    assert display.get_pixel(0, 0) == (100, 100, 100), "Opaque pixel drawn"
+    assert display.get_pixel(1, 0) == (7, 7, 7), "Transparent pixel skipped"
+    assert display.get_pixel(0, 1) == (7, 7, 7), "Transparent pixel skipped"
+    assert display.get_pixel(1, 1) == (100, 100, 100), "Opaque pixel drawn"
+    
+    print("✓ Alpha mask skips transparent pixels")
+
+
+def test_blit_rgb_clipping():
+    """Test blits that hang off every edge of the display."""
+    print("\nTEST: Blit RGB Clipping")
+    
+    display = Display(4, 4, 'rgb')
+    rgb = bytes(range(3 * 3 * 3))  # 3x3 block, distinct bytes
+    
+    # Off the top-left corner: only the bottom-right source pixel lands
+    display.blit_rgb(-2, -2, 3, 3, rgb)
+    assert display.get_pixel(0, 0) == (24, 25, 26), "Clipped top-left blit"
+    assert display.get_pixel(1, 0) == (0, 0, 0), "Nothing beyond the block"
+    
+    # Off the bottom-right corner: only the top-left source pixel lands
+    display.clear()
+    display.blit_rgb(3, 3, 3, 3, rgb)
+    assert display.get_pixel(3, 3) == (0, 1, 2), "Clipped bottom-right blit"
+    
+    # Entirely off-screen: no-op
+    display.clear()
+    display.blit_rgb(10, 0, 3, 3, rgb)
+    display.blit_rgb(0, -5, 3, 3, rgb)
+    assert all(display.get_pixel(x, y) == (0, 0, 0) for y in range(4) for x in range(4)), \
+        "Off-screen blits should not draw"
+    
+    print("✓ Blits clip to the display bounds")
+
+
+def test_led_matrix_blit_rgb():
+    """Test that LEDMatrix forwards blit_rgb to its display."""
+    print("\nTEST: LEDMatrix Blit RGB")
+    
+    matrix = LEDMatrix(8, 8, 'rgb')
+    matrix.blit_rgb(1, 1, 1, 1, bytes([1, 2, 3]))
+    
+    assert matrix.get_pixel(1, 1) == (1, 2, 3), "LEDMatrix blit should reach the buffer"
+    
+    print("✓ LEDMatrix blit_rgb works")
+
+
+def test_fill_rect():
+    """Test span fills, including clipping and filled LEDMatrix rects."""
+    print("\nTEST: Fill Rect")
+    
+    display = Display(4, 4, 'rgb')
+    display.fill_rect(-1, 1, 3, 5, (9, 9, 9))
+    
+    assert display.get_pixel(0, 1) == (9, 9, 9), "Clipped fill should land on-screen"
+    assert display.get_pixel(1, 3) == (9, 9, 9), "Fill should reach the bottom edge"
+    assert display.get_pixel(2, 1) == (0, 0, 0), "Nothing right of the rect"
+    assert display.get_pixel(0, 0) == (0, 0, 0), "Nothing above the rect"
+    
+    matrix = LEDMatrix(8, 8, 'rgb')
+    matrix.rect(2, 2, 3, 2, (1, 2, 3), fill=True)
+    filled = [(x, y) for y in range(8) for x in range(8) if matrix.get_pixel(x, y) != (0, 0, 0)]
+    assert filled == [(x, y) for y in (2, 3) for x in (2, 3, 4)], "Filled rect covers exactly its area"
+    
+    print("✓ fill_rect fills whole spans")
+
+
+def test_darken_rect():
+    """Test halving brightness in a clipped rect, in the buffer and on drivers."""
+    print("\nTEST: Darken Rect")
+    
+    matrix = LEDMatrix(4, 4, 'rgb')
+    driver = DictDriver(4, 4)
+    for target in (matrix, driver):
+        for y in range(4):
+            for x in range(4):
+                target.set_pixel(x, y, (200, 101, 7))
+        target.darken_rect(-1, 2, 3, 5)
+        
+        darkened = [(x, y) for y in range(4) for x in range(4)
+                    if target.get_pixel(x, y) == (100, 50, 3)]
+        assert darkened == [(x, y) for y in (2, 3) for x in (0, 1)], \
+            "Only the on-screen part of the rect is darkened"
+        assert target.get_pixel(2, 2) == (200, 101, 7), "Pixels outside keep their color"
+    
+    print("✓ darken_rect halves exactly its area")
+
+
+def test_driver_fill():
+    """Test the DisplayDriver default fill with unusual colors."""
+    print("\nTEST: Driver Fill")
+    
+    driver = DictDriver(3, 2)
+    driver.fill((1, 2, 3))
+    assert all(driver.get_pixel(x, y) == (1, 2, 3) for y in range(2) for x in range(3)), \
+        "Fill should set every pixel"
+    
+    driver.fill((0, 0, 0))
+    assert driver.pixels == {}, "Black fill should clear"
+    
+    driver.fill((1.5, 2, 300))
+    assert driver.get_pixel(2, 1) == (1.5, 2, 300), "Non-byte channels go through set_pixel()"
+    
+    for color in (True, 7):
+        driver.fill(color)
+        assert driver.get_pixel(0, 0) == color, "Non-sequence colors go through set_pixel()"
+    
+    print("✓ Driver fill accepts any color set_pixel() does")
+
+
+# ============================================================================
+# Test Runner
+# ============================================================================
+
+def run_all_tests():
+    """Run all display tests."""
+    print("=" * 70)
+    print("MatrixOS Display Tests")
+    print("=" * 70)
+    
+    tests = [
+        test_set_get_pixel,
+        test_clear_and_fill,
+        test_blit_rgb,
+        test_blit_rgb_alpha,
+        test_blit_rgb_clipping,
+        test_led_matrix_blit_rgb,
+        test_fill_rect,
+        test_darken_rect,
+        test_driver_fill,
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            failed += 1
+    
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+    
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the MatrixOS emoji loader
+
+Tests icon conversion for sprite sheet emojis and for emojis that were
+downloaded (kept in memory or in the on-disk cache).
+"""
+
+import sys
+import os
+import tempfile
+from pathlib import Path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PIL import Image
+
+from matrixos.emoji_loader import EmojiLoader
+
+# Not in the sprite sheet, so only ever downloaded
+MISSING_EMOJI = '\U0001fae0'
+
+
+def solid_image(size, color=(200, 100, 50, 255)):
+    """An opaque single-color RGBA image."""
+    return Image.new('RGBA', (size, size), color)
+
+
+# ============================================================================
+# Icon Conversion Tests
+# ============================================================================
+
+def test_sheet_emoji_icon():
+    """Test converting an emoji from the sprite sheet."""
+    print("\nTEST: Sheet Emoji Icon")
+
+    loader = EmojiLoader()
+    emoji = loader.list_available_emojis(limit=1)[0]
+
+    icon = loader.emoji_to_icon_json(emoji, size=16)
+    assert icon is not None and icon['width'] == 16, "Sheet emoji should convert"
+    assert icon['data'], "Icon should have visible pixels"
+
+    print("✓ Sprite sheet emojis convert to icons")
+
+
+def test_downloaded_emoji_icon():
+    """Test converting an emoji that was downloaded this session."""
+    print("\nTEST: Downloaded Emoji Icon")
+
+    loader = EmojiLoader()
+    assert not loader.has_emoji(MISSING_EMOJI), "Test emoji must not be in the sheet"
+    assert loader.emoji_to_icon_json(MISSING_EMOJI) is None, "Unknown emoji has no icon"
+
+    # What download_emoji_on_demand() caches
+    loader._cache_image((MISSING_EMOJI, 32), solid_image(32))
+
+    icon = loader.emoji_to_icon_json(MISSING_EMOJI, size=32)
+    assert icon is not None, "Downloaded emoji should convert"
+    assert len(icon['data']) == 32 * 32, "Every opaque pixel should be kept"
+
+    print("✓ Downloaded emojis convert to icons")
+
+
+def test_disk_cached_emoji_icon():
+    """Test converting an emoji found in the on-disk download cache."""
+    print("\nTEST: Disk Cached Emoji Icon")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        loader = EmojiLoader()
+        loader._cache_file = lambda emoji, size: Path(tmp) / f"{size}.png"
+        solid_image(16).save(Path(tmp) / "16.png", "PNG")
+
+        img = loader.get_emoji_with_fallback(MISSING_EMOJI, size=16, allow_download=False)
+        assert img is not None, "Fallback should find the cached file"
+
+        icon = loader.emoji_to_icon_json(MISSING_EMOJI, size=16)
+        assert icon is not None, "Icon should use the same image as the fallback"
+        assert icon['width'] == 16 and len(icon['data']) == 16 * 16
+
+    print("✓ Disk cached emojis convert to icons")
+
+
+# ============================================================================
+# Test Runner
+# ============================================================================
+
+def run_all_tests():
+    """Run all emoji loader tests."""
+    print("=" * 70)
+    print("MatrixOS Emoji Loader Tests")
+    print("=" * 70)
+
+    tests = [
+        test_sheet_emoji_icon,
+        test_downloaded_emoji_icon,
+        test_disk_cached_emoji_icon,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
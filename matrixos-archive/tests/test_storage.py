@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Unit tests for MatrixOS key-value storage
+
+Tests the SQLite connection lifecycle, batched reads and writes, the row
+cache and prefix range scans.
+"""
+
+import sys
+import os
+import gc
+import sqlite3
+import tempfile
+import weakref
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from matrixos.storage import Storage
+
+
+def temp_db(tmp):
+    """Path for a fresh database inside a temporary directory."""
+    return os.path.join(tmp, 'storage.db')
+
+
+# ============================================================================
+# Connection Tests
+# ============================================================================
+
+def test_close_is_idempotent():
+    """Test that close() can be called twice and the store reopens."""
+    print("\nTEST: Close Is Idempotent")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = Storage(temp_db(tmp))
+        store.set('app.name', 'pizxel')
+
+        store.close()
+        store.close()
+
+        assert store.get('app.name') == 'pizxel', "Store should reopen after close()"
+        store.set('app.count', 3)
+        assert store.get('app.count') == 3, "Writes should work after reopening"
+        store.close()
+
+    print("✓ close() is idempotent and the store reopens")
+
+
+def test_store_is_not_kept_alive():
+    """Test that an unreferenced store is collected (no exit hook holds it)."""
+    print("\nTEST: Store Is Not Kept Alive")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = Storage(temp_db(tmp))
+        ref = weakref.ref(store)
+        del store
+        gc.collect()
+
+        assert ref() is None, "Storage should be garbage collected"
+
+    print("✓ Unreferenced stores are released")
+
+
+# ============================================================================
+# Batch Tests
+# ============================================================================
+
+def test_set_many_get_many_round_trip():
+    """Test that every supported type round-trips through the batch API."""
+    print("\nTEST: set_many/get_many Round Trip")
+
+    items = {
+        'app.name': 'pizxel',
+        'app.count': 42,
+        'app.ratio': 0.5,
+        'app.enabled': False,
+        'app.presets': [60, 300, 900],
+        'app.layout': {'rows': 4, 'keys': ['a', 'b']},
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = Storage(temp_db(tmp))
+        store.set_many(items)
+
+        assert store.get_many(list(items)) == items, "Batch read should match batch write"
+
+        # A fresh store reads from the database, not the row cache
+        store.close()
+        assert Storage(temp_db(tmp)).get_many(list(items)) == items, \
+            "Values should persist to the database"
+
+    print("✓ Batch writes round-trip")
+
+
+def test_get_many_defaults():
+    """Test that missing keys get the default and every key is returned."""
+    print("\nTEST: get_many Defaults")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = Storage(temp_db(tmp))
+        store.set('app.name', 'pizxel')
+
+        result = store.get_many(['app.name', 'app.missing', 'other'], default='?')
+        assert result == {'app.name': 'pizxel', 'app.missing': '?', 'other': '?'}, \
+            "Missing keys should map to the default"
+
+        # Large batches are split into several queries
+        keys = [f'k{i}' for i in range(1200)]
+        store.set_many({key: i for i, key in enumerate(keys)})
+        result = store.get_many(keys + ['nope'])
+        assert len(result) == 1201 and result['k1199'] == 1199 and result['nope'] is None, \
+            "Chunked lookups should return every key"
+        store.close()
+
+    print("✓ get_many fills in defaults")
+
+
+def test_set_many_rollback():
+    """Test that a failed batch write stores nothing."""
+    print("\nTEST: set_many Rollback")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = Storage(temp_db(tmp))
+
+        # A value JSON can't represent
+        try:
+            store.set_many({'app.ok': 1, 'app.bad': object()})
+            assert False, "Unserializable value should raise"
+        except TypeError:
+            pass
+        assert not store.exists('app.ok'), "Nothing should be written"
+
+        # A key SQLite can't bind fails part way through the batch
+        try:
+            store.set_many({'app.ok': 1, ('not', 'a', 'key'): 2})
+            assert False, "Unbindable key should raise"
+        except sqlite3.Error:
+            pass
+        assert not store.exists('app.ok'), "Earlier rows should be rolled back"
+
+        store.close()
+        assert not Storage(temp_db(tmp)).exists('app.ok'), "Rollback should reach the database"
+
+    print("✓ Failed batches are rolled back")
+
+
+# ============================================================================
+# Row Cache Tests
+# ============================================================================
+
+def test_row_cache_bounded():
+    """Test that the row cache keeps at most CACHE_SIZE recently used keys."""
+    print("\nTEST: Row Cache Bounded")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = Storage(temp_db(tmp))
+        for i in range(Storage.CACHE_SIZE + 50):
+            store.set(f'k{i}', i)
+        store.get('k0')  # Reloaded, now most recently used
+
+        assert len(store._rows) == Storage.CACHE_SIZE, "Cache should stay bounded"
+        assert 'k0' in store._rows and 'k1' not in store._rows, \
+            "Least recently used keys should be dropped first"
+        assert store.get('k1') == 1, "Evicted keys are read back from the database"
+        store.close()
+
+    print("✓ Row cache is an LRU of CACHE_SIZE keys")
+
+
+def test_row_cache_consistent():
+    """Test that cached reads follow writes, deletes and clears."""
+    print("\nTEST: Row Cache Consistent")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = Storage(temp_db(tmp))
+
+        assert store.get('app.list') is None, "Absent key"
+        store.set('app.list', [1, 2])
+        value = store.get('app.list')
+        value.append(3)
+        assert store.get('app.list') == [1, 2], "Callers can't mutate cached values"
+
+        store.delete('app.list')
+        assert not store.exists('app.list'), "Delete should update the cache"
+
+        store.set_many({'app.a': 1, 'app.b': 2, 'other': 3})
+        store.clear('app.')
+        assert store.get_many(['app.a', 'app.b', 'other']) == {'app.a': None, 'app.b': None, 'other': 3}, \
+            "Prefix clear should drop cached rows"
+        store.close()
+
+    print("✓ Cached reads match the database")
+
+
+def test_row_cache_other_writer():
+    """Test the single-writer limit: another store's writes show after reopening."""
+    print("\nTEST: Row Cache Other Writer")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        reader = Storage(temp_db(tmp))
+        writer = Storage(temp_db(tmp))
+
+        writer.set('app.city', 'Cardiff')
+        assert reader.get('app.city') == 'Cardiff', "Uncached keys come from the database"
+
+        writer.set('app.city', 'London')
+        assert reader.get('app.city') == 'Cardiff', "Cached rows are not refreshed"
+
+        reader.close()
+        assert reader.get('app.city') == 'London', "Reopening drops the cache"
+        reader.close()
+        writer.close()
+
+    print("✓ Other writers are seen after close()")
+
+
+# ============================================================================
+# Prefix Tests
+# ============================================================================
+
+PREFIX_KEYS = [
+    'app', 'app.', 'app.a', 'app.b.c', 'app/', 'app0', 'apq', 'ap',
+    'app%x', 'app_x', 'APP.a', 'café.a', 'café', 'cafe.a',
+    '\U0010ffff', '\U0010ffffa', 'z\U0010ffff', 'z\U0010ffff.a', 'z',
+]
+
+
+def test_prefix_keys():
+    """Test that keys(prefix) is exactly the keys starting with prefix."""
+    print("\nTEST: Prefix Keys")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = Storage(temp_db(tmp))
+        store.set_many({key: 1 for key in PREFIX_KEYS})
+
+        for prefix in ['', 'app', 'app.', 'ap', 'app%', 'app_', 'APP', 'café', 'caf',
+                       '\U0010ffff', 'z\U0010ffff', 'missing']:
+            expected = sorted(key for key in PREFIX_KEYS if key.startswith(prefix))
+            assert store.keys(prefix) == expected, f"keys({prefix!r}) should match startswith"
+        store.close()
+
+    print("✓ Prefix scans match str.startswith")
+
+
+def test_prefix_clear():
+    """Test that clear(prefix) deletes exactly the keys starting with prefix."""
+    print("\nTEST: Prefix Clear")
+
+    for prefix in ['app.', 'app_', '\U0010ffff', 'z\U0010ffff']:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = Storage(temp_db(tmp))
+            store.set_many({key: 1 for key in PREFIX_KEYS})
+
+            doomed = [key for key in PREFIX_KEYS if key.startswith(prefix)]
+            assert store.clear(prefix) == len(doomed), f"clear({prefix!r}) count"
+            assert store.keys() == sorted(set(PREFIX_KEYS) - set(doomed)), \
+                f"clear({prefix!r}) should leave every other key"
+            store.close()
+
+    print("✓ Prefix clears remove only matching keys")
+
+
+# ============================================================================
+# Test Runner
+# ============================================================================
+
+def run_all_tests():
+    """Run all storage tests."""
+    print("=" * 70)
+    print("MatrixOS Storage Tests")
+    print("=" * 70)
+
+    tests = [
+        test_close_is_idempotent,
+        test_store_is_not_kept_alive,
+        test_set_many_get_many_round_trip,
+        test_get_many_defaults,
+        test_set_many_rollback,
+        test_row_cache_bounded,
+        test_row_cache_consistent,
+        test_row_cache_other_writer,
+        test_prefix_keys,
+        test_prefix_clear,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
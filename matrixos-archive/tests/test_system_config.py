@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the MatrixOS system config loader
+
+Tests that get_setting() never serves values from before a save or reload.
+"""
+
+import sys
+import os
+import json
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from matrixos import system_config_loader as config_loader
+
+
+@contextmanager
+def temp_runtime_config():
+    """Point the loader at a throwaway runtime config for one test."""
+    saved_path = config_loader._runtime_config_path
+    with tempfile.TemporaryDirectory() as tmp:
+        config_loader._runtime_config_path = Path(tmp) / "system_config.json"
+        config_loader.invalidate_cache()
+        try:
+            yield config_loader._runtime_config_path
+        finally:
+            config_loader._runtime_config_path = saved_path
+            config_loader.invalidate_cache()
+
+
+# ============================================================================
+# Setting Cache Tests
+# ============================================================================
+
+def test_save_in_place_edit():
+    """Test that saving an edited cached config updates get_setting()."""
+    print("\nTEST: Save In-Place Edit")
+
+    with temp_runtime_config():
+        config_loader.set_setting('system.emoji_download_enabled', True)
+        assert config_loader.get_setting('system.emoji_download_enabled') is True
+
+        config = config_loader.load_system_config()
+        config['system']['emoji_download_enabled'] = False
+        config_loader.save_system_config(config)
+
+        assert config_loader.get_setting('system.emoji_download_enabled') is False, \
+            "Saved value should be returned, not the memoized one"
+
+    print("✓ Saving an edited config refreshes settings")
+
+
+def test_reload_after_file_change():
+    """Test that get_setting() follows edits made to the file on disk."""
+    print("\nTEST: Reload After File Change")
+
+    with temp_runtime_config() as path:
+        config_loader.set_setting('display.default_brightness', 80)
+        assert config_loader.get_setting('display.default_brightness') == 80
+
+        with open(path) as f:
+            config = json.load(f)
+        config['display']['default_brightness'] = 30
+        config['display']['padding'] = 'x' * 10  # Change the size as well as mtime
+        with open(path, 'w') as f:
+            json.dump(config, f)
+
+        config_loader._config_checked = 0.0  # Don't wait for the check interval
+        assert config_loader.get_setting('display.default_brightness') == 30, \
+            "Value edited on disk should be picked up"
+
+    print("✓ Reloaded config refreshes settings")
+
+
+def test_invalidate_cache():
+    """Test that invalidate_cache() also drops resolved settings."""
+    print("\nTEST: Invalidate Cache")
+
+    with temp_runtime_config():
+        config_loader.get_setting('system.emoji_cache_dir')
+        config_loader.invalidate_cache()
+
+        assert config_loader._settings == {}, "Resolved settings should be dropped"
+        assert config_loader._settings_source is None, "Settings source should be reset"
+
+    print("✓ invalidate_cache() clears resolved settings")
+
+
+# ============================================================================
+# Test Runner
+# ============================================================================
+
+def run_all_tests():
+    """Run all system config tests."""
+    print("=" * 70)
+    print("MatrixOS System Config Tests")
+    print("=" * 70)
+
+    tests = [
+        test_save_in_place_edit,
+        test_reload_after_file_change,
+        test_invalidate_cache,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)